@@ -0,0 +1,85 @@
+"""
+Micro-benchmark of project health scoring.
+
+Scores a population of active projects from stored-format fields the way
+``HealthService.rescore`` does, with NumPy arrays when it is installed and
+with the per-project rules otherwise.
+
+Usage:
+    python benchmarks/health_scoring.py [--sizes 10000 50000] [--repeat 5]
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from research_management.services import health_scoring
+from research_management.services.health_scoring import HealthScorer
+
+
+def make_signals(count: int, now: datetime) -> tuple:
+    """Build stored health fields, advised projects and alert counts."""
+    projects = []
+    for i in range(count):
+        created = now - timedelta(days=i % 400)
+        projects.append(
+            {
+                "project_id": f"proj-{i:06d}",
+                "health_status": "on_track",
+                "created_at": created.isoformat(),
+                "last_update_at": (
+                    (created + timedelta(days=i % 50)).isoformat() if i % 9 else None
+                ),
+                "expected_end_date": (
+                    (now + timedelta(days=i % 120 - 20)).isoformat() if i % 5 else None
+                ),
+            }
+        )
+    advised = {p["project_id"] for i, p in enumerate(projects) if i % 11}
+    open_alerts = {p["project_id"]: i % 4 for i, p in enumerate(projects) if i % 3}
+    return projects, advised, open_alerts
+
+
+def best_of(repeat: int, func) -> float:
+    """Run a function several times and return the fastest run in seconds."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 50000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    now = datetime(2025, 6, 1)
+    scorer = HealthScorer(no_update_days=30, deadline_warning_days=7)
+    numpy = health_scoring.np
+
+    print(f"{'projects':>8} {'mode':>10} {'ms':>9} {'us/proj':>8}")
+    for size in args.sizes:
+        signals = make_signals(size, now)
+        runs = {}
+        if numpy is not None:
+            runs["vectorized"] = best_of(
+                args.repeat, lambda: scorer.score(*signals, now)
+            )
+        health_scoring.np = None
+        try:
+            runs["python"] = best_of(args.repeat, lambda: scorer.score(*signals, now))
+        finally:
+            health_scoring.np = numpy
+
+        for name, elapsed in runs.items():
+            print(
+                f"{size:>8} {name:>10} {elapsed * 1000:>9.2f} "
+                f"{elapsed / size * 1e6:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
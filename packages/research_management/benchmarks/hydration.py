@@ -0,0 +1,118 @@
+"""
+Micro-benchmark of the repository hydration modes.
+
+Builds ``ResearchProject`` models from stored-format documents (ISO string
+datetimes, enum values) the way a ``/projects`` page is hydrated. Besides the
+repository modes it times the previous ``Model(**data)`` loop and
+``model_construct`` with the datetime and enum coercion done in Python, with
+the converter of each field resolved once up front.
+
+Usage:
+    python benchmarks/hydration.py [--sizes 1000 10000] [--repeat 5]
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+from enum import Enum
+
+from research_management.models.project import (
+    HealthStatus,
+    ProjectStatus,
+    ResearchProject,
+)
+from research_management.repositories.hydration import HydrationMode, Hydrator
+
+
+def make_documents(count: int) -> list:
+    """Build project documents as they are stored in Firestore."""
+    start = datetime(2025, 1, 1)
+    statuses = list(ProjectStatus)
+    healths = list(HealthStatus)
+    docs = []
+    for i in range(count):
+        created = start + timedelta(minutes=i)
+        docs.append(
+            ResearchProject(
+                project_id=f"proj-{i:06d}",
+                title=f"Project {i}",
+                description="Research project on machine learning applications",
+                area="Machine Learning",
+                status=statuses[i % len(statuses)],
+                health_status=healths[i % len(healths)],
+                start_date=created,
+                expected_end_date=created + timedelta(days=180),
+                created_at=created,
+                updated_at=created,
+                last_update_at=created + timedelta(days=3),
+                update_count=i % 7,
+            ).model_dump(mode="json")
+        )
+    return docs
+
+
+def trusted_converters(model) -> dict:
+    """Map each field that needs coercion to its converter, resolved once."""
+    converters = {}
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        types = (annotation, *getattr(annotation, "__args__", ()))
+        if datetime in types:
+            converters[name] = datetime.fromisoformat
+        elif isinstance(annotation, type) and issubclass(annotation, Enum):
+            converters[name] = annotation
+    return converters
+
+
+def construct_trusted(docs: list, converters: dict) -> list:
+    """Build models without validation, coercing datetimes and enums by hand."""
+    construct = ResearchProject.model_construct
+    projects = []
+    for data in docs:
+        values = dict(data)
+        for name, convert in converters.items():
+            value = values.get(name)
+            if value is not None:
+                values[name] = convert(value)
+        projects.append(construct(**values))
+    return projects
+
+
+def best_of(repeat: int, func) -> float:
+    """Run a function several times and return the fastest run in seconds."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'docs':>8} {'mode':>9} {'ms':>9} {'us/doc':>8} {'speedup':>8}")
+    for size in args.sizes:
+        docs = make_documents(size)
+        baseline = best_of(args.repeat, lambda: [ResearchProject(**d) for d in docs])
+        runs = {"kwargs": baseline}
+        for mode in HydrationMode:
+            hydrator = Hydrator(ResearchProject, mode)
+            runs[mode.value] = best_of(args.repeat, lambda: hydrator.many(docs))
+        converters = trusted_converters(ResearchProject)
+        runs["construct"] = best_of(
+            args.repeat, lambda: construct_trusted(docs, converters)
+        )
+
+        for name, elapsed in runs.items():
+            print(
+                f"{size:>8} {name:>9} {elapsed * 1000:>9.2f} "
+                f"{elapsed / size * 1e6:>8.2f} {baseline / elapsed:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ This script demonstrates how to use the Research Management service
 programmatically without making HTTP requests.
 """
 
+import asyncio
 from datetime import datetime, timedelta
 
 from research_management.models.alert import AlertCreate, AlertSeverity, AlertType
@@ -19,7 +20,7 @@ from research_management.services import (
 )
 
 
-def main():
+async def main():
     """Main example function."""
     print("=" * 60)
     print("Research Management System - Example Usage")
@@ -40,7 +41,7 @@ def main():
         start_date=datetime.utcnow(),
         expected_end_date=datetime.utcnow() + timedelta(days=180),
     )
-    project = project_service.create_project(project_data)
+    project = await project_service.create_project(project_data)
     print(f"   ✓ Created project: {project.project_id} - {project.title}")
     print(f"   Status: {project.status.value}")
     print(f"   Health: {project.health_status.value}")
@@ -50,7 +51,7 @@ def main():
 
     # Add an advisor
     advisor_member = ProjectMemberCreate(user_id="advisor-001", role=MemberRole.ADVISOR)
-    advisor = project_service.add_member(project.project_id, advisor_member)
+    advisor = await project_service.add_member(project.project_id, advisor_member)
     print(f"   ✓ Added advisor: {advisor.user_id}")
 
     # Add students
@@ -58,7 +59,7 @@ def main():
         student_member = ProjectMemberCreate(
             user_id=f"student-00{i}", role=MemberRole.STUDENT
         )
-        student = project_service.add_member(project.project_id, student_member)
+        student = await project_service.add_member(project.project_id, student_member)
         print(f"   ✓ Added student: {student.user_id}")
 
     # 3. Submit project updates
@@ -76,7 +77,7 @@ def main():
         milestone_completed="Literature Review",
         files_attached=["https://example.com/lit-review.pdf"],
     )
-    update = update_service.submit_update(
+    update = await update_service.submit_update(
         project.project_id, "student-001", update_data
     )
     print(f"   ✓ Submitted update: {update.update_id}")
@@ -84,15 +85,17 @@ def main():
 
     # 4. Get project timeline
     print("\n4. Retrieving project timeline...")
-    timeline = update_service.get_project_updates(project.project_id, limit=10)
-    print(f"   ✓ Found {len(timeline)} updates")
-    for upd in timeline:
+    timeline = await update_service.get_project_updates(project.project_id, limit=10)
+    print(f"   ✓ Found {len(timeline.items)} updates")
+    for upd in timeline.items:
         print(f"     - {upd.timestamp.strftime('%Y-%m-%d')}: {upd.milestone_completed}")
 
     # 5. Update project health status
     print("\n5. Updating project health status...")
     update_data = ProjectUpdate(health_status="on_track")
-    updated_project = project_service.update_project(project.project_id, update_data)
+    updated_project = await project_service.update_project(
+        project.project_id, update_data
+    )
     print(f"   ✓ Updated health status to: {updated_project.health_status.value}")
 
     # 6. Create an alert (simulating automated monitoring)
@@ -103,14 +106,14 @@ def main():
         message=f"🟢 INFO: Deadline for project '{project.title}' is in 7 days",
         severity=AlertSeverity.INFO,
     )
-    alert = alert_service.create_alert(alert_data)
+    alert = await alert_service.create_alert(alert_data)
     print(f"   ✓ Created alert: {alert.alert_id}")
     print(f"   Type: {alert.type.value}")
     print(f"   Severity: {alert.severity.value}")
 
     # 7. Get coordinator dashboard
     print("\n7. Retrieving coordinator dashboard...")
-    dashboard = dashboard_service.get_coordinator_dashboard()
+    dashboard = await dashboard_service.get_coordinator_dashboard()
     print(f"   ✓ Dashboard metrics:")
     print(f"     - Total projects: {dashboard['total_projects']}")
     print(f"     - Active projects: {dashboard['active_projects']}")
@@ -121,7 +124,7 @@ def main():
 
     # 8. Get advisor dashboard
     print("\n8. Retrieving advisor dashboard...")
-    advisor_dashboard = dashboard_service.get_advisor_dashboard("advisor-001")
+    advisor_dashboard = await dashboard_service.get_advisor_dashboard("advisor-001")
     print(f"   ✓ Advisor dashboard:")
     print(f"     - Total projects: {advisor_dashboard['total_projects']}")
     print(f"     - Active projects: {advisor_dashboard['active_projects']}")
@@ -129,7 +132,7 @@ def main():
 
     # 9. Get student dashboard
     print("\n9. Retrieving student dashboard...")
-    student_dashboard = dashboard_service.get_student_dashboard("student-001")
+    student_dashboard = await dashboard_service.get_student_dashboard("student-001")
     print(f"   ✓ Student dashboard:")
     if student_dashboard["has_project"]:
         print(f"     - Project: {student_dashboard['project_title']}")
@@ -141,9 +144,9 @@ def main():
 
     # 10. List all active alerts
     print("\n10. Listing active alerts...")
-    active_alerts = alert_service.get_active_alerts()
-    print(f"   ✓ Found {len(active_alerts)} active alerts")
-    for a in active_alerts:
+    active_alerts = await alert_service.get_active_alerts()
+    print(f"   ✓ Found {len(active_alerts.items)} active alerts")
+    for a in active_alerts.items:
         emoji = (
             "🟢"
             if a.severity.value == "info"
@@ -165,7 +168,7 @@ if __name__ == "__main__":
     )
 
     try:
-        main()
+        asyncio.run(main())
     except Exception as e:
         print(f"\n❌ Error: {e}")
         print("\nMake sure:")
@@ -4,60 +4,96 @@ API routes for alerts.
 
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
 from ..models.alert import Alert, AlertCreate, AlertSeverity, AlertType
 from ..services import AlertService
+from .dependencies import get_alert_service
+from .pagination import CURSOR_DESCRIPTION, paginated
+from .responses import carried_headers, model_list_response
 
 router = APIRouter(prefix="/alerts", tags=["alerts"])
 
 
 @router.get("", response_model=List[Alert])
-def get_alerts(
+async def get_alerts(
+    response: Response,
     alert_type: Optional[AlertType] = Query(None, description="Filter by alert type"),
     severity: Optional[AlertSeverity] = Query(None, description="Filter by severity"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of results"),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    service: AlertService = Depends(get_alert_service),
 ):
-    """Get all active alerts with optional filters."""
-    service = AlertService()
-    return service.get_active_alerts(alert_type=alert_type, severity=severity)
+    """Get all active alerts with optional filters, one page at a time."""
+    alerts = await paginated(
+        service.get_active_alerts(
+            alert_type=alert_type, severity=severity, limit=limit, cursor=cursor
+        ),
+        response,
+    )
+    return model_list_response(alerts, Alert, headers=carried_headers(response))
 
 
 @router.post("", response_model=Alert, status_code=201)
-def create_alert(alert_data: AlertCreate):
+async def create_alert(
+    alert_data: AlertCreate, service: AlertService = Depends(get_alert_service)
+):
     """Create a new alert (mainly for testing/manual creation)."""
-    service = AlertService()
-    return service.create_alert(alert_data)
+    alert = await service.create_alert(alert_data)
+    if not alert:
+        raise HTTPException(
+            status_code=409, detail="An alert of this type is already open"
+        )
+    return alert
 
 
 @router.post("/{alert_id}/resolve", response_model=Alert)
-def resolve_alert(alert_id: str):
+async def resolve_alert(
+    alert_id: str, service: AlertService = Depends(get_alert_service)
+):
     """Mark an alert as resolved."""
-    service = AlertService()
-    alert = service.resolve_alert(alert_id)
+    alert = await service.resolve_alert(alert_id)
     if not alert:
         raise HTTPException(status_code=404, detail="Alert not found")
     return alert
 
 
 @router.post("/{alert_id}/dismiss", response_model=Alert)
-def dismiss_alert(alert_id: str):
+async def dismiss_alert(
+    alert_id: str, service: AlertService = Depends(get_alert_service)
+):
     """Dismiss an alert."""
-    service = AlertService()
-    alert = service.dismiss_alert(alert_id)
+    alert = await service.dismiss_alert(alert_id)
     if not alert:
         raise HTTPException(status_code=404, detail="Alert not found")
     return alert
 
 
 @router.get("/projects/{project_id}", response_model=List[Alert])
-def get_project_alerts(project_id: str):
-    """Get all alerts for a specific project."""
-    service = AlertService()
-    return service.get_project_alerts(project_id)
+async def get_project_alerts(
+    project_id: str,
+    response: Response,
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of results"),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    service: AlertService = Depends(get_alert_service),
+):
+    """Get all alerts for a specific project, one page at a time."""
+    alerts = await paginated(
+        service.get_project_alerts(project_id, limit=limit, cursor=cursor), response
+    )
+    return model_list_response(alerts, Alert, headers=carried_headers(response))
 
 
 @router.get("/users/{user_id}", response_model=List[Alert])
-def get_user_alerts(user_id: str):
-    """Get all alerts for a specific user."""
-    service = AlertService()
-    return service.get_user_alerts(user_id)
+async def get_user_alerts(
+    user_id: str,
+    response: Response,
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of results"),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    service: AlertService = Depends(get_alert_service),
+):
+    """Get all alerts for a specific user, one page at a time."""
+    alerts = await paginated(
+        service.get_user_alerts(user_id, limit=limit, cursor=cursor), response
+    )
+    return model_list_response(alerts, Alert, headers=carried_headers(response))
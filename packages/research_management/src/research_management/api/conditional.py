@@ -0,0 +1,59 @@
+"""
+Conditional GET handling for polled API routes.
+"""
+
+from typing import Optional
+
+from fastapi import Request, Response
+
+ETAG_HEADER = "ETag"
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check whether the client's ``If-None-Match`` header matches an entity tag.
+
+    Uses the weak comparison RFC 9110 prescribes for ``If-None-Match``.
+
+    Args:
+        request: Incoming request
+        etag: Current entity tag of the resource
+
+    Returns:
+        True if the client already holds the current representation
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+
+    current = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == current
+        for candidate in header.split(",")
+    )
+
+
+def not_modified(
+    request: Request, response: Response, etag: Optional[str]
+) -> Optional[Response]:
+    """
+    Answer a conditional GET, or tag the response that is about to be built.
+
+    Args:
+        request: Incoming request
+        response: Response injected into the route
+        etag: Current entity tag, None if the resource cannot be tagged
+
+    Returns:
+        A 304 response if the client's copy is current, None otherwise. In
+        the latter case the entity tag has been set on ``response``.
+    """
+    if etag is None:
+        return None
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={ETAG_HEADER: etag})
+
+    response.headers[ETAG_HEADER] = etag
+    return None
@@ -2,17 +2,30 @@
 API routes for dashboards.
 """
 
-from typing import Dict
+from datetime import date, datetime, timedelta
+from typing import Dict, Optional
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
 from ..services import DashboardService
+from ..utils import compute_etag
+from .conditional import not_modified
+from .dependencies import get_dashboard_service
+from .responses import carried_headers, json_response
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
+# Longest range of daily snapshots served by one trends request
+MAX_TREND_DAYS = 366
+DEFAULT_TREND_DAYS = 30
+
 
 @router.get("/coordinator", response_model=Dict)
-def get_coordinator_dashboard():
+async def get_coordinator_dashboard(
+    request: Request,
+    response: Response,
+    service: DashboardService = Depends(get_dashboard_service),
+):
     """
     Get dashboard metrics for coordinators.
 
@@ -24,13 +37,53 @@ def get_coordinator_dashboard():
     - Students without advisor
     - Active alerts count
     """
-    service = DashboardService()
-    return service.get_coordinator_dashboard()
+    # Tagged before computing: a write in between only makes the next
+    # poll download again, never serves a stale dashboard
+    etag = await service.get_coordinator_etag()
+    cached = not_modified(request, response, etag)
+    if cached:
+        return cached
+
+    dashboard = await service.get_coordinator_dashboard()
+    return json_response(dashboard, headers=carried_headers(response))
+
+
+@router.get("/coordinator/trends", response_model=Dict)
+async def get_coordinator_trends(
+    start: Optional[date] = Query(None, alias="from", description="First day"),
+    end: Optional[date] = Query(None, alias="to", description="Last day"),
+    service: DashboardService = Depends(get_dashboard_service),
+):
+    """
+    Get the daily coordinator metrics over a range of days.
+
+    Served from one snapshot per day, so the cost grows with the number of
+    days rather than with project history. Defaults to the last 30 days.
+
+    Returns:
+    - Snapshot dates
+    - Totals, active alerts and students without advisor per date
+    - Status, health and area counts per date
+    """
+    end = end or datetime.utcnow().date()
+    start = start or end - timedelta(days=DEFAULT_TREND_DAYS - 1)
+    if start > end:
+        raise HTTPException(status_code=400, detail="'from' must not be after 'to'")
+    if (end - start).days >= MAX_TREND_DAYS:
+        raise HTTPException(
+            status_code=400, detail=f"Range exceeds {MAX_TREND_DAYS} days"
+        )
+
+    trends = await service.get_coordinator_trends(start, end)
+    return json_response(trends)
 
 
 @router.get("/advisor", response_model=Dict)
-def get_advisor_dashboard(
+async def get_advisor_dashboard(
+    request: Request,
+    response: Response,
     advisor_id: str = Query(..., description="Advisor user ID"),
+    service: DashboardService = Depends(get_dashboard_service),
 ):
     """
     Get dashboard metrics for a specific advisor.
@@ -41,13 +94,16 @@ def get_advisor_dashboard(
     - Active alerts
     - List of projects with their status
     """
-    service = DashboardService()
-    return service.get_advisor_dashboard(advisor_id)
+    dashboard = await service.get_advisor_dashboard(advisor_id)
+    return _tagged(request, response, dashboard)
 
 
 @router.get("/student", response_model=Dict)
-def get_student_dashboard(
+async def get_student_dashboard(
+    request: Request,
+    response: Response,
     student_id: str = Query(..., description="Student user ID"),
+    service: DashboardService = Depends(get_dashboard_service),
 ):
     """
     Get dashboard metrics for a specific student.
@@ -58,5 +114,13 @@ def get_student_dashboard(
     - Advisor status
     - Active alerts
     """
-    service = DashboardService()
-    return service.get_student_dashboard(student_id)
+    dashboard = await service.get_student_dashboard(student_id)
+    return _tagged(request, response, dashboard)
+
+
+def _tagged(request: Request, response: Response, dashboard: Dict):
+    """Answer with a dashboard tagged by a hash of its content."""
+    cached = not_modified(request, response, compute_etag(dashboard))
+    if cached:
+        return cached
+    return json_response(dashboard, headers=carried_headers(response))
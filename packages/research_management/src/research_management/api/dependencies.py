@@ -0,0 +1,193 @@
+"""
+Application-scoped service graph injected into routes with ``Depends``.
+"""
+
+from typing import Optional
+
+from fastapi import FastAPI, Request
+from firebase_admin import firestore_async
+
+from ..config import get_settings
+from ..firebase_admin import get_async_db
+from ..repositories import (
+    AggregateRepository,
+    AlertRepository,
+    MemberRepository,
+    ProjectRepository,
+    SchedulerRepository,
+    SearchRepository,
+    SnapshotRepository,
+    UpdateRepository,
+)
+from ..repositories.mirror import start_mirror, stop_mirror
+from ..repositories.query_shapes import QueryShapeRecorder, RecordingClient
+from ..services import (
+    AlertService,
+    AlertSweepScheduler,
+    DashboardService,
+    HealthService,
+    MigrationService,
+    ProjectService,
+    UpdateService,
+)
+
+
+class ServiceContainer:
+    """
+    Repositories and services shared by every request of an application.
+
+    Built once, so state owned by repositories and services (caches,
+    listeners, batching) persists across requests.
+    """
+
+    def __init__(self, db: Optional[firestore_async.AsyncClient] = None):
+        """
+        Build the service graph.
+
+        Args:
+            db: Optional Firestore client. If None, uses default.
+        """
+        self.settings = get_settings()
+        self.db = db or get_async_db()
+        if self.settings.query_shapes_path:
+            self.db = RecordingClient(
+                self.db, QueryShapeRecorder(self.settings.query_shapes_path)
+            )
+
+        self.project_repo = ProjectRepository(db=self.db)
+        self.member_repo = MemberRepository(db=self.db)
+        self.update_repo = UpdateRepository(db=self.db)
+        self.alert_repo = AlertRepository(db=self.db)
+        self.aggregate_repo = AggregateRepository(db=self.db)
+        self.scheduler_repo = SchedulerRepository(db=self.db)
+        self.snapshot_repo = SnapshotRepository(db=self.db)
+        self.search_repo = SearchRepository(db=self.db)
+
+        self.project_service = ProjectService(
+            project_repo=self.project_repo,
+            member_repo=self.member_repo,
+            search_repo=self.search_repo,
+        )
+        self.update_service = UpdateService(
+            update_repo=self.update_repo, project_repo=self.project_repo
+        )
+        self.alert_service = AlertService(
+            alert_repo=self.alert_repo,
+            member_repo=self.member_repo,
+            update_repo=self.update_repo,
+            project_repo=self.project_repo,
+        )
+        self.dashboard_service = DashboardService(
+            project_repo=self.project_repo,
+            member_repo=self.member_repo,
+            alert_repo=self.alert_repo,
+            aggregate_repo=self.aggregate_repo,
+            snapshot_repo=self.snapshot_repo,
+        )
+        self.health_service = HealthService(
+            project_repo=self.project_repo,
+            member_repo=self.member_repo,
+            alert_repo=self.alert_repo,
+        )
+        self.alert_scheduler = AlertSweepScheduler(
+            alert_service=self.alert_service,
+            scheduler_repo=self.scheduler_repo,
+            interval_seconds=self.settings.alert_sweep_interval_seconds,
+            health_service=(
+                self.health_service if self.settings.health_rescore_enabled else None
+            ),
+            dashboard_service=self.dashboard_service,
+            full_rescore_seconds=self.settings.health_full_rescore_interval_seconds,
+        )
+        self.migration_service = MigrationService(
+            scheduler_repo=self.scheduler_repo,
+            alert_repo=self.alert_repo,
+            update_repo=self.update_repo,
+            member_repo=self.member_repo,
+            project_repo=self.project_repo,
+        )
+
+    async def startup(self) -> None:
+        """Start background resources owned by the services."""
+        if self.settings.run_migrations_on_startup:
+            applied = await self.migration_service.run_pending()
+            for name, changed in (applied or {}).items():
+                print(f"Migration {name} applied ({changed} documents)")
+
+        if self.settings.research_mirror_enabled:
+            # Repositories keep reading from Firestore until the first
+            # snapshots arrive, so startup does not wait for the mirror
+            start_mirror()
+            print("Research mirror listeners attached")
+
+        if self.settings.alert_sweep_interval_seconds > 0:
+            self.alert_scheduler.start()
+            print(
+                "Alert sweeps scheduled every "
+                f"{self.settings.alert_sweep_interval_seconds:g}s"
+            )
+
+    async def shutdown(self) -> None:
+        """Release background resources owned by the services."""
+        await self.alert_scheduler.stop()
+        stop_mirror()
+
+
+async def init_services(app: FastAPI) -> ServiceContainer:
+    """
+    Build the application's service graph and start its resources.
+
+    Args:
+        app: FastAPI application
+
+    Returns:
+        The application's service container
+    """
+    app.state.services = ServiceContainer()
+    await app.state.services.startup()
+    return app.state.services
+
+
+async def close_services(app: FastAPI) -> None:
+    """
+    Release the resources of the application's service graph.
+
+    Args:
+        app: FastAPI application
+    """
+    services = getattr(app.state, "services", None)
+    if services is not None:
+        await services.shutdown()
+
+
+def get_services(request: Request) -> ServiceContainer:
+    """
+    Get the service container of the requesting application.
+
+    Applications that mount the routers without calling ``init_services``
+    (such as the unified backend) get a container built on first use.
+    """
+    services = getattr(request.app.state, "services", None)
+    if services is None:
+        services = request.app.state.services = ServiceContainer()
+    return services
+
+
+def get_project_service(request: Request) -> ProjectService:
+    """Inject the application's project service."""
+    return get_services(request).project_service
+
+
+def get_update_service(request: Request) -> UpdateService:
+    """Inject the application's update service."""
+    return get_services(request).update_service
+
+
+def get_alert_service(request: Request) -> AlertService:
+    """Inject the application's alert service."""
+    return get_services(request).alert_service
+
+
+def get_dashboard_service(request: Request) -> DashboardService:
+    """Inject the application's dashboard service."""
+    return get_services(request).dashboard_service
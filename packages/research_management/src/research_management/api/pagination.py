@@ -0,0 +1,42 @@
+"""
+Helpers for cursor-paginated API routes.
+"""
+
+from typing import Awaitable, List, TypeVar
+
+from fastapi import HTTPException, Response
+
+from ..models.page import Page
+
+T = TypeVar("T")
+
+# Response header carrying the cursor of the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+CURSOR_DESCRIPTION = f"Cursor from the {NEXT_CURSOR_HEADER} header of the previous page"
+
+
+async def paginated(page: Awaitable[Page[T]], response: Response) -> List[T]:
+    """
+    Resolve a page, exposing its next cursor as a response header.
+
+    The body stays a plain list so existing clients keep working.
+
+    Args:
+        page: Awaitable returning the requested page
+        response: Response whose headers receive the next cursor
+
+    Returns:
+        Items of the page
+
+    Raises:
+        HTTPException: 400 if the cursor is invalid
+    """
+    try:
+        result = await page
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    if result.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = result.next_cursor
+    return result.items
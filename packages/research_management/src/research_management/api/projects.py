@@ -4,7 +4,7 @@ API routes for research project management.
 
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
 from ..models.member import ProjectMember, ProjectMemberCreate
 from ..models.project import (
@@ -15,85 +15,165 @@ from ..models.project import (
     ResearchProject,
 )
 from ..services import ProjectService
+from ..utils import compute_etag
+from .conditional import not_modified
+from .dependencies import get_project_service
+from .pagination import CURSOR_DESCRIPTION, paginated
+from .responses import carried_headers, encoded_json_response, model_list_response
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
 
 @router.post("", response_model=ResearchProject, status_code=201)
-def create_project(project_data: ProjectCreate):
+async def create_project(
+    project_data: ProjectCreate, service: ProjectService = Depends(get_project_service)
+):
     """Create a new research project."""
-    service = ProjectService()
-    return service.create_project(project_data)
+    return await service.create_project(project_data)
 
 
 @router.get("", response_model=List[ResearchProject])
-def list_projects(
+async def list_projects(
+    response: Response,
     status: Optional[ProjectStatus] = Query(None, description="Filter by status"),
     area: Optional[str] = Query(None, description="Filter by research area"),
     health_status: Optional[HealthStatus] = Query(
         None, description="Filter by health status"
     ),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of results"),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated fields to return (project_id is always included)",
+    ),
+    service: ProjectService = Depends(get_project_service),
 ):
-    """List research projects with optional filters."""
-    service = ProjectService()
-    return service.list_projects(
-        status=status, area=area, health_status=health_status, limit=limit
+    """List research projects with optional filters, one page at a time."""
+    selected = _parse_fields(fields)
+    items = await paginated(
+        service.list_projects(
+            status=status,
+            area=area,
+            health_status=health_status,
+            limit=limit,
+            cursor=cursor,
+            fields=selected,
+        ),
+        response,
     )
 
+    if selected:
+        # Partial documents do not match the response model
+        return encoded_json_response(items, headers=carried_headers(response))
+    return model_list_response(
+        items, ResearchProject, headers=carried_headers(response)
+    )
+
+
+@router.get("/search", response_model=List[ResearchProject])
+async def search_projects(
+    q: str = Query(..., min_length=1, description="Search text"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of results"),
+    service: ProjectService = Depends(get_project_service),
+):
+    """
+    Search projects by title, description, area and update content.
+
+    Matching ignores accents and case; results are ranked by relevance.
+    """
+    projects = await service.search_projects(q, limit)
+    return model_list_response(projects, ResearchProject)
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Parse and validate a sparse fieldset."""
+    if not fields:
+        return None
+
+    selected = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = sorted(set(selected) - set(ResearchProject.model_fields))
+    if unknown:
+        raise HTTPException(
+            status_code=400, detail=f"Unknown fields: {', '.join(unknown)}"
+        )
+    return selected
+
 
 @router.get("/{project_id}", response_model=ResearchProject)
-def get_project(project_id: str):
+async def get_project(
+    project_id: str,
+    request: Request,
+    response: Response,
+    service: ProjectService = Depends(get_project_service),
+):
     """Get details of a specific project."""
-    service = ProjectService()
-    project = service.get_project(project_id)
+    project = await service.get_project(project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
-    return project
+
+    # Every project write bumps updated_at; update submissions bump the stamps
+    etag = compute_etag(
+        project.project_id,
+        project.updated_at,
+        project.update_count,
+        project.last_update_at,
+    )
+    return not_modified(request, response, etag) or project
 
 
 @router.put("/{project_id}", response_model=ResearchProject)
-def update_project(project_id: str, update_data: ProjectUpdate):
+async def update_project(
+    project_id: str,
+    update_data: ProjectUpdate,
+    service: ProjectService = Depends(get_project_service),
+):
     """Update a project."""
-    service = ProjectService()
-    project = service.update_project(project_id, update_data)
+    project = await service.update_project(project_id, update_data)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     return project
 
 
 @router.delete("/{project_id}", status_code=204)
-def delete_project(project_id: str):
+async def delete_project(
+    project_id: str, service: ProjectService = Depends(get_project_service)
+):
     """Archive a project."""
-    service = ProjectService()
-    success = service.delete_project(project_id)
+    success = await service.delete_project(project_id)
     if not success:
         raise HTTPException(status_code=404, detail="Project not found")
     return None
 
 
 @router.post("/{project_id}/members", response_model=ProjectMember, status_code=201)
-def add_project_member(project_id: str, member_data: ProjectMemberCreate):
+async def add_project_member(
+    project_id: str,
+    member_data: ProjectMemberCreate,
+    service: ProjectService = Depends(get_project_service),
+):
     """Add a member to a project."""
-    service = ProjectService()
-    member = service.add_member(project_id, member_data)
+    member = await service.add_member(project_id, member_data)
     if not member:
         raise HTTPException(status_code=404, detail="Project not found")
     return member
 
 
 @router.get("/{project_id}/members", response_model=List[ProjectMember])
-def get_project_members(project_id: str):
+async def get_project_members(
+    project_id: str, service: ProjectService = Depends(get_project_service)
+):
     """Get all members of a project."""
-    service = ProjectService()
-    return service.get_project_members(project_id)
+    return await service.get_project_members(project_id)
 
 
 @router.delete("/{project_id}/members/{user_id}", status_code=204)
-def remove_project_member(project_id: str, user_id: str):
+async def remove_project_member(
+    project_id: str,
+    user_id: str,
+    service: ProjectService = Depends(get_project_service),
+):
     """Remove a member from a project."""
-    service = ProjectService()
-    success = service.remove_member(project_id, user_id)
+    success = await service.remove_member(project_id, user_id)
     if not success:
         raise HTTPException(status_code=404, detail="Member not found")
     return None
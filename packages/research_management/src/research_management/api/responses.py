@@ -0,0 +1,119 @@
+"""
+Fast serialization path for large API responses.
+
+By default FastAPI validates a returned value against the route's
+``response_model`` and encodes it again with the standard ``json`` module.
+When ``FAST_JSON_RESPONSES`` is enabled, routes hand already-validated
+repository models straight to pydantic-core's JSON serializer, and plain
+payloads to orjson when it is installed.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Type
+
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+from ..config import get_settings
+from .conditional import ETAG_HEADER
+from .pagination import NEXT_CURSOR_HEADER
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+
+# Headers routes set on the injected response that must be copied onto any
+# response object they return themselves
+CARRIED_HEADERS = (NEXT_CURSOR_HEADER, ETAG_HEADER)
+
+
+def carried_headers(response: Response) -> Dict[str, str]:
+    """
+    Get the headers set on the injected response by ``paginated`` and
+    ``not_modified``.
+
+    Needed when a route returns its own ``Response`` object, which does not
+    inherit headers set on the injected one.
+
+    Args:
+        response: Response injected into the route
+
+    Returns:
+        Headers to copy onto the returned response
+    """
+    return {
+        name: response.headers[name]
+        for name in CARRIED_HEADERS
+        if name in response.headers
+    }
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[model])
+
+
+def model_list_response(
+    items: Sequence[BaseModel],
+    model: Type[BaseModel],
+    headers: Optional[Dict[str, str]] = None,
+) -> Any:
+    """
+    Return a list of models, serialized directly when fast responses are on.
+
+    Args:
+        items: Validated models of the same type
+        model: Model type of the items
+        headers: Extra response headers, such as the pagination cursor
+
+    Returns:
+        ``items`` to let FastAPI serialize them, or a ready ``Response``
+    """
+    if not get_settings().fast_json_responses:
+        return items
+
+    return Response(
+        content=_list_adapter(model).dump_json(items),
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+def json_response(content: Any, headers: Optional[Dict[str, str]] = None) -> Any:
+    """
+    Return a plain JSON payload, encoded with orjson when fast responses are on.
+
+    Args:
+        content: Dicts, lists and primitives
+        headers: Extra response headers
+
+    Returns:
+        ``content`` to let FastAPI serialize it, or a ready ``Response``
+    """
+    if not get_settings().fast_json_responses:
+        return content
+    return encoded_json_response(content, headers)
+
+
+def encoded_json_response(
+    content: Any, headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """
+    Encode a plain JSON payload into a response, bypassing ``response_model``.
+
+    Args:
+        content: Dicts, lists and primitives
+        headers: Extra response headers
+
+    Returns:
+        Response encoded with orjson if installed, the standard encoder otherwise
+    """
+    if orjson is None:
+        return JSONResponse(jsonable_encoder(content), headers=headers)
+    return Response(
+        content=orjson.dumps(content), media_type="application/json", headers=headers
+    )
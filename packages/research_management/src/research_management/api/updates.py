@@ -2,12 +2,24 @@
 API routes for project updates.
 """
 
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, Path, Query
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+)
 
 from ..models.update import ProjectUpdateCreate, ProjectUpdateModel
 from ..services import UpdateService
+from .conditional import not_modified
+from .dependencies import get_update_service
+from .pagination import CURSOR_DESCRIPTION, paginated
+from .responses import carried_headers, model_list_response
 
 router = APIRouter(prefix="/projects", tags=["updates"])
 
@@ -15,34 +27,60 @@ router = APIRouter(prefix="/projects", tags=["updates"])
 @router.post(
     "/{project_id}/updates", response_model=ProjectUpdateModel, status_code=201
 )
-def submit_update(
+async def submit_update(
     project_id: str,
     update_data: ProjectUpdateCreate,
     user_id: str = Query(..., description="User ID who is submitting the update"),
+    service: UpdateService = Depends(get_update_service),
 ):
     """Submit a progress update for a project."""
-    service = UpdateService()
-    update = service.submit_update(project_id, user_id, update_data)
+    update = await service.submit_update(project_id, user_id, update_data)
     if not update:
         raise HTTPException(status_code=404, detail="Project not found")
     return update
 
 
 @router.get("/{project_id}/updates", response_model=List[ProjectUpdateModel])
-def get_project_updates(
+async def get_project_updates(
     project_id: str,
+    request: Request,
+    response: Response,
     limit: int = Query(50, ge=1, le=100, description="Maximum number of results"),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    service: UpdateService = Depends(get_update_service),
 ):
-    """Get all updates for a project."""
-    service = UpdateService()
-    return service.get_project_updates(project_id, limit=limit)
+    """Get all updates for a project, one page at a time."""
+    etag = await service.get_updates_etag(project_id, limit=limit, cursor=cursor)
+    cached = not_modified(request, response, etag)
+    if cached:
+        return cached
+
+    updates = await paginated(
+        service.get_project_updates(project_id, limit=limit, cursor=cursor), response
+    )
+    return model_list_response(
+        updates, ProjectUpdateModel, headers=carried_headers(response)
+    )
 
 
 @router.get("/{project_id}/timeline", response_model=List[ProjectUpdateModel])
-def get_project_timeline(
+async def get_project_timeline(
     project_id: str,
+    request: Request,
+    response: Response,
     limit: int = Query(50, ge=1, le=100, description="Maximum number of results"),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    service: UpdateService = Depends(get_update_service),
 ):
     """Get project timeline (same as updates, but with semantic name)."""
-    service = UpdateService()
-    return service.get_project_updates(project_id, limit=limit)
+    etag = await service.get_updates_etag(project_id, limit=limit, cursor=cursor)
+    cached = not_modified(request, response, etag)
+    if cached:
+        return cached
+
+    updates = await paginated(
+        service.get_project_updates(project_id, limit=limit, cursor=cursor), response
+    )
+    return model_list_response(
+        updates, ProjectUpdateModel, headers=carried_headers(response)
+    )
@@ -43,6 +43,36 @@ class Settings(BaseSettings):
     alert_no_advisor_days: int = 14  # Days before alerting about no advisor
     alert_no_update_days: int = 30  # Days before alerting about no updates
     alert_deadline_warning_days: int = 7  # Days before deadline to send warning
+    alert_sweep_interval_seconds: float = 3600.0  # Background sweeps, 0 disables
+
+    # Health rescoring after each sweep; off by default so health statuses
+    # set through the API are not overwritten
+    health_rescore_enabled: bool = False
+    health_full_rescore_interval_seconds: float = 86400.0
+
+    # Entity Cache Configuration
+    entity_cache_size: int = 1000  # Cached projects/member lists, 0 disables
+    entity_cache_ttl_seconds: float = 30.0  # Bounds staleness across instances
+
+    # Full-text search index rebuild interval, bounds staleness across instances
+    search_index_ttl_seconds: float = 600.0
+
+    # How repositories validate documents: "batch" (one call per result set)
+    # or "validate" (one call per document)
+    repository_hydration: str = "batch"
+
+    # Serialize list and dashboard responses directly (orjson when installed)
+    fast_json_responses: bool = False
+
+    # Append the shape of every new Firestore query to this JSON lines file,
+    # for the composite index advisor
+    query_shapes_path: Optional[str] = None
+
+    # Serve reads from a snapshot-listener replica of the research collections
+    research_mirror_enabled: bool = False
+
+    # Run pending one-off data migrations when the application starts
+    run_migrations_on_startup: bool = True
 
     # Runtime / Debug
     debug: bool = False  # Maps to DEBUG env variable; prevents extra_forbidden error
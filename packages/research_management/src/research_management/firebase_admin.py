@@ -6,11 +6,12 @@ import os
 from typing import Optional
 
 import firebase_admin
-from firebase_admin import credentials, firestore
+from firebase_admin import credentials, firestore, firestore_async
 
 from .config import get_settings
 
 _db: Optional[firestore.Client] = None
+_async_db: Optional[firestore_async.AsyncClient] = None
 
 
 def initialize_firebase() -> firestore.Client:
@@ -69,3 +70,18 @@ def get_db() -> firestore.Client:
     if _db is None:
         return initialize_firebase()
     return _db
+
+
+def get_async_db() -> firestore_async.AsyncClient:
+    """
+    Get the asynchronous Firestore database client.
+
+    Returns:
+        Async Firestore client instance
+    """
+    global _async_db
+
+    if _async_db is None:
+        initialize_firebase()
+        _async_db = firestore_async.client()
+    return _async_db
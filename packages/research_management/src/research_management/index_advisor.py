@@ -0,0 +1,113 @@
+"""
+Composite index advisor for the Firestore index manifest.
+
+Reads the query shapes recorded with ``QUERY_SHAPES_PATH`` and either emits
+a ``firestore.indexes.json`` covering them or checks that an existing
+manifest does.
+
+Usage:
+    python -m research_management.index_advisor emit shapes.jsonl \\
+        [--manifest firestore.indexes.json] [--write]
+    python -m research_management.index_advisor check shapes.jsonl \\
+        --manifest firestore.indexes.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .repositories.pagination import DOCUMENT_ID
+from .repositories.query_shapes import load_shapes, required_indexes
+
+
+def _index_key(index: Dict[str, Any]) -> str:
+    """Comparable form of an index, ignoring the implicit document ID field."""
+    fields = [f for f in index.get("fields", []) if f.get("fieldPath") != DOCUMENT_ID]
+    return json.dumps(
+        [
+            index.get("collectionGroup"),
+            index.get("queryScope", "COLLECTION"),
+            fields,
+        ],
+        sort_keys=True,
+    )
+
+
+def load_manifest(path: Optional[Path]) -> Dict[str, Any]:
+    """
+    Load an index manifest.
+
+    Args:
+        path: Manifest file, None for an empty manifest
+
+    Returns:
+        Manifest with ``indexes`` and ``fieldOverrides``
+    """
+    manifest = {"indexes": [], "fieldOverrides": []}
+    if path is not None and path.exists():
+        manifest.update(json.loads(path.read_text()))
+    return manifest
+
+
+def missing_indexes(
+    manifest: Dict[str, Any], indexes: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Get the required indexes a manifest does not declare.
+
+    Args:
+        manifest: Index manifest
+        indexes: Required indexes
+
+    Returns:
+        Indexes to add
+    """
+    declared = {_index_key(index) for index in manifest["indexes"]}
+    return [index for index in indexes if _index_key(index) not in declared]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the advisor.
+
+    Args:
+        argv: Command line arguments, defaults to ``sys.argv``
+
+    Returns:
+        Exit code: 1 if ``check`` finds missing indexes, 0 otherwise
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m research_management.index_advisor",
+        description="Derive Firestore composite indexes from recorded queries.",
+    )
+    parser.add_argument("command", choices=["emit", "check"])
+    parser.add_argument("shapes", nargs="+", type=Path, help="Recorded shape files")
+    parser.add_argument("--manifest", type=Path, help="firestore.indexes.json")
+    parser.add_argument(
+        "--write", action="store_true", help="Write the emitted manifest in place"
+    )
+    args = parser.parse_args(argv)
+
+    manifest = load_manifest(args.manifest)
+    missing = missing_indexes(manifest, required_indexes(load_shapes(args.shapes)))
+
+    if args.command == "check":
+        for index in missing:
+            print(f"Missing index: {json.dumps(index)}", file=sys.stderr)
+        print(f"{len(missing)} missing composite index(es)")
+        return 1 if missing else 0
+
+    manifest["indexes"] = manifest["indexes"] + missing
+    output = json.dumps(manifest, indent=2) + "\n"
+    if args.write and args.manifest is not None:
+        args.manifest.write_text(output)
+        print(f"Added {len(missing)} index(es) to {args.manifest}")
+    else:
+        sys.stdout.write(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,7 +2,7 @@
 FastAPI application for Research Management System.
 """
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .api import (
@@ -11,8 +11,17 @@ from .api import (
     projects_router,
     updates_router,
 )
+from .api.conditional import ETAG_HEADER
+from .api.dependencies import (
+    ServiceContainer,
+    close_services,
+    get_services,
+    init_services,
+)
+from .api.pagination import NEXT_CURSOR_HEADER
 from .config import get_settings
 from .firebase_admin import initialize_firebase
+from .repositories import get_cache_stats, get_mirror_stats
 
 # Initialize settings
 settings = get_settings()
@@ -33,6 +42,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, ETAG_HEADER],
 )
 
 
@@ -41,11 +51,18 @@ async def startup_event():
     """Initialize services on startup."""
     # Initialize Firebase
     initialize_firebase()
+    await init_services(app)
     print("Research Management API started")
     print(f"API version: {settings.api_version}")
     print(f"Firebase project: {settings.firebase_project_id}")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release resources on shutdown."""
+    await close_services(app)
+
+
 @app.get("/")
 def root():
     """Root endpoint."""
@@ -62,6 +79,16 @@ def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/health/cache")
+def cache_stats(services: ServiceContainer = Depends(get_services)):
+    """Entity cache hit/miss counters and research mirror listener state."""
+    stats = get_cache_stats(services.db)
+    mirror = get_mirror_stats()
+    if mirror is not None:
+        stats["research_mirror"] = mirror
+    return stats
+
+
 # Include routers
 app.include_router(projects_router, prefix=settings.api_prefix)
 app.include_router(updates_router, prefix=settings.api_prefix)
@@ -4,10 +4,12 @@ Data models for Research Management System.
 
 from .alert import Alert, AlertCreate, AlertSeverity, AlertStatus, AlertType
 from .member import MemberRole, ProjectMember, ProjectMemberCreate
+from .page import Page
 from .project import (
     HealthStatus,
     ProjectCreate,
     ProjectStatus,
+    ProjectSummary,
     ProjectUpdate,
     ResearchProject,
 )
@@ -15,6 +17,7 @@ from .update import ProjectUpdateCreate, ProjectUpdateModel
 
 __all__ = [
     "ResearchProject",
+    "ProjectSummary",
     "ProjectStatus",
     "HealthStatus",
     "ProjectCreate",
@@ -29,4 +32,5 @@ __all__ = [
     "AlertSeverity",
     "AlertStatus",
     "AlertCreate",
+    "Page",
 ]
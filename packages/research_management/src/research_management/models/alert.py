@@ -52,6 +52,9 @@ class Alert(BaseModel):
     resolved_at: Optional[datetime] = Field(
         None, description="Alert resolution timestamp"
     )
+    due_at: Optional[datetime] = Field(
+        None, description="Deadline the alert is about, for deadline alerts"
+    )
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -78,3 +81,5 @@ class AlertCreate(BaseModel):
     user_id: Optional[str] = None
     message: str = Field(..., min_length=1)
     severity: AlertSeverity
+    # Alerts about a deadline are raised at most once per deadline
+    due_at: Optional[datetime] = None
@@ -0,0 +1,18 @@
+"""
+Pagination models.
+"""
+
+from typing import Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    """One page of a cursor-paginated listing."""
+
+    items: List[T] = Field(default_factory=list, description="Items in this page")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page, None on the last page"
+    )
@@ -55,6 +55,10 @@ class ResearchProject(BaseModel):
     updated_at: datetime = Field(
         default_factory=datetime.utcnow, description="Last update timestamp"
     )
+    last_update_at: Optional[datetime] = Field(
+        None, description="Timestamp of the latest progress update"
+    )
+    update_count: int = Field(0, description="Number of progress updates submitted")
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -69,11 +73,31 @@ class ResearchProject(BaseModel):
                 "expected_end_date": "2025-06-30T00:00:00Z",
                 "created_at": "2025-01-10T10:00:00Z",
                 "updated_at": "2025-01-10T10:00:00Z",
+                "last_update_at": "2025-02-01T14:30:00Z",
+                "update_count": 3,
             }
         }
     )
 
 
+class ProjectSummary(BaseModel):
+    """Lightweight project view for list and dashboard paths."""
+
+    project_id: str = Field(..., description="Unique project identifier")
+    title: str = Field(..., description="Project title")
+    area: str = Field(..., description="Research area")
+    status: ProjectStatus = Field(..., description="Current project status")
+    health_status: HealthStatus = Field(..., description="Project health indicator")
+    expected_end_date: Optional[datetime] = Field(
+        None, description="Expected completion date"
+    )
+
+    @classmethod
+    def from_project(cls, project: ResearchProject) -> "ProjectSummary":
+        """Build a summary from a full project."""
+        return cls(**project.model_dump(include=set(cls.model_fields)))
+
+
 class ProjectCreate(BaseModel):
     """Model for creating a new project."""
 
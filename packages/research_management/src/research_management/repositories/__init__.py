@@ -2,9 +2,16 @@
 Repository module for data access.
 """
 
+from .aggregate_repository import AggregateRepository
 from .alert_repository import AlertRepository
+from .cache import EntityCache, get_cache_stats
 from .member_repository import MemberRepository
+from .mirror import ResearchMirror, get_mirror_stats
 from .project_repository import ProjectRepository
+from .scheduler_repository import SchedulerRepository
+from .search_index import SearchIndex
+from .search_repository import SearchRepository
+from .snapshot_repository import SnapshotRepository
 from .update_repository import UpdateRepository
 
 __all__ = [
@@ -12,4 +19,13 @@ __all__ = [
     "MemberRepository",
     "UpdateRepository",
     "AlertRepository",
+    "AggregateRepository",
+    "SchedulerRepository",
+    "SnapshotRepository",
+    "SearchRepository",
+    "SearchIndex",
+    "EntityCache",
+    "get_cache_stats",
+    "ResearchMirror",
+    "get_mirror_stats",
 ]
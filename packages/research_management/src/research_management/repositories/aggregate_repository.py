@@ -0,0 +1,193 @@
+"""
+Repository for the materialized coordinator dashboard aggregate.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from firebase_admin import firestore_async
+
+from ..firebase_admin import get_async_db
+from ..models.alert import AlertStatus
+from ..models.member import MemberRole
+
+
+class AggregateRepository:
+    """
+    Repository for the coordinator dashboard aggregate document.
+
+    The aggregate holds exact counters that other repositories keep current by
+    queuing increments on the same batch or transaction as their own writes:
+
+    - ``total_projects``
+    - ``status_counts.<status>`` and ``health_counts.<health_status>``
+    - ``active_alerts_count``
+    - ``students_without_advisor``
+    - ``active_students``: student memberships of active projects
+    - ``advisor_projects.<user_id>``: active projects each advisor or
+      co-advisor is a member of
+
+    ``version`` is bumped by every write that may change the coordinator
+    dashboard, including writes whose counters do not move, so it can be
+    used to tag the dashboard without recomputing it.
+    """
+
+    COLLECTION = "dashboard_aggregates"
+    COORDINATOR_DOC = "coordinator"
+    # Bumped when counters are added; aggregates built with an older layout
+    # read as missing, so they are rebuilt once
+    LAYOUT = 2
+
+    def __init__(self, db: Optional[firestore_async.AsyncClient] = None):
+        """
+        Initialize repository.
+
+        Args:
+            db: Optional Firestore client. If None, uses default.
+        """
+        self.db = db or get_async_db()
+
+    def _ref(self):
+        return self.db.collection(self.COLLECTION).document(self.COORDINATOR_DOC)
+
+    async def get(self) -> Optional[Dict]:
+        """
+        Get the coordinator aggregate.
+
+        Returns:
+            Aggregate counters, or None if the aggregate was never built with
+            the current layout
+        """
+        doc = await self._ref().get()
+        if not doc.exists:
+            return None
+
+        data = doc.to_dict()
+        if not data.get("initialized") or data.get("layout", 1) < self.LAYOUT:
+            return None
+        return data
+
+    async def replace(self, data: Dict) -> None:
+        """
+        Overwrite the aggregate with freshly computed counters.
+
+        Args:
+            data: Aggregate counters
+        """
+        await self._ref().set(
+            {
+                **data,
+                "initialized": True,
+                "layout": self.LAYOUT,
+                "rebuilt_at": datetime.utcnow(),
+            }
+        )
+
+    def apply(self, writer, deltas: Dict[str, int]) -> None:
+        """
+        Queue counter increments and a version bump on a batch or transaction.
+
+        Args:
+            writer: Firestore ``WriteBatch`` or ``Transaction``
+            deltas: Mapping of dotted counter path to increment
+        """
+        nested: Dict = {"version": firestore_async.Increment(1)}
+        for path, delta in deltas.items():
+            if not delta:
+                continue
+            *parents, leaf = path.split(".")
+            target = nested
+            for parent in parents:
+                target = target.setdefault(parent, {})
+            target[leaf] = firestore_async.Increment(delta)
+
+        writer.set(self._ref(), nested, merge=True)
+
+
+def project_deltas(old: Optional[Dict], new: Optional[Dict]) -> Dict[str, int]:
+    """
+    Compute counter changes for a project transition.
+
+    Args:
+        old: Stored project before the write, None on create
+        new: Stored project after the write
+
+    Returns:
+        Mapping of dotted counter path to increment
+    """
+    deltas: Dict[str, int] = {}
+    for data, sign in ((old, -1), (new, 1)):
+        if data is None:
+            continue
+        for path in (
+            "total_projects",
+            f"status_counts.{data['status']}",
+            f"health_counts.{data['health_status']}",
+        ):
+            deltas[path] = deltas.get(path, 0) + sign
+    return deltas
+
+
+def alert_deltas(
+    old_status: Optional[str], new_status: Optional[str]
+) -> Dict[str, int]:
+    """
+    Compute counter changes for an alert status transition.
+
+    Args:
+        old_status: Stored status before the write, None on create
+        new_status: Stored status after the write
+
+    Returns:
+        Mapping of dotted counter path to increment
+    """
+    active = AlertStatus.ACTIVE.value
+    return {
+        "active_alerts_count": int(new_status == active) - int(old_status == active)
+    }
+
+
+def advisor_ratio_deltas(
+    old: Optional[Iterable[Dict]], new: Optional[Iterable[Dict]]
+) -> Dict[str, int]:
+    """
+    Compute counter changes for the members of an active project.
+
+    Args:
+        old: Active membership documents counted before the write, None if
+            the project did not count (it was not active)
+        new: Active membership documents counted after the write, None if
+            the project no longer counts
+
+    Returns:
+        Mapping of dotted counter path to increment
+    """
+    advisor_roles = (MemberRole.ADVISOR.value, MemberRole.CO_ADVISOR.value)
+    deltas: Dict[str, int] = {}
+    for members, sign in ((old, -1), (new, 1)):
+        for member in members or ():
+            if member["role"] == MemberRole.STUDENT.value:
+                path = "active_students"
+            elif member["role"] in advisor_roles:
+                path = f"advisor_projects.{member['user_id']}"
+            else:
+                continue
+            deltas[path] = deltas.get(path, 0) + sign
+    return deltas
+
+
+def unadvised_student_count(members: Iterable[Dict]) -> int:
+    """
+    Count students of a single project who have no advisor.
+
+    Args:
+        members: Active membership documents of one project
+
+    Returns:
+        Number of students if the project lacks an advisor or co-advisor,
+        zero otherwise
+    """
+    roles: List[str] = [member["role"] for member in members]
+    if MemberRole.ADVISOR.value in roles or MemberRole.CO_ADVISOR.value in roles:
+        return 0
+    return roles.count(MemberRole.STUDENT.value)
@@ -2,44 +2,324 @@
 Repository for alerts data access.
 """
 
+import asyncio
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
-from firebase_admin import firestore
+from firebase_admin import firestore_async
+from google.api_core.exceptions import AlreadyExists
 
-from ..firebase_admin import get_db
+from ..firebase_admin import get_async_db
 from ..models.alert import Alert, AlertCreate, AlertSeverity, AlertStatus, AlertType
+from ..models.page import Page
 from ..utils import generate_id
+from .aggregate_repository import AggregateRepository, alert_deltas
+from .counting import count_documents
+from .hydration import HydrationMode, get_hydrator
+from .mirror import ResearchMirror, get_mirror
+from .pagination import DOCUMENT_ID, fetch_page, page_from_items
 
 
 class AlertRepository:
     """Repository for managing alerts in Firestore."""
 
     COLLECTION = "alerts"
+    OPEN_KEYS_COLLECTION = "open_alerts"
+    BATCH_LIMIT = 500  # Maximum number of writes in a Firestore batch
+    # Firestore accepts at most 30 values in an "in" filter
+    IN_QUERY_LIMIT = 30
 
-    def __init__(self, db: Optional[firestore.Client] = None):
+    def __init__(
+        self,
+        db: Optional[firestore_async.AsyncClient] = None,
+        mirror: Optional[ResearchMirror] = None,
+        hydration: Optional[HydrationMode] = None,
+    ):
         """
         Initialize repository.
 
         Args:
             db: Optional Firestore client. If None, uses default.
+            mirror: Optional live replica to read active alerts from. If None,
+                uses the process-wide mirror whenever it is running.
+            hydration: How documents become models. If None, uses the
+                configured default.
         """
-        self.db = db or get_db()
+        self.db = db or get_async_db()
+        self._mirror = mirror
+        self.hydrator = get_hydrator(Alert, hydration)
+        self.aggregates = AggregateRepository(self.db)
+
+    @property
+    def mirror(self) -> Optional[ResearchMirror]:
+        """Live replica to read from, if one is running and ready."""
+        return get_mirror(self._mirror)
 
-    def create(self, alert_data: AlertCreate) -> Alert:
+    async def create(self, alert_data: AlertCreate) -> Alert:
         """
         Create a new alert.
 
+        Alerts with a project or user claim the open key of their type and
+        subject (see ``create_if_absent``) in the same batch.
+
         Args:
             alert_data: Alert creation data
 
         Returns:
             Created alert
+
+        Raises:
+            AlreadyExists: If an alert of the same type is already open for
+                the subject
+        """
+        alert = self._build(alert_data)
+
+        # Save to Firestore together with the dashboard counters
+        batch = self.db.batch()
+        self._queue_create(batch, alert, open_key=open_alert_key(alert_data))
+        self._queue_counters(batch, 1)
+        await batch.commit()
+
+        return alert
+
+    async def create_if_absent(self, alert_data: AlertCreate) -> Optional[Alert]:
+        """
+        Create an alert unless one of the same type is already open for its
+        project or user.
+
+        The open alert is tracked by a document keyed ``<type>#<subject>`` in
+        ``OPEN_KEYS_COLLECTION``. It is written with create-only semantics in
+        the same batch as the alert, so deduplication is a single conditional
+        write regardless of how many alerts the subject accumulated.
+
+        Args:
+            alert_data: Alert creation data
+
+        Returns:
+            Created alert, or None if an open alert already exists
+        """
+        try:
+            return await self.create(alert_data)
+        except AlreadyExists:
+            return None
+
+    async def backfill_open_keys(self) -> int:
+        """
+        Claim the open keys of active alerts created before keys existed.
+
+        One-off migration. Alerts that already hold a key are skipped; of
+        several legacy alerts open for the same type and subject, the first
+        one read claims the key.
+
+        Returns:
+            Number of keys claimed
+        """
+        query = (
+            self.db.collection(self.COLLECTION)
+            .where("status", "==", AlertStatus.ACTIVE.value)
+            .select(["type", "project_id", "user_id", "open_key"])
+        )
+        claims: Dict[str, str] = {}
+        held = set()
+        async for doc in query.stream():
+            data = doc.to_dict()
+            if data.get("open_key"):
+                held.add(data["open_key"])
+                continue
+            key = _open_key(
+                data.get("type"), data.get("project_id") or data.get("user_id")
+            )
+            if key:
+                claims.setdefault(key, doc.id)
+
+        for key in held:
+            claims.pop(key, None)
+        if not claims:
+            return 0
+
+        refs = [
+            self.db.collection(self.OPEN_KEYS_COLLECTION).document(key)
+            for key in claims
+        ]
+        async for doc in self.db.get_all(refs):
+            if doc.exists:
+                claims.pop(doc.id, None)
+
+        # Each claim takes two writes: the key and the alert's back reference
+        items = list(claims.items())
+        size = self.BATCH_LIMIT // 2
+        claimed = await asyncio.gather(
+            *(
+                self._claim_chunk(items[start : start + size])
+                for start in range(0, len(items), size)
+            )
+        )
+        return sum(claimed)
+
+    async def _claim_chunk(self, claims: List[tuple]) -> int:
+        """Claim open keys for existing alerts, skipping keys taken meanwhile."""
+        batch = self.db.batch()
+        for key, alert_id in claims:
+            self._queue_claim(batch, key, alert_id)
+        try:
+            await batch.commit()
+            return len(claims)
+        except AlreadyExists:
+            if len(claims) == 1:
+                return 0
+
+        # A new alert claimed one of these keys since they were read
+        claimed = 0
+        for key, alert_id in claims:
+            batch = self.db.batch()
+            self._queue_claim(batch, key, alert_id)
+            try:
+                await batch.commit()
+                claimed += 1
+            except AlreadyExists:
+                continue
+        return claimed
+
+    def _queue_claim(self, batch, key: str, alert_id: str) -> None:
+        """Queue claiming an open key for an existing alert."""
+        batch.create(
+            self.db.collection(self.OPEN_KEYS_COLLECTION).document(key),
+            {"alert_id": alert_id},
+        )
+        batch.update(
+            self.db.collection(self.COLLECTION).document(alert_id),
+            {"open_key": key},
+        )
+
+    async def release_expired_keys(self, now: datetime) -> int:
+        """
+        Delete the open keys of deadline alerts whose deadline has passed.
+
+        Deadline keys are not released when their alert closes, so the same
+        deadline is not alerted on twice. Once the deadline is over it can no
+        longer be alerted on, and the key is only taking up space.
+
+        Args:
+            now: Keys of deadlines before this are released
+
+        Returns:
+            Number of keys deleted
+        """
+        query = (
+            self.db.collection(self.OPEN_KEYS_COLLECTION)
+            .where("due_at", "<", now.isoformat())
+            .select(["due_at"])
+        )
+        refs = [doc.reference async for doc in query.stream()]
+
+        async def _delete(chunk) -> None:
+            batch = self.db.batch()
+            for ref in chunk:
+                batch.delete(ref)
+            await batch.commit()
+
+        await asyncio.gather(
+            *(
+                _delete(refs[start : start + self.BATCH_LIMIT])
+                for start in range(0, len(refs), self.BATCH_LIMIT)
+            )
+        )
+        return len(refs)
+
+    async def create_many(
+        self, alerts_data: Iterable[AlertCreate], if_absent: bool = False
+    ) -> List[Alert]:
+        """
+        Create many alerts with as few commits as possible.
+
+        Alerts are written in batches that stay under ``BATCH_LIMIT`` writes,
+        and the batches are committed concurrently. Dashboard counters are
+        incremented once per batch.
+
+        Every alert claims its open key, as in ``create``. With ``if_absent``
+        the open keys of all candidates are read in one ``get_all`` first, and
+        candidates that already have an open alert (or repeat an earlier
+        candidate) are skipped. Keys are still written with create-only
+        semantics; if a concurrent writer claims one in the meantime, that
+        batch falls back to ``create_if_absent`` per alert.
+
+        Args:
+            alerts_data: Alerts to create
+            if_absent: Skip alerts whose type is already open for their subject
+
+        Returns:
+            List of created alerts
+
+        Raises:
+            AlreadyExists: Without ``if_absent``, if an alert of the same type
+                is already open for one of the subjects
         """
-        alert_id = generate_id("alert")
+        candidates = list(alerts_data)
+        if if_absent:
+            candidates = await self._without_open(candidates)
+
+        # Each alert takes two writes, itself and its open key, and each
+        # batch one more for the counters
+        size = (self.BATCH_LIMIT - 1) // 2
+        chunks = [
+            candidates[start : start + size]
+            for start in range(0, len(candidates), size)
+        ]
+
+        results = await asyncio.gather(
+            *(self._create_chunk(chunk, if_absent) for chunk in chunks)
+        )
+        return [alert for created in results for alert in created]
+
+    async def _without_open(self, candidates: List[AlertCreate]) -> List[AlertCreate]:
+        """Drop candidates that already have an open alert or repeat a key."""
+        keys = {open_alert_key(alert_data) for alert_data in candidates} - {None}
+        taken = set()
+        if keys:
+            refs = [
+                self.db.collection(self.OPEN_KEYS_COLLECTION).document(key)
+                for key in keys
+            ]
+            taken = {doc.id async for doc in self.db.get_all(refs) if doc.exists}
+
+        remaining = []
+        for alert_data in candidates:
+            key = open_alert_key(alert_data)
+            if key in taken:
+                continue
+            if key:
+                taken.add(key)
+            remaining.append(alert_data)
+        return remaining
+
+    async def _create_chunk(
+        self, chunk: List[AlertCreate], if_absent: bool
+    ) -> List[Alert]:
+        """Create one batch worth of alerts."""
+        alerts = [self._build(alert_data) for alert_data in chunk]
+
+        batch = self.db.batch()
+        for alert_data, alert in zip(chunk, alerts):
+            self._queue_create(batch, alert, open_key=open_alert_key(alert_data))
+        self._queue_counters(batch, len(alerts))
+
+        try:
+            await batch.commit()
+        except AlreadyExists:
+            if not if_absent:
+                raise
+            # Another writer opened one of these alerts since the keys were read
+            created = await asyncio.gather(
+                *(self.create_if_absent(alert_data) for alert_data in chunk)
+            )
+            return [alert for alert in created if alert is not None]
+
+        return alerts
 
-        alert = Alert(
-            alert_id=alert_id,
+    def _build(self, alert_data: AlertCreate) -> Alert:
+        """Build a new active alert from creation data."""
+        return Alert(
+            alert_id=generate_id("alert"),
             type=alert_data.type,
             project_id=alert_data.project_id,
             user_id=alert_data.user_id,
@@ -47,29 +327,73 @@ class AlertRepository:
             severity=alert_data.severity,
             status=AlertStatus.ACTIVE,
             created_at=datetime.utcnow(),
+            due_at=alert_data.due_at,
         )
 
-        # Save to Firestore
-        doc_ref = self.db.collection(self.COLLECTION).document(alert_id)
-        doc_ref.set(alert.model_dump(mode="json"))
+    def _queue_create(
+        self, batch, alert: Alert, open_key: Optional[str] = None
+    ) -> None:
+        """
+        Queue an alert write on a batch, claiming its open key if given.
 
-        return alert
+        The key is written with create-only semantics, so the batch fails with
+        ``AlreadyExists`` if the key is already held.
+        """
+        data = alert.model_dump(mode="json")
+        if open_key:
+            key_data = {"alert_id": alert.alert_id}
+            if data.get("due_at"):
+                # Lets the key be released once the deadline has passed
+                key_data["due_at"] = data["due_at"]
+            batch.create(
+                self.db.collection(self.OPEN_KEYS_COLLECTION).document(open_key),
+                key_data,
+            )
+            # Remembered so closing the alert can release the key
+            data["open_key"] = open_key
+
+        doc_ref = self.db.collection(self.COLLECTION).document(alert.alert_id)
+        batch.set(doc_ref, data)
+
+    def _queue_counters(self, batch, created: int) -> None:
+        """Queue the dashboard counter increments for new active alerts."""
+        deltas = alert_deltas(None, AlertStatus.ACTIVE.value)
+        self.aggregates.apply(
+            batch, {path: delta * created for path, delta in deltas.items()}
+        )
 
-    def get_active_alerts(
+    async def get_active_alerts(
         self,
         alert_type: Optional[AlertType] = None,
         severity: Optional[AlertSeverity] = None,
-    ) -> List[Alert]:
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Page[Alert]:
         """
         Get all active alerts with optional filters.
 
         Args:
             alert_type: Filter by alert type
             severity: Filter by severity
+            limit: Maximum number of results, None for no limit
+            cursor: Cursor returned with the previous page
 
         Returns:
-            List of active alerts
+            Page of active alerts
         """
+        if self.mirror:
+            alerts = (
+                self.mirror.alerts.find("type", alert_type.value)
+                if alert_type
+                else self.mirror.alerts.all()
+            )
+            return page_from_items(
+                [a for a in alerts if severity is None or a.severity == severity],
+                key=lambda a: a.alert_id,
+                limit=limit,
+                cursor=cursor,
+            )
+
         query = self.db.collection(self.COLLECTION).where(
             "status", "==", AlertStatus.ACTIVE.value
         )
@@ -79,60 +403,145 @@ class AlertRepository:
         if severity:
             query = query.where("severity", "==", severity.value)
 
-        docs = query.stream()
+        return await self._fetch_page(query, limit, cursor)
 
-        alerts = []
-        for doc in docs:
-            data = doc.to_dict()
-            alerts.append(Alert(**data))
+    async def count_active(self) -> int:
+        """
+        Count active alerts with a server-side aggregation.
 
-        return alerts
+        Returns:
+            Number of active alerts
+        """
+        if self.mirror:
+            return len(self.mirror.alerts.all())
+
+        query = self.db.collection(self.COLLECTION).where(
+            "status", "==", AlertStatus.ACTIVE.value
+        )
+        return await count_documents(query)
+
+    async def count_active_by_project(
+        self, project_ids: Optional[List[str]] = None
+    ) -> Dict[str, int]:
+        """
+        Count active alerts per project in one query.
+
+        Args:
+            project_ids: Only count for these projects, with one query per
+                chunk of ``IN_QUERY_LIMIT``. If None, every project.
+
+        Returns:
+            Mapping of project ID to its number of active alerts, without
+            projects that have none
+        """
+        if project_ids is not None:
+            alerts = await self.get_active_for_projects(project_ids)
+            return {
+                project_id: len(project_alerts)
+                for project_id, project_alerts in alerts.items()
+                if project_alerts
+            }
+
+        if self.mirror:
+            project_ids = [a.project_id for a in self.mirror.alerts.all()]
+        else:
+            query = (
+                self.db.collection(self.COLLECTION)
+                .where("status", "==", AlertStatus.ACTIVE.value)
+                .select(["project_id"])
+            )
+            project_ids = [doc.get("project_id") async for doc in query.stream()]
+
+        counts: Dict[str, int] = {}
+        for project_id in project_ids:
+            if project_id:
+                counts[project_id] = counts.get(project_id, 0) + 1
+        return counts
+
+    async def get_active_for_projects(
+        self, project_ids: List[str]
+    ) -> Dict[str, List[Alert]]:
+        """
+        Get the active alerts of many projects at once.
 
-    def get_by_project(self, project_id: str) -> List[Alert]:
+        Issues one ``in`` query per chunk of ``IN_QUERY_LIMIT`` project IDs,
+        or none when the mirror is running.
+
+        Args:
+            project_ids: Project identifiers
+
+        Returns:
+            Mapping of project ID to its active alerts. Every requested
+            project is present, with an empty list if it has none.
+        """
+        unique_ids = list(dict.fromkeys(project_ids))
+        if self.mirror:
+            return {
+                project_id: self.mirror.alerts.find("project", project_id)
+                for project_id in unique_ids
+            }
+
+        alerts_by_project: Dict[str, List[Alert]] = {
+            project_id: [] for project_id in unique_ids
+        }
+        for start in range(0, len(unique_ids), self.IN_QUERY_LIMIT):
+            chunk = unique_ids[start : start + self.IN_QUERY_LIMIT]
+            query = (
+                self.db.collection(self.COLLECTION)
+                .where("project_id", "in", chunk)
+                .where("status", "==", AlertStatus.ACTIVE.value)
+            )
+            docs = [doc.to_dict() async for doc in query.stream()]
+            for alert in self.hydrator.many(docs):
+                alerts_by_project[alert.project_id].append(alert)
+
+        return alerts_by_project
+
+    async def get_by_project(
+        self,
+        project_id: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Page[Alert]:
         """
         Get all alerts for a specific project.
 
         Args:
             project_id: Project identifier
+            limit: Maximum number of results, None for no limit
+            cursor: Cursor returned with the previous page
 
         Returns:
-            List of alerts
+            Page of alerts
         """
         query = self.db.collection(self.COLLECTION).where(
             "project_id", "==", project_id
         )
 
-        docs = query.stream()
+        return await self._fetch_page(query, limit, cursor)
 
-        alerts = []
-        for doc in docs:
-            data = doc.to_dict()
-            alerts.append(Alert(**data))
-
-        return alerts
-
-    def get_by_user(self, user_id: str) -> List[Alert]:
+    async def get_by_user(
+        self,
+        user_id: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Page[Alert]:
         """
         Get all alerts for a specific user.
 
         Args:
             user_id: User identifier
+            limit: Maximum number of results, None for no limit
+            cursor: Cursor returned with the previous page
 
         Returns:
-            List of alerts
+            Page of alerts
         """
         query = self.db.collection(self.COLLECTION).where("user_id", "==", user_id)
 
-        docs = query.stream()
-
-        alerts = []
-        for doc in docs:
-            data = doc.to_dict()
-            alerts.append(Alert(**data))
-
-        return alerts
+        return await self._fetch_page(query, limit, cursor)
 
-    def resolve(self, alert_id: str) -> Optional[Alert]:
+    async def resolve(self, alert_id: str) -> Optional[Alert]:
         """
         Mark an alert as resolved.
 
@@ -142,38 +551,100 @@ class AlertRepository:
         Returns:
             Updated alert if found, None otherwise
         """
-        doc_ref = self.db.collection(self.COLLECTION).document(alert_id)
-        doc = doc_ref.get()
+        return await self._close(alert_id, AlertStatus.RESOLVED)
 
-        if not doc.exists:
-            return None
+    async def dismiss(self, alert_id: str) -> Optional[Alert]:
+        """
+        Dismiss an alert.
 
-        doc_ref.update(
-            {"status": AlertStatus.RESOLVED.value, "resolved_at": datetime.utcnow()}
-        )
+        Args:
+            alert_id: Alert identifier
 
-        updated_doc = doc_ref.get()
-        return Alert(**updated_doc.to_dict())
+        Returns:
+            Updated alert if found, None otherwise
+        """
+        return await self._close(alert_id, AlertStatus.DISMISSED)
 
-    def dismiss(self, alert_id: str) -> Optional[Alert]:
+    async def _close(self, alert_id: str, status: AlertStatus) -> Optional[Alert]:
         """
-        Dismiss an alert.
+        Move an alert to a closed status and update the dashboard counters.
+
+        The read and the write share one transaction, and the returned alert is
+        merged locally instead of being read back.
 
         Args:
             alert_id: Alert identifier
+            status: Closed status to set
 
         Returns:
             Updated alert if found, None otherwise
         """
         doc_ref = self.db.collection(self.COLLECTION).document(alert_id)
-        doc = doc_ref.get()
-
-        if not doc.exists:
+        changes = {"status": status.value, "resolved_at": datetime.utcnow().isoformat()}
+
+        @firestore_async.async_transactional
+        async def _update(transaction) -> Optional[Dict]:
+            doc = await doc_ref.get(transaction=transaction)
+            if not doc.exists:
+                return None
+
+            old = doc.to_dict()
+            transaction.update(doc_ref, changes)
+            self.aggregates.apply(
+                transaction, alert_deltas(old.get("status"), status.value)
+            )
+
+            # Release the open key so the condition can be alerted on again.
+            # Keys of deadline alerts name the deadline and stay claimed, so
+            # a closed alert is not raised again for the same deadline.
+            if (
+                old.get("open_key")
+                and old.get("status") == AlertStatus.ACTIVE.value
+                and not old.get("due_at")
+            ):
+                transaction.delete(
+                    self.db.collection(self.OPEN_KEYS_COLLECTION).document(
+                        old["open_key"]
+                    )
+                )
+            return {**old, **changes}
+
+        updated = await _update(self.db.transaction())
+        if updated is None:
             return None
-
-        doc_ref.update(
-            {"status": AlertStatus.DISMISSED.value, "resolved_at": datetime.utcnow()}
+        return self.hydrator.one(updated)
+
+    async def _fetch_page(
+        self, query, limit: Optional[int], cursor: Optional[str]
+    ) -> Page[Alert]:
+        """Run an alert query one page at a time, ordered by alert ID."""
+        return await fetch_page(
+            query,
+            order_by=[(DOCUMENT_ID, firestore_async.Query.ASCENDING)],
+            parse_many=self.hydrator.many,
+            limit=limit,
+            cursor=cursor,
         )
 
-        updated_doc = doc_ref.get()
-        return Alert(**updated_doc.to_dict())
+
+def open_alert_key(alert_data: AlertCreate) -> Optional[str]:
+    """
+    Deterministic key identifying the open alert of a type for a subject.
+
+    Args:
+        alert_data: Alert creation data
+
+    Returns:
+        ``<type>#<project_id or user_id>``, followed by ``#<date>`` for
+        alerts about a deadline, or None if the alert has no subject
+    """
+    key = _open_key(alert_data.type.value, alert_data.project_id or alert_data.user_id)
+    if key is not None and alert_data.due_at is not None:
+        key = f"{key}#{alert_data.due_at.date().isoformat()}"
+    return key
+
+
+def _open_key(alert_type: Optional[str], subject: Optional[str]) -> Optional[str]:
+    if not alert_type or subject is None:
+        return None
+    return f"{alert_type}#{subject}"
@@ -0,0 +1,146 @@
+"""
+Read-through entity cache shared by repositories.
+"""
+
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from ..config import get_settings
+
+
+class EntityCache:
+    """
+    Bounded LRU cache whose entries expire after a fixed TTL.
+
+    Repositories read through it and invalidate entries from their own write
+    methods. Writes made by other processes are only picked up once the entry
+    expires, so the TTL bounds how stale a read can be.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_size: Maximum number of entries, 0 disables caching
+            ttl_seconds: Seconds an entry stays valid
+            clock: Monotonic time source
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Entry key
+
+        Returns:
+            Cached value, or None if absent or expired
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > self._clock():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        if entry is not None:
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry when full.
+
+        Args:
+            key: Entry key
+            value: Value to cache
+        """
+        if self.max_size <= 0:
+            return
+
+        self._entries[key] = (self._clock() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Drop a cached value.
+
+        Args:
+            key: Entry key
+        """
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every cached value."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters.
+
+        Returns:
+            Hits, misses, current size and hit rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+# Caches are shared by every repository built on the same Firestore client
+_caches: "weakref.WeakKeyDictionary[Any, Dict[str, EntityCache]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_entity_cache(db, name: str) -> EntityCache:
+    """
+    Get the named cache for a Firestore client, creating it on first use.
+
+    Args:
+        db: Firestore client the cached entities are read from
+        name: Cache name, usually the collection
+
+    Returns:
+        Cache sized from settings
+    """
+    caches = _caches.setdefault(db, {})
+    if name not in caches:
+        settings = get_settings()
+        caches[name] = EntityCache(
+            max_size=settings.entity_cache_size,
+            ttl_seconds=settings.entity_cache_ttl_seconds,
+        )
+    return caches[name]
+
+
+def get_cache_stats(db) -> Dict[str, Dict[str, Any]]:
+    """
+    Get the counters of every cache of a Firestore client.
+
+    Args:
+        db: Firestore client
+
+    Returns:
+        Mapping of cache name to its counters
+    """
+    return {name: cache.stats() for name, cache in _caches.get(db, {}).items()}
@@ -0,0 +1,32 @@
+"""
+Document counting shared by repositories.
+"""
+
+from google.api_core.exceptions import InvalidArgument, MethodNotImplemented
+
+# Raised by backends that do not implement aggregation queries, such as older
+# Firestore emulators
+UNSUPPORTED_AGGREGATION = (MethodNotImplemented, InvalidArgument, NotImplementedError)
+
+
+async def count_documents(query) -> int:
+    """
+    Count the documents matching a query.
+
+    Uses a server-side ``count()`` aggregation, billed as one read per batch
+    of up to 1000 matches. Backends without aggregation support (such as
+    older Firestore emulators) fall back to streaming the matches with only
+    their document name selected. Any other error is raised.
+
+    Args:
+        query: Firestore query with filters applied
+
+    Returns:
+        Number of matching documents
+    """
+    try:
+        results = await query.count(alias="count").get()
+    except UNSUPPORTED_AGGREGATION:
+        return len([doc async for doc in query.select(["__name__"]).stream()])
+
+    return int(results[0][0].value)
@@ -0,0 +1,94 @@
+"""
+Conversion of Firestore documents into models.
+"""
+
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+
+from pydantic import BaseModel, TypeAdapter
+
+from ..config import get_settings
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class HydrationMode(str, Enum):
+    """How repositories turn stored documents into models."""
+
+    VALIDATE = "validate"  # One validation call per document
+    BATCH = "batch"  # One validation call per result set
+
+
+class Hydrator(Generic[T]):
+    """
+    Builds models of one type from document dicts.
+
+    Both modes run the model's full validation. ``BATCH`` validates a whole
+    result set with a single ``TypeAdapter(List[model])`` call, which keeps
+    the loop inside pydantic-core and is markedly faster on large pages.
+    Building models with ``model_construct`` plus manual datetime and enum
+    coercion was measured too (see ``benchmarks/hydration.py``) and is slower
+    than either mode, because the coercion runs in Python.
+    """
+
+    def __init__(self, model: Type[T], mode: HydrationMode = HydrationMode.BATCH):
+        """
+        Initialize hydrator.
+
+        Args:
+            model: Model to build
+            mode: Hydration mode
+        """
+        self.model = model
+        self.mode = HydrationMode(mode)
+        self._adapter = TypeAdapter(List[model])
+
+    def one(self, data: Dict[str, Any]) -> T:
+        """
+        Build one model.
+
+        Args:
+            data: Document dict
+
+        Returns:
+            Model
+        """
+        return self.model.model_validate(data)
+
+    def many(self, docs: List[Dict[str, Any]]) -> List[T]:
+        """
+        Build models for a whole result set.
+
+        Args:
+            docs: Document dicts
+
+        Returns:
+            Models, in the same order
+        """
+        if self.mode is HydrationMode.BATCH:
+            return self._adapter.validate_python(docs)
+        return [self.model.model_validate(data) for data in docs]
+
+
+@lru_cache(maxsize=None)
+def _hydrator(model: Type[T], mode: HydrationMode) -> Hydrator[T]:
+    return Hydrator(model, mode)
+
+
+def get_hydrator(
+    model: Type[T], mode: Optional[Union[HydrationMode, str]] = None
+) -> Hydrator[T]:
+    """
+    Get the shared hydrator of a model.
+
+    Args:
+        model: Model to build
+        mode: Hydration mode. If None, uses the configured default.
+
+    Returns:
+        Hydrator, built once per model and mode
+    """
+    if mode is None:
+        mode = get_settings().repository_hydration
+    return _hydrator(model, HydrationMode(mode))
@@ -2,30 +2,71 @@
 Repository for project members data access.
 """
 
+from collections import defaultdict
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
 
-from firebase_admin import firestore
+from firebase_admin import firestore_async
 
-from ..firebase_admin import get_db
+from ..firebase_admin import get_async_db
 from ..models.member import MemberRole, ProjectMember, ProjectMemberCreate
+from ..models.project import ProjectStatus
+from .aggregate_repository import (
+    AggregateRepository,
+    advisor_ratio_deltas,
+    unadvised_student_count,
+)
+from .cache import EntityCache, get_entity_cache
+from .hydration import HydrationMode, get_hydrator
+from .mirror import ResearchMirror, get_mirror
+from .project_repository import ProjectRepository
 
 
 class MemberRepository:
     """Repository for managing project members in Firestore."""
 
     COLLECTION = "project_members"
-
-    def __init__(self, db: Optional[firestore.Client] = None):
+    # Per-user index: user_projects/{user_id} = {"projects": {project_id: role}}
+    USER_INDEX_COLLECTION = "user_projects"
+    # Document in INDEX_STATE_COLLECTION written once the user index holds
+    # every membership
+    INDEX_STATE_COLLECTION = "index_state"
+    BATCH_LIMIT = 500  # Maximum number of writes in a Firestore batch
+    # Firestore accepts at most 30 values in an "in" filter
+    IN_QUERY_LIMIT = 30
+
+    def __init__(
+        self,
+        db: Optional[firestore_async.AsyncClient] = None,
+        cache: Optional[EntityCache] = None,
+        mirror: Optional[ResearchMirror] = None,
+        hydration: Optional[HydrationMode] = None,
+    ):
         """
         Initialize repository.
 
         Args:
             db: Optional Firestore client. If None, uses default.
+            cache: Optional cache of active members per project. If None,
+                uses the one shared by repositories of the same client.
+            mirror: Optional live replica to read from. If None, uses the
+                process-wide mirror whenever it is running.
+            hydration: How documents become models. If None, uses the
+                configured default.
         """
-        self.db = db or get_db()
-
-    def add_member(
+        self.db = db or get_async_db()
+        self.cache = cache or get_entity_cache(self.db, self.COLLECTION)
+        self._mirror = mirror
+        self.hydrator = get_hydrator(ProjectMember, hydration)
+        self.aggregates = AggregateRepository(self.db)
+        self._user_index_complete = False
+
+    @property
+    def mirror(self) -> Optional[ResearchMirror]:
+        """Live replica to read from, if one is running and ready."""
+        return get_mirror(self._mirror)
+
+    async def add_member(
         self, project_id: str, member_data: ProjectMemberCreate
     ) -> ProjectMember:
         """
@@ -48,11 +89,31 @@ class MemberRepository:
         # Use composite key: project_id#user_id
         doc_id = f"{project_id}#{member_data.user_id}"
         doc_ref = self.db.collection(self.COLLECTION).document(doc_id)
-        doc_ref.set(member.model_dump(mode="json"))
+        data = member.model_dump(mode="json")
+
+        @firestore_async.async_transactional
+        async def _add(transaction) -> None:
+            active = await self._is_active(project_id, transaction)
+            current = await self._active_members_by_user(project_id, transaction)
+            before = list(current.values())
+            current[member.user_id] = data
+
+            transaction.set(doc_ref, data)
+            transaction.set(
+                self._user_index_ref(member.user_id),
+                {"projects": {project_id: data["role"]}},
+                merge=True,
+            )
+            self._apply_member_deltas(
+                transaction, before, list(current.values()), active
+            )
+
+        await _add(self.db.transaction())
 
+        self.cache.invalidate(project_id)
         return member
 
-    def get_members(
+    async def get_members(
         self, project_id: str, role: Optional[MemberRole] = None
     ) -> List[ProjectMember]:
         """
@@ -65,31 +126,91 @@ class MemberRepository:
         Returns:
             List of project members
         """
-        query = self.db.collection(self.COLLECTION).where(
-            "project_id", "==", project_id
-        )
+        if self.mirror:
+            return _with_role(self.mirror.members.find("project", project_id), role)
 
-        if role:
-            query = query.where("role", "==", role.value)
+        members = self.cache.get(project_id)
 
-        # Filter out members who have left
-        query = query.where("left_at", "==", None)
+        if members is None:
+            # Load every active member so the entry serves all role filters
+            query = (
+                self.db.collection(self.COLLECTION)
+                .where("project_id", "==", project_id)
+                .where("left_at", "==", None)
+            )
+            members = self.hydrator.many(
+                [doc.to_dict() async for doc in query.stream()]
+            )
+            self.cache.set(project_id, members)
 
-        docs = query.stream()
+        return _with_role(members, role)
 
-        members = []
-        for doc in docs:
-            data = doc.to_dict()
-            members.append(ProjectMember(**data))
+    async def get_members_for_projects(
+        self, project_ids: List[str], role: Optional[MemberRole] = None
+    ) -> Dict[str, List[ProjectMember]]:
+        """
+        Get the active members of many projects at once.
 
-        return members
+        Projects whose members are cached are served from the cache; the rest
+        are loaded with one ``in`` query per chunk of ``IN_QUERY_LIMIT``
+        project IDs instead of one query per project.
+
+        Args:
+            project_ids: Project identifiers
+            role: Optional role filter
 
-    def get_projects_by_user(
+        Returns:
+            Mapping of project ID to its members. Every requested project is
+            present, with an empty list if it has no members.
+        """
+        if self.mirror:
+            return {
+                project_id: _with_role(
+                    self.mirror.members.find("project", project_id), role
+                )
+                for project_id in project_ids
+            }
+
+        members_by_project: Dict[str, List[ProjectMember]] = {}
+        missing = []
+        for project_id in dict.fromkeys(project_ids):
+            cached = self.cache.get(project_id)
+            if cached is not None:
+                members_by_project[project_id] = cached
+            else:
+                members_by_project[project_id] = []
+                missing.append(project_id)
+
+        for start in range(0, len(missing), self.IN_QUERY_LIMIT):
+            chunk = missing[start : start + self.IN_QUERY_LIMIT]
+            query = (
+                self.db.collection(self.COLLECTION)
+                .where("project_id", "in", chunk)
+                .where("left_at", "==", None)
+            )
+
+            docs = [doc.to_dict() async for doc in query.stream()]
+            for member in self.hydrator.many(docs):
+                members_by_project[member.project_id].append(member)
+
+            for project_id in chunk:
+                self.cache.set(project_id, members_by_project[project_id])
+
+        return {
+            project_id: _with_role(members, role)
+            for project_id, members in members_by_project.items()
+        }
+
+    async def get_projects_by_user(
         self, user_id: str, role: Optional[MemberRole] = None
     ) -> List[str]:
         """
         Get all project IDs for a user.
 
+        Reads the user's ``user_projects`` index document once
+        ``rebuild_user_index`` has backfilled the memberships written before
+        the index existed; until then, memberships are queried instead.
+
         Args:
             user_id: User identifier
             role: Optional role filter
@@ -97,6 +218,21 @@ class MemberRepository:
         Returns:
             List of project IDs
         """
+        if self.mirror:
+            return [
+                m.project_id
+                for m in _with_role(self.mirror.members.find("user", user_id), role)
+            ]
+
+        index = await self._user_index(user_id)
+        if index is not None:
+            projects = (index.get("projects") if index.exists else None) or {}
+            return sorted(
+                project_id
+                for project_id, project_role in projects.items()
+                if role is None or project_role == role.value
+            )
+
         query = self.db.collection(self.COLLECTION).where("user_id", "==", user_id)
 
         if role:
@@ -108,13 +244,13 @@ class MemberRepository:
         docs = query.stream()
 
         project_ids = []
-        for doc in docs:
+        async for doc in docs:
             data = doc.to_dict()
             project_ids.append(data["project_id"])
 
         return project_ids
 
-    def remove_member(self, project_id: str, user_id: str) -> bool:
+    async def remove_member(self, project_id: str, user_id: str) -> bool:
         """
         Remove a member from a project (soft delete).
 
@@ -127,16 +263,138 @@ class MemberRepository:
         """
         doc_id = f"{project_id}#{user_id}"
         doc_ref = self.db.collection(self.COLLECTION).document(doc_id)
-        doc = doc_ref.get()
 
-        if not doc.exists:
-            return False
+        @firestore_async.async_transactional
+        async def _remove(transaction) -> bool:
+            doc = await doc_ref.get(transaction=transaction)
+            if not doc.exists:
+                return False
+
+            active = await self._is_active(project_id, transaction)
+            current = await self._active_members_by_user(project_id, transaction)
+            before = list(current.values())
+            current.pop(user_id, None)
+
+            # Soft delete by setting left_at, stored like joined_at so the
+            # change queries can compare it
+            transaction.update(doc_ref, {"left_at": datetime.utcnow().isoformat()})
+            transaction.set(
+                self._user_index_ref(user_id),
+                {"projects": {project_id: firestore_async.DELETE_FIELD}},
+                merge=True,
+            )
+            self._apply_member_deltas(
+                transaction, before, list(current.values()), active
+            )
+            return True
+
+        removed = await _remove(self.db.transaction())
+        self.cache.invalidate(project_id)
+        return removed
 
-        # Soft delete by setting left_at
-        doc_ref.update({"left_at": datetime.utcnow()})
-        return True
+    async def _user_index(self, user_id: str):
+        """
+        Read a user's index document, or None while the index is incomplete.
+
+        The completion marker is read together with the index document until
+        it is seen once.
+        """
+        if self._user_index_complete:
+            return await self._user_index_ref(user_id).get()
+
+        marker, index = [
+            doc
+            async for doc in self.db.get_all(
+                [self._index_state_ref(), self._user_index_ref(user_id)]
+            )
+        ]
+        if not marker.exists:
+            return None
+        self._user_index_complete = True
+        return index
 
-    def has_advisor(self, project_id: str) -> bool:
+    async def rebuild_user_index(self) -> int:
+        """
+        Index every active membership in ``user_projects``.
+
+        One-off backfill for memberships created before the index existed;
+        afterwards ``add_member`` and ``remove_member`` keep it current.
+        Entries are merged into existing index documents, so memberships
+        added meanwhile are kept. Once every batch is committed the
+        completion marker is written and reads switch to the index.
+
+        Returns:
+            Number of users indexed
+        """
+        query = (
+            self.db.collection(self.COLLECTION)
+            .where("left_at", "==", None)
+            .select(["project_id", "user_id", "role"])
+        )
+        projects_by_user: Dict[str, Dict[str, str]] = defaultdict(dict)
+        async for doc in query.stream():
+            projects_by_user[doc.get("user_id")][doc.get("project_id")] = doc.get(
+                "role"
+            )
+
+        batch = self.db.batch()
+        for index, (user_id, projects) in enumerate(projects_by_user.items(), start=1):
+            batch.set(self._user_index_ref(user_id), {"projects": projects}, merge=True)
+            if index % self.BATCH_LIMIT == 0:
+                await batch.commit()
+                batch = self.db.batch()
+        await batch.commit()
+
+        await self._index_state_ref().set({"backfilled_at": datetime.utcnow()})
+        self._user_index_complete = True
+        return len(projects_by_user)
+
+    def _user_index_ref(self, user_id: str):
+        """Reference to a user's project index document."""
+        return self.db.collection(self.USER_INDEX_COLLECTION).document(user_id)
+
+    def _index_state_ref(self):
+        """Reference to the user index completion marker."""
+        return self.db.collection(self.INDEX_STATE_COLLECTION).document(
+            self.USER_INDEX_COLLECTION
+        )
+
+    async def _active_members_by_user(
+        self, project_id: str, transaction
+    ) -> Dict[str, dict]:
+        """Read a project's active memberships inside a transaction."""
+        query = (
+            self.db.collection(self.COLLECTION)
+            .where("project_id", "==", project_id)
+            .where("left_at", "==", None)
+        )
+        return {
+            doc.get("user_id"): doc.to_dict()
+            async for doc in query.stream(transaction=transaction)
+        }
+
+    async def _is_active(self, project_id: str, transaction) -> bool:
+        """Read whether a project is active inside a transaction."""
+        doc = (
+            await self.db.collection(ProjectRepository.COLLECTION)
+            .document(project_id)
+            .get(transaction=transaction)
+        )
+        return doc.exists and doc.get("status") == ProjectStatus.ACTIVE.value
+
+    def _apply_member_deltas(
+        self, transaction, before: List[dict], after: List[dict], active: bool
+    ) -> None:
+        """Queue the dashboard aggregate changes of a membership write."""
+        deltas = {
+            "students_without_advisor": unadvised_student_count(after)
+            - unadvised_student_count(before)
+        }
+        if active:
+            deltas.update(advisor_ratio_deltas(before, after))
+        self.aggregates.apply(transaction, deltas)
+
+    async def has_advisor(self, project_id: str) -> bool:
         """
         Check if a project has an advisor.
 
@@ -156,40 +414,129 @@ class MemberRepository:
             .limit(1)
         )
 
-        docs = list(query.stream())
+        docs = [doc async for doc in query.stream()]
         return len(docs) > 0
 
-    def get_students_without_advisor(self) -> List[str]:
+    async def list_advised_project_ids(
+        self, project_ids: Optional[List[str]] = None
+    ) -> Set[str]:
         """
-        Get list of student IDs who don't have an advisor.
+        Get the projects that currently have an advisor or co-advisor.
+
+        Args:
+            project_ids: Only consider these projects. If None, every project.
 
         Returns:
-            List of student user IDs
+            Set of project IDs
         """
-        # Get all students
-        student_query = (
+        advisor_roles = [MemberRole.ADVISOR.value, MemberRole.CO_ADVISOR.value]
+        if project_ids is not None:
+            members = await self.get_members_for_projects(project_ids)
+            return {
+                project_id
+                for project_id, project_members in members.items()
+                if any(m.role.value in advisor_roles for m in project_members)
+            }
+
+        if self.mirror:
+            return {
+                m.project_id
+                for m in self.mirror.members.all()
+                if m.role.value in advisor_roles
+            }
+
+        query = (
             self.db.collection(self.COLLECTION)
-            .where("role", "==", MemberRole.STUDENT.value)
             .where("left_at", "==", None)
+            .where("role", "in", advisor_roles)
+            .select(["project_id"])
         )
-        student_docs = student_query.stream()
+        return {doc.get("project_id") async for doc in query.stream()}
 
-        # Check which projects have no advisor
-        students_without_advisor = []
-        seen_projects = set()
+    async def list_changed_project_ids(self, since: datetime) -> List[str]:
+        """
+        List projects whose memberships changed since a point in time.
 
-        for doc in student_docs:
-            data = doc.to_dict()
-            project_id = data["project_id"]
-            user_id = data["user_id"]
+        Memberships are only ever joined or left, so the changes are the
+        memberships with ``joined_at`` or ``left_at`` at or after ``since``.
 
-            # Skip if we already checked this project
-            if project_id in seen_projects:
-                if not self.has_advisor(project_id):
-                    students_without_advisor.append(user_id)
-            else:
-                seen_projects.add(project_id)
-                if not self.has_advisor(project_id):
-                    students_without_advisor.append(user_id)
+        Args:
+            since: Include changes at or after this
+
+        Returns:
+            List of project IDs
+        """
+        collection = self.db.collection(self.COLLECTION)
+        project_ids: Set[str] = set()
+        for field in ("joined_at", "left_at"):
+            query = collection.where(field, ">=", since.isoformat()).select(
+                ["project_id"]
+            )
+            async for doc in query.stream():
+                project_ids.add(doc.get("project_id"))
+        return sorted(project_ids)
+
+    async def get_students_without_advisor(
+        self, project_ids: Optional[List[str]] = None
+    ) -> List[str]:
+        """
+        Get list of student IDs who don't have an advisor.
+
+        Scans active memberships once and groups them by project in memory,
+        so the check costs a single query regardless of how many students
+        or projects exist.
+
+        Args:
+            project_ids: Only check these projects. If None, checks all.
 
-        return students_without_advisor
+        Returns:
+            List of student user IDs
+        """
+        if project_ids is not None:
+            members_by_project = await self.get_members_for_projects(project_ids)
+            memberships = [
+                (m.project_id, m.user_id, m.role.value)
+                for members in members_by_project.values()
+                for m in members
+            ]
+        elif self.mirror:
+            memberships = [
+                (m.project_id, m.user_id, m.role.value)
+                for m in self.mirror.members.all()
+            ]
+        else:
+            query = (
+                self.db.collection(self.COLLECTION)
+                .where("left_at", "==", None)
+                .select(["project_id", "user_id", "role"])
+            )
+            memberships = [
+                (doc.get("project_id"), doc.get("user_id"), doc.get("role"))
+                async for doc in query.stream()
+            ]
+
+        advisor_roles = {MemberRole.ADVISOR.value, MemberRole.CO_ADVISOR.value}
+        students_by_project: Dict[str, List[str]] = defaultdict(list)
+        advised_projects: Set[str] = set()
+
+        for project_id, user_id, role in memberships:
+            if role == MemberRole.STUDENT.value:
+                students_by_project[project_id].append(user_id)
+            elif role in advisor_roles:
+                advised_projects.add(project_id)
+
+        return [
+            user_id
+            for project_id, student_ids in students_by_project.items()
+            if project_id not in advised_projects
+            for user_id in student_ids
+        ]
+
+
+def _with_role(
+    members: List[ProjectMember], role: Optional[MemberRole]
+) -> List[ProjectMember]:
+    """Copy cached members, keeping only those with ``role`` if given."""
+    return [
+        member.model_copy() for member in members if role is None or member.role == role
+    ]
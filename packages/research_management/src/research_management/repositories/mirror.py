@@ -0,0 +1,384 @@
+"""
+In-process replica of the research collections kept current by Firestore
+snapshot listeners.
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from datetime import datetime
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    Set,
+    TypeVar,
+)
+
+from pydantic import BaseModel
+
+from ..models.alert import Alert, AlertStatus
+from ..models.member import ProjectMember
+from ..models.project import ResearchProject
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class MirroredCollection(Generic[T]):
+    """
+    Replica of one collection (or query) with secondary indexes.
+
+    ``on_snapshot`` is the listener callback and runs on the listener's
+    thread; reads may happen concurrently from the event loop, so both sides
+    take the same lock. Returned models are copies.
+
+    A snapshot that cannot be applied leaves the replica out of step with
+    the listener, so the collection is marked failed until ``reset``.
+    """
+
+    def __init__(
+        self,
+        parse: Callable[[dict], T],
+        indexes: Optional[Dict[str, Callable[[T], Hashable]]] = None,
+    ):
+        """
+        Initialize the replica.
+
+        Args:
+            parse: Converts a document dict into a model
+            indexes: Mapping of index name to the function computing its key
+        """
+        self._parse = parse
+        self._index_keys = indexes or {}
+        self._items: Dict[str, T] = {}
+        self._indexes: Dict[str, Dict[Hashable, Set[str]]] = {
+            name: defaultdict(set) for name in self._index_keys
+        }
+        self._lock = threading.Lock()
+        self.ready = threading.Event()
+        self.failed = threading.Event()
+        self.last_event_at: Optional[datetime] = None
+        self.error: Optional[str] = None
+
+    def on_snapshot(self, docs, changes, read_time) -> None:
+        """
+        Apply the changes of a query snapshot.
+
+        The first snapshot reports every matching document as added, after
+        which the replica is marked ready.
+        """
+        if self.failed.is_set():
+            return
+        try:
+            with self._lock:
+                for change in changes:
+                    doc_id = change.document.id
+                    self._remove(doc_id)
+                    if change.type.name == "REMOVED":
+                        continue
+                    try:
+                        self._add(doc_id, self._parse(change.document.to_dict()))
+                    except ValueError:
+                        logger.exception("Skipping malformed document %s", doc_id)
+        except Exception as exc:
+            logger.exception("Mirror snapshot could not be applied")
+            self.fail(f"{type(exc).__name__}: {exc}")
+            return
+        self.last_event_at = datetime.utcnow()
+        self.ready.set()
+
+    def fail(self, error: str) -> None:
+        """
+        Stop serving reads until the replica is rebuilt.
+
+        Args:
+            error: Description of the failure
+        """
+        self.error = error
+        self.ready.clear()
+        self.failed.set()
+
+    def reset(self) -> None:
+        """Drop every document, ready to be fed by a new listener."""
+        with self._lock:
+            self._items.clear()
+            for index in self._indexes.values():
+                index.clear()
+            self.ready.clear()
+            self.failed.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Replica state reported by the health endpoint."""
+        return {
+            "ready": self.ready.is_set(),
+            "documents": len(self._items),
+            "last_event_at": (
+                self.last_event_at.isoformat() if self.last_event_at else None
+            ),
+            "error": self.error,
+        }
+
+    def _add(self, doc_id: str, item: T) -> None:
+        self._items[doc_id] = item
+        for name, key in self._index_keys.items():
+            self._indexes[name][key(item)].add(doc_id)
+
+    def _remove(self, doc_id: str) -> None:
+        item = self._items.pop(doc_id, None)
+        if item is None:
+            return
+        for name, key in self._index_keys.items():
+            ids = self._indexes[name][key(item)]
+            ids.discard(doc_id)
+            if not ids:
+                del self._indexes[name][key(item)]
+
+    def get(self, doc_id: str) -> Optional[T]:
+        """
+        Get a document by ID.
+
+        Args:
+            doc_id: Document ID
+
+        Returns:
+            Model if mirrored, None otherwise
+        """
+        with self._lock:
+            item = self._items.get(doc_id)
+        return item.model_copy() if item is not None else None
+
+    def find(self, index: str, key: Hashable) -> List[T]:
+        """
+        Get the documents whose index key matches.
+
+        Args:
+            index: Index name
+            key: Index key
+
+        Returns:
+            Matching models, ordered by document ID
+        """
+        with self._lock:
+            ids = sorted(self._indexes[index].get(key, ()))
+            items = [self._items[doc_id] for doc_id in ids]
+        return [item.model_copy() for item in items]
+
+    def all(self) -> List[T]:
+        """
+        Get every mirrored document.
+
+        Returns:
+            All models, ordered by document ID
+        """
+        with self._lock:
+            items = [self._items[doc_id] for doc_id in sorted(self._items)]
+        return [item.model_copy() for item in items]
+
+
+class ResearchMirror:
+    """
+    Live replica of research projects, active memberships and active alerts.
+
+    Listeners are attached with the synchronous Firestore client, which
+    delivers snapshots on background threads. Repositories read from the
+    mirror once every listener has delivered its first snapshot; freshness is
+    bounded by listener lag.
+
+    A listener whose stream ended, or whose snapshot could not be applied,
+    is detected by ``check``: its replica is dropped and a new listener is
+    attached, and reads go to Firestore until its first snapshot arrives.
+    """
+
+    def __init__(self, db=None):
+        """
+        Initialize mirror.
+
+        Args:
+            db: Optional synchronous Firestore client. If None, uses default.
+        """
+        self.db = db
+        self.projects: MirroredCollection[ResearchProject] = MirroredCollection(
+            lambda data: ResearchProject(**data),
+            {"status": lambda p: p.status.value},
+        )
+        self.members: MirroredCollection[ProjectMember] = MirroredCollection(
+            lambda data: ProjectMember(**data),
+            {"project": lambda m: m.project_id, "user": lambda m: m.user_id},
+        )
+        self.alerts: MirroredCollection[Alert] = MirroredCollection(
+            lambda data: Alert(**data),
+            {
+                "project": lambda a: a.project_id,
+                "user": lambda a: a.user_id,
+                "type": lambda a: a.type.value,
+            },
+        )
+        self._watches: Dict[str, Any] = {}
+        self._check_lock = threading.Lock()
+        self.restarts = 0
+
+    @property
+    def collections(self) -> Dict[str, MirroredCollection]:
+        """Mirrored collections by name."""
+        return {
+            "projects": self.projects,
+            "members": self.members,
+            "alerts": self.alerts,
+        }
+
+    @property
+    def ready(self) -> bool:
+        """Whether every listener has delivered its first snapshot."""
+        return all(
+            collection.ready.is_set() for collection in self.collections.values()
+        )
+
+    def start(self) -> None:
+        """Attach the snapshot listeners."""
+        self._watches = {name: self._listen(name) for name in self.collections}
+
+    def _listen(self, name: str):
+        """Attach the snapshot listener feeding one collection."""
+        # Imported here to avoid a cycle with the repository modules
+        from ..firebase_admin import get_db
+        from .alert_repository import AlertRepository
+        from .member_repository import MemberRepository
+        from .project_repository import ProjectRepository
+
+        db = self.db or get_db()
+        queries = {
+            "projects": db.collection(ProjectRepository.COLLECTION),
+            "members": db.collection(MemberRepository.COLLECTION).where(
+                "left_at", "==", None
+            ),
+            "alerts": db.collection(AlertRepository.COLLECTION).where(
+                "status", "==", AlertStatus.ACTIVE.value
+            ),
+        }
+        return queries[name].on_snapshot(self.collections[name].on_snapshot)
+
+    def check(self) -> bool:
+        """
+        Replace failed listeners and tell whether reads can be served.
+
+        Returns:
+            True if every listener is running and delivered its first snapshot
+        """
+        with self._check_lock:
+            for name, collection in self.collections.items():
+                watch = self._watches.get(name)
+                stopped = watch is not None and not watch.is_active
+                if not stopped and not collection.failed.is_set():
+                    continue
+
+                if stopped:
+                    logger.warning("Mirror listener for %s stopped", name)
+                    collection.error = "listener stopped"
+                if watch is not None:
+                    watch.unsubscribe()
+                collection.reset()
+                if watch is not None:
+                    self._watches[name] = self._listen(name)
+                self.restarts += 1
+        return self.ready
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the state of every listener.
+
+        Returns:
+            Mapping of collection name to its replica state, plus the number
+            of listeners replaced so far
+        """
+        stats: Dict[str, Any] = {}
+        for name, collection in self.collections.items():
+            watch = self._watches.get(name)
+            stats[name] = {
+                **collection.stats(),
+                "listening": watch is not None and watch.is_active,
+            }
+        stats["restarts"] = self.restarts
+        return stats
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every listener delivered its first snapshot.
+
+        Args:
+            timeout: Seconds to wait per listener, None to wait forever
+
+        Returns:
+            True if the mirror is ready
+        """
+        for collection in self.collections.values():
+            if not collection.ready.wait(timeout):
+                return False
+        return True
+
+    def stop(self) -> None:
+        """Detach the snapshot listeners."""
+        for watch in self._watches.values():
+            watch.unsubscribe()
+        self._watches = {}
+
+
+_mirror: Optional[ResearchMirror] = None
+
+
+def get_mirror(mirror: Optional[ResearchMirror] = None) -> Optional[ResearchMirror]:
+    """
+    Get a mirror to read from if its listeners are running and ready.
+
+    Args:
+        mirror: Mirror to check. If None, uses the process-wide mirror.
+
+    Returns:
+        Mirror to read from, or None to read from Firestore
+    """
+    mirror = mirror if mirror is not None else _mirror
+    if mirror is not None and mirror.check():
+        return mirror
+    return None
+
+
+def get_mirror_stats() -> Optional[Dict[str, Any]]:
+    """
+    Get the listener state of the process-wide mirror.
+
+    Returns:
+        Listener state, or None if the mirror is not running
+    """
+    return _mirror.stats() if _mirror is not None else None
+
+
+def start_mirror(db=None) -> ResearchMirror:
+    """
+    Start the process-wide mirror.
+
+    Args:
+        db: Optional synchronous Firestore client
+
+    Returns:
+        The started mirror
+    """
+    global _mirror
+
+    if _mirror is None:
+        _mirror = ResearchMirror(db)
+        _mirror.start()
+    return _mirror
+
+
+def stop_mirror() -> None:
+    """Stop the process-wide mirror, if running."""
+    global _mirror
+
+    if _mirror is not None:
+        _mirror.stop()
+        _mirror = None
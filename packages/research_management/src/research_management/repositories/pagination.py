@@ -0,0 +1,117 @@
+"""
+Keyset pagination helper shared by repositories.
+"""
+
+from typing import Callable, List, Optional, Sequence, Tuple, TypeVar
+
+from ..models.page import Page
+from ..utils import decode_cursor, encode_cursor
+
+T = TypeVar("T")
+
+# Order-by field that sorts by document ID
+DOCUMENT_ID = "__name__"
+
+
+async def fetch_page(
+    query,
+    order_by: Sequence[Tuple[str, str]],
+    parse_many: Callable[[List[dict]], List[T]],
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    select: Optional[Sequence[str]] = None,
+) -> Page[T]:
+    """
+    Run a query one page at a time using ``start_after`` on a stable ordering.
+
+    The ordering must end with a unique field (usually ``DOCUMENT_ID``) so
+    the cursor identifies exactly one position. One extra document is read to
+    know whether another page exists.
+
+    Args:
+        query: Firestore query with filters applied
+        order_by: ``(field, direction)`` pairs defining the ordering
+        parse_many: Converts the fetched document dicts into items, in one
+            call so the whole page can be validated at once
+        limit: Page size, None to stream everything
+        cursor: Cursor returned with the previous page
+        select: Field paths to fetch instead of whole documents. Order-by
+            fields other than ``DOCUMENT_ID`` are added automatically.
+
+    Returns:
+        Page of items with the cursor for the next page
+
+    Raises:
+        ValueError: If the cursor is malformed or does not match the ordering
+    """
+    fields = [field for field, _ in order_by]
+    if select is not None:
+        extra = [f for f in fields if f != DOCUMENT_ID and f not in select]
+        query = query.select([*select, *extra])
+    for field, direction in order_by:
+        query = query.order_by(field, direction=direction)
+
+    if cursor:
+        values = decode_cursor(cursor)
+        if len(values) != len(fields):
+            raise ValueError(f"Invalid cursor: {cursor}")
+        query = query.start_after(dict(zip(fields, values)))
+
+    if limit:
+        query = query.limit(limit + 1)
+
+    docs = []
+    last_values = None
+    has_more = False
+
+    async for doc in query.stream():
+        if limit and len(docs) == limit:
+            has_more = True
+            break
+
+        data = doc.to_dict()
+        docs.append(data)
+        last_values = [
+            doc.id if field == DOCUMENT_ID else data.get(field) for field in fields
+        ]
+
+    next_cursor = encode_cursor(last_values) if has_more else None
+    return Page(items=parse_many(docs), next_cursor=next_cursor)
+
+
+def page_from_items(
+    items: List[T],
+    key: Callable[[T], str],
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+) -> Page[T]:
+    """
+    Paginate items already in memory, ordered by document ID.
+
+    Cursors are interchangeable with those of ``fetch_page`` ordered by
+    ``DOCUMENT_ID`` alone.
+
+    Args:
+        items: Items to paginate
+        key: Returns the document ID of an item
+        limit: Page size, None for everything
+        cursor: Cursor returned with the previous page
+
+    Returns:
+        Page of items with the cursor for the next page
+
+    Raises:
+        ValueError: If the cursor is malformed or does not match the ordering
+    """
+    items = sorted(items, key=key)
+
+    if cursor:
+        values = decode_cursor(cursor)
+        if len(values) != 1:
+            raise ValueError(f"Invalid cursor: {cursor}")
+        items = [item for item in items if key(item) > values[0]]
+
+    if limit and len(items) > limit:
+        items = items[:limit]
+        return Page(items=items, next_cursor=encode_cursor([key(items[-1])]))
+    return Page(items=items, next_cursor=None)
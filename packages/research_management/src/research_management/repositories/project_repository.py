@@ -2,37 +2,104 @@
 Repository for research projects data access.
 """
 
+import asyncio
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
-from firebase_admin import firestore
+from firebase_admin import firestore_async
 
-from ..firebase_admin import get_db
+from ..firebase_admin import get_async_db
+from ..models.page import Page
 from ..models.project import (
     HealthStatus,
     ProjectCreate,
     ProjectStatus,
+    ProjectSummary,
     ProjectUpdate,
     ResearchProject,
 )
-from ..utils import generate_id
+from ..utils import generate_id, to_stored_datetime
+from .aggregate_repository import (
+    AggregateRepository,
+    advisor_ratio_deltas,
+    project_deltas,
+)
+from .cache import EntityCache, get_entity_cache
+from .counting import count_documents
+from .hydration import HydrationMode, get_hydrator
+from .mirror import ResearchMirror, get_mirror
+from .pagination import DOCUMENT_ID, fetch_page, page_from_items
+from .search_index import SearchIndex, get_search_index
+
+T = TypeVar("T")
 
 
 class ProjectRepository:
     """Repository for managing research projects in Firestore."""
 
     COLLECTION = "research_projects"
-
-    def __init__(self, db: Optional[firestore.Client] = None):
+    # MemberRepository.COLLECTION, read when a project enters or leaves the
+    # active status to move its members in the advisor ratio counters
+    MEMBERS_COLLECTION = "project_members"
+    SUMMARY_FIELDS = list(ProjectSummary.model_fields)
+    # Stored fields the health scoring reads
+    HEALTH_FIELDS = [
+        "project_id",
+        "health_status",
+        "created_at",
+        "last_update_at",
+        "expected_end_date",
+    ]
+    # Datetime fields, stored as ISO strings
+    DATE_FIELDS = [
+        "start_date",
+        "expected_end_date",
+        "actual_end_date",
+        "created_at",
+        "updated_at",
+        "last_update_at",
+    ]
+    BATCH_LIMIT = 500  # Maximum number of writes in a Firestore batch
+    # Transactions run at once by bulk writes
+    WRITE_CONCURRENCY = 50
+
+    def __init__(
+        self,
+        db: Optional[firestore_async.AsyncClient] = None,
+        cache: Optional[EntityCache] = None,
+        mirror: Optional[ResearchMirror] = None,
+        hydration: Optional[HydrationMode] = None,
+        search_index: Optional[SearchIndex] = None,
+    ):
         """
         Initialize repository.
 
         Args:
             db: Optional Firestore client. If None, uses default.
+            cache: Optional project cache. If None, uses the one shared by
+                repositories of the same client.
+            mirror: Optional live replica to read from. If None, uses the
+                process-wide mirror whenever it is running.
+            hydration: How documents become models. If None, uses the
+                configured default.
+            search_index: Optional full-text index kept current on writes.
+                If None, uses the one shared by repositories of the same
+                client.
         """
-        self.db = db or get_db()
-
-    def create(self, project_data: ProjectCreate) -> ResearchProject:
+        self.db = db or get_async_db()
+        self.cache = cache or get_entity_cache(self.db, self.COLLECTION)
+        self._mirror = mirror
+        self.hydrator = get_hydrator(ResearchProject, hydration)
+        self.summary_hydrator = get_hydrator(ProjectSummary, hydration)
+        self.aggregates = AggregateRepository(self.db)
+        self.search_index = search_index or get_search_index(self.db)
+
+    @property
+    def mirror(self) -> Optional[ResearchMirror]:
+        """Live replica to read from, if one is running and ready."""
+        return get_mirror(self._mirror)
+
+    async def create(self, project_data: ProjectCreate) -> ResearchProject:
         """
         Create a new research project.
 
@@ -58,13 +125,19 @@ class ProjectRepository:
             updated_at=now,
         )
 
-        # Save to Firestore
+        # Save to Firestore together with the dashboard counters
+        data = project.model_dump(mode="json")
         doc_ref = self.db.collection(self.COLLECTION).document(project_id)
-        doc_ref.set(project.model_dump(mode="json"))
+        batch = self.db.batch()
+        batch.set(doc_ref, data)
+        self.aggregates.apply(batch, project_deltas(None, data))
+        await batch.commit()
 
-        return project
+        self.cache.set(project_id, project)
+        self._index(project)
+        return project.model_copy()
 
-    def get(self, project_id: str) -> Optional[ResearchProject]:
+    async def get(self, project_id: str) -> Optional[ResearchProject]:
         """
         Get a project by ID.
 
@@ -74,34 +147,251 @@ class ProjectRepository:
         Returns:
             Project if found, None otherwise
         """
+        if self.mirror:
+            mirrored = self.mirror.projects.get(project_id)
+            if mirrored is not None:
+                return mirrored
+
+        cached = self.cache.get(project_id)
+        if cached is not None:
+            return cached.model_copy()
+
         doc_ref = self.db.collection(self.COLLECTION).document(project_id)
-        doc = doc_ref.get()
+        doc = await doc_ref.get()
 
         if not doc.exists:
             return None
 
-        data = doc.to_dict()
-        return ResearchProject(**data)
+        project = self.hydrator.one(doc.to_dict())
+        self.cache.set(project_id, project)
+        return project.model_copy()
 
-    def list(
+    async def get_many(self, project_ids: List[str]) -> List[ResearchProject]:
+        """
+        Get several projects in a single batched read.
+
+        Mirrored or cached projects are served from memory; only the rest
+        are read.
+
+        Args:
+            project_ids: Project identifiers
+
+        Returns:
+            Projects found, in the same order as ``project_ids``. Missing
+            projects are skipped.
+        """
+        if not project_ids:
+            return []
+
+        found = {}
+        missing = []
+        for project_id in dict.fromkeys(project_ids):
+            if self.mirror:
+                mirrored = self.mirror.projects.get(project_id)
+                if mirrored is not None:
+                    found[project_id] = mirrored
+                    continue
+
+            cached = self.cache.get(project_id)
+            if cached is not None:
+                found[project_id] = cached
+            else:
+                missing.append(project_id)
+
+        if missing:
+            collection = self.db.collection(self.COLLECTION)
+            refs = [collection.document(project_id) for project_id in missing]
+            async for doc in self.db.get_all(refs):
+                if doc.exists:
+                    found[doc.id] = self.hydrator.one(doc.to_dict())
+                    self.cache.set(doc.id, found[doc.id])
+
+        return [
+            found[project_id].model_copy()
+            for project_id in project_ids
+            if project_id in found
+        ]
+
+    async def get_summaries(self, project_ids: List[str]) -> List[ProjectSummary]:
+        """
+        Get summaries of several projects, fetching only the summary fields.
+
+        Args:
+            project_ids: Project identifiers
+
+        Returns:
+            Summaries found, in the same order as ``project_ids``. Missing
+            projects are skipped.
+        """
+        found: Dict[str, ProjectSummary] = {}
+        missing = []
+        for project_id in dict.fromkeys(project_ids):
+            project = (
+                self.mirror.projects.get(project_id) if self.mirror else None
+            ) or self.cache.get(project_id)
+            if project is not None:
+                found[project_id] = ProjectSummary.from_project(project)
+            else:
+                missing.append(project_id)
+
+        if missing:
+            collection = self.db.collection(self.COLLECTION)
+            refs = [collection.document(project_id) for project_id in missing]
+            async for doc in self.db.get_all(refs, field_paths=self.SUMMARY_FIELDS):
+                if doc.exists:
+                    found[doc.id] = self.summary_hydrator.one(doc.to_dict())
+
+        return [found[project_id] for project_id in project_ids if project_id in found]
+
+    async def list(
         self,
         status: Optional[ProjectStatus] = None,
         area: Optional[str] = None,
         health_status: Optional[HealthStatus] = None,
-        limit: int = 100,
-    ) -> List[ResearchProject]:
+        limit: Optional[int] = 100,
+        cursor: Optional[str] = None,
+    ) -> Page[ResearchProject]:
         """
-        List projects with optional filters.
+        List projects with optional filters, ordered by project ID.
 
         Args:
             status: Filter by project status
             area: Filter by research area
             health_status: Filter by health status
-            limit: Maximum number of results
+            limit: Maximum number of results, None for no limit
+            cursor: Cursor returned with the previous page
 
         Returns:
-            List of projects
+            Page of projects
+        """
+        return await self._list(
+            status,
+            area,
+            health_status,
+            limit,
+            cursor,
+            fields=None,
+            parse_many=self.hydrator.many,
+            convert=lambda project: project,
+        )
+
+    async def list_summaries(
+        self,
+        status: Optional[ProjectStatus] = None,
+        area: Optional[str] = None,
+        health_status: Optional[HealthStatus] = None,
+        limit: Optional[int] = 100,
+        cursor: Optional[str] = None,
+    ) -> Page[ProjectSummary]:
         """
+        List project summaries, fetching only the summary fields.
+
+        Args:
+            status: Filter by project status
+            area: Filter by research area
+            health_status: Filter by health status
+            limit: Maximum number of results, None for no limit
+            cursor: Cursor returned with the previous page
+
+        Returns:
+            Page of project summaries
+        """
+        return await self._list(
+            status,
+            area,
+            health_status,
+            limit,
+            cursor,
+            fields=self.SUMMARY_FIELDS,
+            parse_many=self.summary_hydrator.many,
+            convert=ProjectSummary.from_project,
+        )
+
+    async def list_fields(
+        self,
+        fields: List[str],
+        status: Optional[ProjectStatus] = None,
+        area: Optional[str] = None,
+        health_status: Optional[HealthStatus] = None,
+        limit: Optional[int] = 100,
+        cursor: Optional[str] = None,
+    ) -> Page[Dict]:
+        """
+        List projects as sparse dicts holding only the requested fields.
+
+        Args:
+            fields: Project fields to return; ``project_id`` is always included
+            status: Filter by project status
+            area: Filter by research area
+            health_status: Filter by health status
+            limit: Maximum number of results, None for no limit
+            cursor: Cursor returned with the previous page
+
+        Returns:
+            Page of partial project documents
+        """
+        selected = list(dict.fromkeys(["project_id", *fields]))
+        return await self._list(
+            status,
+            area,
+            health_status,
+            limit,
+            cursor,
+            fields=selected,
+            parse_many=lambda docs: docs,
+            convert=lambda project: project.model_dump(
+                mode="json", include=set(selected)
+            ),
+        )
+
+    async def _list(
+        self,
+        status: Optional[ProjectStatus],
+        area: Optional[str],
+        health_status: Optional[HealthStatus],
+        limit: Optional[int],
+        cursor: Optional[str],
+        fields: Optional[List[str]],
+        parse_many: Callable[[List[Dict]], List[T]],
+        convert: Callable[[ResearchProject], T],
+    ) -> Page[T]:
+        """
+        Run a filtered project listing.
+
+        Args:
+            status: Filter by project status
+            area: Filter by research area
+            health_status: Filter by health status
+            limit: Maximum number of results, None for no limit
+            cursor: Cursor returned with the previous page
+            fields: Fields to fetch, None for whole documents
+            parse_many: Builds the items from the fetched documents
+            convert: Builds an item from a mirrored project
+
+        Returns:
+            Page of items
+        """
+        if self.mirror:
+            projects = (
+                self.mirror.projects.find("status", status.value)
+                if status
+                else self.mirror.projects.all()
+            )
+            page = page_from_items(
+                [
+                    p
+                    for p in projects
+                    if (area is None or p.area == area)
+                    and (health_status is None or p.health_status == health_status)
+                ],
+                key=lambda p: p.project_id,
+                limit=limit,
+                cursor=cursor,
+            )
+            return Page(
+                items=[convert(p) for p in page.items], next_cursor=page.next_cursor
+            )
+
         query = self.db.collection(self.COLLECTION)
 
         if status:
@@ -111,17 +401,381 @@ class ProjectRepository:
         if health_status:
             query = query.where("health_status", "==", health_status.value)
 
-        query = query.limit(limit)
-        docs = query.stream()
+        return await fetch_page(
+            query,
+            order_by=[(DOCUMENT_ID, firestore_async.Query.ASCENDING)],
+            parse_many=parse_many,
+            limit=limit,
+            cursor=cursor,
+            select=fields,
+        )
+
+    async def list_ids(self, status: Optional[ProjectStatus] = None) -> List[str]:
+        """
+        List project IDs without loading the full documents.
+
+        Args:
+            status: Filter by project status
 
-        projects = []
-        for doc in docs:
-            data = doc.to_dict()
-            projects.append(ResearchProject(**data))
+        Returns:
+            List of project IDs
+        """
+        if self.mirror:
+            projects = (
+                self.mirror.projects.find("status", status.value)
+                if status
+                else self.mirror.projects.all()
+            )
+            return [p.project_id for p in projects]
 
-        return projects
+        query = self.db.collection(self.COLLECTION)
 
-    def update(
+        if status:
+            query = query.where("status", "==", status.value)
+
+        return [doc.id async for doc in query.select(["project_id"]).stream()]
+
+    async def count(
+        self,
+        status: Optional[ProjectStatus] = None,
+        health_status: Optional[HealthStatus] = None,
+    ) -> int:
+        """
+        Count projects with a server-side aggregation.
+
+        Args:
+            status: Filter by project status
+            health_status: Filter by health status
+
+        Returns:
+            Number of matching projects
+        """
+        if self.mirror:
+            projects = (
+                self.mirror.projects.find("status", status.value)
+                if status
+                else self.mirror.projects.all()
+            )
+            return sum(
+                1
+                for p in projects
+                if health_status is None or p.health_status == health_status
+            )
+
+        query = self.db.collection(self.COLLECTION)
+        if status:
+            query = query.where("status", "==", status.value)
+        if health_status:
+            query = query.where("health_status", "==", health_status.value)
+
+        return await count_documents(query)
+
+    async def count_by_status(self) -> Dict[str, int]:
+        """
+        Count projects per status, one aggregation per status in parallel.
+
+        Returns:
+            Mapping of status value to number of projects
+        """
+        counts = await asyncio.gather(
+            *(self.count(status=status) for status in ProjectStatus)
+        )
+        return {status.value: n for status, n in zip(ProjectStatus, counts)}
+
+    async def count_by_health(self) -> Dict[str, int]:
+        """
+        Count projects per health status, one aggregation per value in parallel.
+
+        Returns:
+            Mapping of health status value to number of projects
+        """
+        counts = await asyncio.gather(
+            *(self.count(health_status=health) for health in HealthStatus)
+        )
+        return {health.value: n for health, n in zip(HealthStatus, counts)}
+
+    async def count_by_area(
+        self, status: Optional[ProjectStatus] = None
+    ) -> Dict[str, int]:
+        """
+        Count projects per research area.
+
+        Areas are free text, so this reads the ``area`` field of each
+        matching project instead of running one aggregation per value.
+
+        Args:
+            status: Filter by project status
+
+        Returns:
+            Mapping of area to number of projects
+        """
+        if self.mirror:
+            projects = (
+                self.mirror.projects.find("status", status.value)
+                if status
+                else self.mirror.projects.all()
+            )
+            areas = [p.area for p in projects]
+        else:
+            query = self.db.collection(self.COLLECTION)
+            if status:
+                query = query.where("status", "==", status.value)
+            areas = [doc.get("area") async for doc in query.select(["area"]).stream()]
+
+        counts: Dict[str, int] = {}
+        for area in areas:
+            counts[area] = counts.get(area, 0) + 1
+        return counts
+
+    async def list_stale_ids(
+        self, cutoff: datetime, status: Optional[ProjectStatus] = None
+    ) -> List[str]:
+        """
+        List projects whose latest update is older than a cutoff.
+
+        Uses the ``last_update_at`` stamp written with each update, so this is
+        a range query plus a query for projects that never had an update,
+        instead of one query per project.
+
+        Args:
+            cutoff: Projects last updated before this are stale
+            status: Only return projects with this status
+
+        Returns:
+            List of project IDs, including projects without any update
+        """
+        collection = self.db.collection(self.COLLECTION)
+        if status is not None:
+            collection = collection.where("status", "==", status.value)
+        queries = [
+            collection.where("last_update_at", "<", cutoff.isoformat()),
+            collection.where("last_update_at", "==", None),
+        ]
+
+        results = await asyncio.gather(
+            *(_collect(query.select(["project_id"]).stream()) for query in queries)
+        )
+        return [doc.id for docs in results for doc in docs]
+
+    async def list_due_between(
+        self,
+        start: datetime,
+        end: datetime,
+        status: Optional[ProjectStatus] = None,
+    ) -> Dict[str, datetime]:
+        """
+        List the projects whose expected end date falls in a time window.
+
+        A single range query on ``expected_end_date``, backed by a composite
+        index when filtered by status.
+
+        Args:
+            start: Window start, inclusive
+            end: Window end, exclusive
+            status: Only return projects with this status
+
+        Returns:
+            Mapping of project ID to expected end date
+        """
+        query = self.db.collection(self.COLLECTION)
+        if status is not None:
+            query = query.where("status", "==", status.value)
+        query = query.where("expected_end_date", ">=", start.isoformat()).where(
+            "expected_end_date", "<", end.isoformat()
+        )
+        return {
+            doc.id: datetime.fromisoformat(doc.get("expected_end_date"))
+            async for doc in query.select(["expected_end_date"]).stream()
+        }
+
+    async def normalize_dates(self) -> int:
+        """
+        Rewrite datetime fields stored as Firestore timestamps as ISO strings.
+
+        One-off migration. Older releases stored project dates as timestamps,
+        which the string range queries on ``expected_end_date`` and
+        ``last_update_at`` do not match.
+
+        Returns:
+            Number of projects rewritten
+        """
+        query = self.db.collection(self.COLLECTION).select(self.DATE_FIELDS)
+        changes = {}
+        async for doc in query.stream():
+            fixed = {
+                field: to_stored_datetime(value)
+                for field, value in doc.to_dict().items()
+                if isinstance(value, datetime)
+            }
+            if fixed:
+                changes[doc.id] = fixed
+
+        items = list(changes.items())
+
+        async def _rewrite(chunk) -> None:
+            batch = self.db.batch()
+            for project_id, fixed in chunk:
+                batch.update(
+                    self.db.collection(self.COLLECTION).document(project_id), fixed
+                )
+            await batch.commit()
+
+        await asyncio.gather(
+            *(
+                _rewrite(items[start : start + self.BATCH_LIMIT])
+                for start in range(0, len(items), self.BATCH_LIMIT)
+            )
+        )
+        for project_id in changes:
+            self.cache.invalidate(project_id)
+        return len(items)
+
+    async def list_health_signals(
+        self,
+        status: Optional[ProjectStatus] = None,
+        project_ids: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        List the stored fields health scoring needs, for many projects.
+
+        Args:
+            status: Filter by project status
+            project_ids: Only these projects, read with one batched read. If
+                None, every project matching ``status``.
+
+        Returns:
+            List of ``HEALTH_FIELDS`` mappings with stored (ISO string) values
+        """
+        include = set(self.HEALTH_FIELDS)
+        if project_ids is not None:
+            return [
+                p.model_dump(mode="json", include=include)
+                for p in await self.get_many(project_ids)
+                if status is None or p.status == status
+            ]
+
+        if self.mirror:
+            projects = (
+                self.mirror.projects.find("status", status.value)
+                if status
+                else self.mirror.projects.all()
+            )
+            return [p.model_dump(mode="json", include=include) for p in projects]
+
+        query = self.db.collection(self.COLLECTION)
+        if status:
+            query = query.where("status", "==", status.value)
+
+        return [
+            doc.to_dict() async for doc in query.select(self.HEALTH_FIELDS).stream()
+        ]
+
+    async def set_health_statuses(
+        self, changes: Dict[str, Tuple[HealthStatus, HealthStatus]]
+    ) -> List[str]:
+        """
+        Write new health statuses for many projects.
+
+        Each project is written in its own transaction, and only while its
+        stored status is still the one the new status was computed from, so
+        a status set meanwhile (by a ``PUT``, for instance) is kept. The
+        dashboard counter changes of the projects written are summed and
+        applied once, rather than contending on the counters document per
+        project or per batch.
+
+        Args:
+            changes: Mapping of project ID to its (current, new) health status
+
+        Returns:
+            IDs of the projects written
+        """
+        now = datetime.utcnow().isoformat()
+        collection = self.db.collection(self.COLLECTION)
+
+        async def _set(project_id: str, old: HealthStatus, new: HealthStatus) -> bool:
+            doc_ref = collection.document(project_id)
+
+            @firestore_async.async_transactional
+            async def _update(transaction) -> bool:
+                doc = await doc_ref.get(transaction=transaction)
+                if not doc.exists or doc.get("health_status") != old.value:
+                    return False
+                transaction.update(
+                    doc_ref, {"health_status": new.value, "updated_at": now}
+                )
+                return True
+
+            return await _update(self.db.transaction())
+
+        items = list(changes.items())
+        written = []
+        for start in range(0, len(items), self.WRITE_CONCURRENCY):
+            chunk = items[start : start + self.WRITE_CONCURRENCY]
+            results = await asyncio.gather(
+                *(_set(project_id, old, new) for project_id, (old, new) in chunk)
+            )
+            written += [item for item, ok in zip(chunk, results) if ok]
+
+        deltas: Dict[str, int] = {}
+        for project_id, (old, new) in written:
+            self.cache.invalidate(project_id)
+            for path, delta in (
+                (f"health_counts.{old.value}", -1),
+                (f"health_counts.{new.value}", 1),
+            ):
+                deltas[path] = deltas.get(path, 0) + delta
+        if written:
+            batch = self.db.batch()
+            self.aggregates.apply(batch, deltas)
+            await batch.commit()
+
+        return [project_id for project_id, _ in written]
+
+    async def list_changed_ids(self, since: datetime) -> List[str]:
+        """
+        List projects written since a point in time.
+
+        Every project write (create, update, archive) bumps ``updated_at``.
+        Submitting an update only stamps ``last_update_at``; see
+        ``list_ids_last_updated_between``.
+
+        Args:
+            since: Include projects written at or after this
+
+        Returns:
+            List of project IDs
+        """
+        query = self.db.collection(self.COLLECTION).where(
+            "updated_at", ">=", since.isoformat()
+        )
+        return [doc.id async for doc in query.select(["project_id"]).stream()]
+
+    async def list_ids_last_updated_between(
+        self,
+        start: datetime,
+        end: Optional[datetime] = None,
+        status: Optional[ProjectStatus] = None,
+    ) -> List[str]:
+        """
+        List projects whose latest update falls in a time window.
+
+        Args:
+            start: Window start, inclusive
+            end: Window end, exclusive. If None, the window is open-ended.
+            status: Only return projects with this status
+
+        Returns:
+            List of project IDs
+        """
+        query = self.db.collection(self.COLLECTION)
+        if status is not None:
+            query = query.where("status", "==", status.value)
+        query = query.where("last_update_at", ">=", start.isoformat())
+        if end is not None:
+            query = query.where("last_update_at", "<", end.isoformat())
+        return [doc.id async for doc in query.select(["project_id"]).stream()]
+
+    async def update(
         self, project_id: str, update_data: ProjectUpdate
     ) -> Optional[ResearchProject]:
         """
@@ -135,22 +789,37 @@ class ProjectRepository:
             Updated project if found, None otherwise
         """
         doc_ref = self.db.collection(self.COLLECTION).document(project_id)
-        doc = doc_ref.get()
 
-        if not doc.exists:
+        # Only update non-None fields, stored the same way as on create
+        changes = update_data.model_dump(mode="json", exclude_none=True)
+        changes["updated_at"] = datetime.utcnow().isoformat()
+
+        @firestore_async.async_transactional
+        async def _update(transaction) -> Optional[Dict]:
+            doc = await doc_ref.get(transaction=transaction)
+            if not doc.exists:
+                return None
+
+            old = doc.to_dict()
+            new = {**old, **changes}
+            deltas = project_deltas(old, new)
+            deltas.update(await self._ratio_deltas(project_id, old, new, transaction))
+            transaction.update(doc_ref, changes)
+            self.aggregates.apply(transaction, deltas)
+            return new
+
+        # The merged document is what was written, so no re-read is needed
+        updated = await _update(self.db.transaction())
+        if updated is None:
+            self.cache.invalidate(project_id)
             return None
 
-        # Only update non-None fields
-        update_dict = update_data.model_dump(exclude_none=True)
-        update_dict["updated_at"] = datetime.utcnow()
-
-        doc_ref.update(update_dict)
-
-        # Fetch and return updated document
-        updated_doc = doc_ref.get()
-        return ResearchProject(**updated_doc.to_dict())
+        project = self.hydrator.one(updated)
+        self.cache.set(project_id, project)
+        self._index(project)
+        return project.model_copy()
 
-    def delete(self, project_id: str) -> bool:
+    async def delete(self, project_id: str) -> bool:
         """
         Delete (archive) a project.
 
@@ -161,21 +830,65 @@ class ProjectRepository:
             True if deleted, False if not found
         """
         doc_ref = self.db.collection(self.COLLECTION).document(project_id)
-        doc = doc_ref.get()
 
-        if not doc.exists:
-            return False
+        @firestore_async.async_transactional
+        async def _archive(transaction) -> bool:
+            doc = await doc_ref.get(transaction=transaction)
+            if not doc.exists:
+                return False
 
-        # Soft delete by marking as archived
-        doc_ref.update(
-            {
+            old = doc.to_dict()
+            changes = {
                 "status": ProjectStatus.ARCHIVED.value,
-                "updated_at": datetime.utcnow(),
+                "updated_at": datetime.utcnow().isoformat(),
             }
+            new = {**old, **changes}
+            deltas = project_deltas(old, new)
+            deltas.update(await self._ratio_deltas(project_id, old, new, transaction))
+
+            # Soft delete by marking as archived
+            transaction.update(doc_ref, changes)
+            self.aggregates.apply(transaction, deltas)
+            return True
+
+        archived = await _archive(self.db.transaction())
+        self.cache.invalidate(project_id)
+        self.search_index.remove_project(project_id)
+        return archived
+
+    async def _ratio_deltas(
+        self, project_id: str, old: Dict, new: Dict, transaction
+    ) -> Dict[str, int]:
+        """
+        Advisor ratio counter changes of a project entering or leaving the
+        active status, reading its members inside the transaction.
+        """
+        active = ProjectStatus.ACTIVE.value
+        was_active = old.get("status") == active
+        if was_active == (new.get("status") == active):
+            return {}
+
+        query = (
+            self.db.collection(self.MEMBERS_COLLECTION)
+            .where("project_id", "==", project_id)
+            .where("left_at", "==", None)
+            .select(["user_id", "role"])
         )
-        return True
-
-    def get_projects_by_advisor(self, advisor_id: str) -> List[ResearchProject]:
+        members = [doc.to_dict() async for doc in query.stream(transaction=transaction)]
+        if was_active:
+            return advisor_ratio_deltas(members, None)
+        return advisor_ratio_deltas(None, members)
+
+    def _index(self, project: ResearchProject) -> None:
+        """Keep the search index in line with a written project."""
+        if project.status == ProjectStatus.ARCHIVED:
+            self.search_index.remove_project(project.project_id)
+        else:
+            self.search_index.set_project(
+                project.project_id, project.title, project.description, project.area
+            )
+
+    async def get_projects_by_advisor(self, advisor_id: str) -> List[ResearchProject]:
         """
         Get all projects for a specific advisor.
 
@@ -190,3 +903,8 @@ class ProjectRepository:
         # Implementation depends on member repository
         # For now, return empty list - will be implemented in services layer
         return []
+
+
+async def _collect(stream) -> list:
+    """Drain an async document stream into a list."""
+    return [doc async for doc in stream]
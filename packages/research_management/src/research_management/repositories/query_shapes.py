@@ -0,0 +1,289 @@
+"""
+Runtime recording of Firestore query shapes and the composite indexes they
+need.
+
+A query's shape is its collection, filtered fields with their operators and
+its ordering, without the filter values. ``RecordingClient`` wraps the
+Firestore client used by the repositories and records the shape of every
+query it runs, so the index manifest can be derived from what the code
+actually issues.
+"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from pydantic import BaseModel, ConfigDict
+
+from .pagination import DOCUMENT_ID
+
+EQUALITY_OPERATORS = {"==", "in"}
+ARRAY_OPERATORS = {"array_contains", "array_contains_any"}
+INEQUALITY_OPERATORS = {"<", "<=", ">", ">=", "!=", "not-in", "not_in"}
+
+ASCENDING = "ASCENDING"
+
+
+class QueryShape(BaseModel):
+    """Collection, filters and ordering of a query, without values."""
+
+    collection: str
+    filters: Tuple[Tuple[str, str], ...] = ()
+    order_by: Tuple[Tuple[str, str], ...] = ()
+
+    model_config = ConfigDict(frozen=True)
+
+    def composite_index(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the composite index serving this shape.
+
+        Equality fields come first, then array-contains fields, then the
+        inequality and order-by fields in query order. Ordering by document
+        ID is implicit in every index and is left out.
+
+        Queries with only equality and array-contains filters need no
+        composite index: Firestore merges the single-field indexes.
+
+        Returns:
+            Index entry in ``firestore.indexes.json`` format, or None if the
+            automatic single-field indexes serve the query
+        """
+        orders = [(f, d) for f, d in self.order_by if f != DOCUMENT_ID]
+        inequality = [f for f, op in self.filters if op in INEQUALITY_OPERATORS]
+        if not orders and not inequality:
+            return None
+        ordered = {f for f, _ in orders}
+
+        # Inequality fields must lead the ordering; Firestore adds them
+        # ascending when the query does not order by them
+        orders = [
+            (f, ASCENDING) for f in dict.fromkeys(inequality) if f not in ordered
+        ] + orders
+        ordered = {f for f, _ in orders}
+
+        equality = sorted(
+            {
+                f
+                for f, op in self.filters
+                if op in EQUALITY_OPERATORS and f not in ordered
+            }
+        )
+        arrays = sorted({f for f, op in self.filters if op in ARRAY_OPERATORS})
+
+        fields = (
+            [{"fieldPath": f, "order": ASCENDING} for f in equality]
+            + [{"fieldPath": f, "arrayConfig": "CONTAINS"} for f in arrays]
+            + [{"fieldPath": f, "order": d} for f, d in orders]
+        )
+        if len(fields) < 2:
+            return None
+
+        return {
+            "collectionGroup": self.collection,
+            "queryScope": "COLLECTION",
+            "fields": fields,
+        }
+
+
+class QueryShapeRecorder:
+    """
+    Collects distinct query shapes, optionally appending each new one to a
+    JSON lines file so shapes survive restarts and can be merged across
+    instances.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        Initialize recorder.
+
+        Args:
+            path: Optional JSON lines file receiving each new shape. Shapes
+                already in the file are loaded.
+        """
+        self.path = Path(path) if path else None
+        self._shapes: Set[QueryShape] = set()
+        self._lock = threading.Lock()
+        if self.path is not None and self.path.exists():
+            self._shapes.update(load_shapes([self.path]))
+
+    def record(self, shape: QueryShape) -> None:
+        """
+        Record a query shape.
+
+        Args:
+            shape: Shape of an executed query
+        """
+        if shape in self._shapes:
+            return
+
+        with self._lock:
+            if shape in self._shapes:
+                return
+            self._shapes.add(shape)
+            if self.path is not None:
+                with self.path.open("a") as f:
+                    f.write(shape.model_dump_json() + "\n")
+
+    def shapes(self) -> List[QueryShape]:
+        """
+        Get the recorded shapes.
+
+        Returns:
+            Distinct shapes, sorted
+        """
+        return sorted(self._shapes, key=lambda s: s.model_dump_json())
+
+
+def load_shapes(paths: Iterable[Union[str, Path]]) -> List[QueryShape]:
+    """
+    Load shapes from JSON lines files written by ``QueryShapeRecorder``.
+
+    Args:
+        paths: Files to read
+
+    Returns:
+        Distinct shapes
+    """
+    shapes = set()
+    for path in paths:
+        for line in Path(path).read_text().splitlines():
+            if line.strip():
+                shapes.add(QueryShape.model_validate_json(line))
+    return sorted(shapes, key=lambda s: s.model_dump_json())
+
+
+def required_indexes(shapes: Iterable[QueryShape]) -> List[Dict[str, Any]]:
+    """
+    Get the distinct composite indexes a set of query shapes needs.
+
+    Args:
+        shapes: Query shapes
+
+    Returns:
+        Index entries in ``firestore.indexes.json`` format, sorted
+    """
+    indexes = {}
+    for shape in shapes:
+        index = shape.composite_index()
+        if index is not None:
+            indexes[json.dumps(index, sort_keys=True)] = index
+    return [indexes[key] for key in sorted(indexes)]
+
+
+class _RecordingQuery:
+    """Query proxy tracking filters and ordering, recording on execution."""
+
+    def __init__(
+        self,
+        query,
+        recorder: QueryShapeRecorder,
+        collection: str,
+        filters: Tuple[Tuple[str, str], ...] = (),
+        order_by: Tuple[Tuple[str, str], ...] = (),
+    ):
+        self._query = query
+        self._recorder = recorder
+        self._collection = collection
+        self._filters = filters
+        self._order_by = order_by
+
+    def _derive(self, query, filters=None, order_by=None) -> "_RecordingQuery":
+        return _RecordingQuery(
+            query,
+            self._recorder,
+            self._collection,
+            self._filters if filters is None else filters,
+            self._order_by if order_by is None else order_by,
+        )
+
+    def _record(self) -> None:
+        self._recorder.record(
+            QueryShape(
+                collection=self._collection,
+                filters=tuple(sorted(set(self._filters))),
+                order_by=self._order_by,
+            )
+        )
+
+    def where(self, *args, **kwargs) -> "_RecordingQuery":
+        if len(args) >= 2:
+            field, op = args[0], args[1]
+        else:
+            field = kwargs.get("field_path")
+            op = kwargs.get("op_string")
+            condition = kwargs.get("filter")
+            if condition is not None:
+                field = getattr(condition, "field_path", field)
+                op = getattr(condition, "op_string", op)
+        query = self._query.where(*args, **kwargs)
+        return self._derive(query, filters=(*self._filters, (field, op)))
+
+    def order_by(self, field: str, direction: str = ASCENDING, **kwargs):
+        query = self._query.order_by(field, direction=direction, **kwargs)
+        return self._derive(query, order_by=(*self._order_by, (field, direction)))
+
+    def select(self, *args, **kwargs) -> "_RecordingQuery":
+        return self._derive(self._query.select(*args, **kwargs))
+
+    def limit(self, *args, **kwargs) -> "_RecordingQuery":
+        return self._derive(self._query.limit(*args, **kwargs))
+
+    def start_after(self, *args, **kwargs) -> "_RecordingQuery":
+        return self._derive(self._query.start_after(*args, **kwargs))
+
+    def count(self, *args, **kwargs):
+        return _RecordingAggregation(self._query.count(*args, **kwargs), self)
+
+    def stream(self, *args, **kwargs):
+        self._record()
+        return self._query.stream(*args, **kwargs)
+
+    def get(self, *args, **kwargs):
+        self._record()
+        return self._query.get(*args, **kwargs)
+
+    def __getattr__(self, name: str):
+        return getattr(self._query, name)
+
+
+class _RecordingAggregation:
+    """Aggregation proxy recording the shape of its query on execution."""
+
+    def __init__(self, aggregation, query: _RecordingQuery):
+        self._aggregation = aggregation
+        self._query = query
+
+    def get(self, *args, **kwargs):
+        self._query._record()
+        return self._aggregation.get(*args, **kwargs)
+
+    def __getattr__(self, name: str):
+        return getattr(self._aggregation, name)
+
+
+class RecordingClient:
+    """
+    Firestore client proxy recording the shape of every query it runs.
+
+    Everything except ``collection`` is forwarded to the wrapped client, so
+    document reads, batches and transactions are unaffected.
+    """
+
+    def __init__(self, db, recorder: QueryShapeRecorder):
+        """
+        Wrap a client.
+
+        Args:
+            db: Firestore client
+            recorder: Recorder receiving the shapes
+        """
+        self._db = db
+        self.recorder = recorder
+
+    def collection(self, *path: str) -> _RecordingQuery:
+        """Get a collection whose queries are recorded."""
+        return _RecordingQuery(self._db.collection(*path), self.recorder, path[-1])
+
+    def __getattr__(self, name: str):
+        return getattr(self._db, name)
@@ -0,0 +1,113 @@
+"""
+Repository for background job leases and watermarks.
+"""
+
+from datetime import datetime, timedelta
+from typing import Optional
+
+from firebase_admin import firestore_async
+
+from ..firebase_admin import get_async_db
+
+
+class SchedulerRepository:
+    """
+    Repository for the state background jobs share across instances.
+
+    ``scheduler_leases/{job}`` holds the instance currently allowed to run a
+    job and until when; ``scheduler_watermarks/{job}`` holds the point up to
+    which the job has processed changes.
+    """
+
+    LEASES_COLLECTION = "scheduler_leases"
+    WATERMARKS_COLLECTION = "scheduler_watermarks"
+
+    def __init__(self, db: Optional[firestore_async.AsyncClient] = None):
+        """
+        Initialize repository.
+
+        Args:
+            db: Optional Firestore client. If None, uses default.
+        """
+        self.db = db or get_async_db()
+
+    async def acquire_lease(self, job: str, holder: str, ttl: timedelta) -> bool:
+        """
+        Acquire or renew the lease on a job.
+
+        The lease is taken in a transaction, so of several instances racing
+        for an expired lease exactly one wins.
+
+        Args:
+            job: Job name
+            holder: Identifier of the calling instance
+            ttl: How long the lease lasts without renewal
+
+        Returns:
+            True if ``holder`` holds the lease
+        """
+        doc_ref = self.db.collection(self.LEASES_COLLECTION).document(job)
+
+        @firestore_async.async_transactional
+        async def _acquire(transaction) -> bool:
+            doc = await doc_ref.get(transaction=transaction)
+            now = datetime.utcnow()
+            if doc.exists:
+                lease = doc.to_dict()
+                if (
+                    lease.get("holder") != holder
+                    and lease.get("expires_at", "") > now.isoformat()
+                ):
+                    return False
+
+            transaction.set(
+                doc_ref, {"holder": holder, "expires_at": (now + ttl).isoformat()}
+            )
+            return True
+
+        return await _acquire(self.db.transaction())
+
+    async def release_lease(self, job: str, holder: str) -> None:
+        """
+        Release a job's lease if ``holder`` holds it.
+
+        Args:
+            job: Job name
+            holder: Identifier of the calling instance
+        """
+        doc_ref = self.db.collection(self.LEASES_COLLECTION).document(job)
+
+        @firestore_async.async_transactional
+        async def _release(transaction) -> None:
+            doc = await doc_ref.get(transaction=transaction)
+            if doc.exists and doc.get("holder") == holder:
+                transaction.delete(doc_ref)
+
+        await _release(self.db.transaction())
+
+    async def get_watermark(self, job: str) -> Optional[datetime]:
+        """
+        Get the point up to which a job has processed changes.
+
+        Args:
+            job: Job name
+
+        Returns:
+            Watermark, or None if the job never completed
+        """
+        doc = await self.db.collection(self.WATERMARKS_COLLECTION).document(job).get()
+        if not doc.exists or not doc.get("watermark"):
+            return None
+        return datetime.fromisoformat(doc.get("watermark"))
+
+    async def set_watermark(self, job: str, watermark: datetime) -> None:
+        """
+        Persist the point up to which a job has processed changes.
+
+        Args:
+            job: Job name
+            watermark: New watermark
+        """
+        await self.db.collection(self.WATERMARKS_COLLECTION).document(job).set(
+            {"watermark": watermark.isoformat(), "updated_at": datetime.utcnow()}
+        )
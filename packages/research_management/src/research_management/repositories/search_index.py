@@ -0,0 +1,325 @@
+"""
+In-process full-text index over projects and their updates.
+
+Text is accent-folded and case-folded before tokenizing, so "avaliação"
+matches "avaliacao". Each project is one document made of its title, area,
+description and the content of its updates, with per-field weights, and
+results are ranked with BM25.
+"""
+
+import heapq
+import math
+import re
+import threading
+import time
+import unicodedata
+import weakref
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# Frequent Portuguese and English words that carry no meaning on their own
+STOPWORDS = frozenset(
+    {
+        "a", "o", "as", "os", "e", "de", "da", "do", "das", "dos", "em", "na",
+        "no", "nas", "nos", "um", "uma", "para", "por", "com", "que", "se",
+        "ao", "the", "of", "and", "in", "on", "for", "to", "with", "an",
+    }
+)  # fmt: skip
+
+
+# Combining diacritical marks left by NFKD decomposition of Latin letters
+COMBINING_MARKS = re.compile("[\u0300-\u036f]")
+
+
+def fold(text: str) -> str:
+    """
+    Strip accents and case from text.
+
+    Args:
+        text: Text to fold
+
+    Returns:
+        Folded text
+    """
+    return COMBINING_MARKS.sub("", unicodedata.normalize("NFKD", text)).casefold()
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    Split text into folded search terms, without stopwords.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        Terms in text order
+    """
+    if not text:
+        return []
+    return [t for t in TOKEN_PATTERN.findall(fold(text)) if t not in STOPWORDS]
+
+
+class SearchIndex:
+    """
+    Inverted index with BM25 ranking, updated one project or update at a time.
+
+    Writes and searches may come from different threads, so both take the
+    same lock. ``replace`` swaps in a full rebuild; writes made while a
+    rebuild was being read are replayed on top of it. ``synced_at`` records
+    the point in time up to which stored writes are reflected, so later
+    refreshes only need to read what was written since.
+    """
+
+    # Weight of one occurrence of a term in each field
+    FIELD_WEIGHTS = {"title": 3.0, "area": 2.0, "description": 1.0, "updates": 1.0}
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._lock = threading.Lock()
+        self._fields: Dict[str, Counter] = {}
+        self._updates: Dict[str, Dict[str, Counter]] = defaultdict(dict)
+        self._terms: Dict[str, Dict[str, float]] = {}
+        self._postings: Dict[str, Dict[str, float]] = defaultdict(dict)
+        self._lengths: Dict[str, float] = {}
+        self._total_length = 0.0
+        self._journal: Optional[List[Callable[[], None]]] = None
+        self.built_at: Optional[float] = None
+        self.synced_at: Optional[datetime] = None
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the index was built from the stored collections."""
+        return self.built_at is not None
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def set_project(
+        self,
+        project_id: str,
+        title: Optional[str],
+        description: Optional[str],
+        area: Optional[str],
+    ) -> None:
+        """
+        Index or re-index the fields of a project.
+
+        Args:
+            project_id: Project identifier
+            title: Project title
+            description: Project description
+            area: Research area
+        """
+        terms = self._field_terms(title, description, area)
+
+        def _apply() -> None:
+            self._fields[project_id] = terms
+            self._reindex(project_id)
+
+        self._write(_apply)
+
+    def remove_project(self, project_id: str) -> None:
+        """
+        Remove a project and its updates from the results.
+
+        Args:
+            project_id: Project identifier
+        """
+
+        def _apply() -> None:
+            self._fields.pop(project_id, None)
+            self._updates.pop(project_id, None)
+            self._reindex(project_id)
+
+        self._write(_apply)
+
+    def add_update(
+        self, project_id: str, update_id: str, content: Optional[str]
+    ) -> None:
+        """
+        Index the content of a project update.
+
+        Args:
+            project_id: Project the update belongs to
+            update_id: Update identifier
+            content: Update content
+        """
+        terms = self._content_terms(content)
+
+        def _apply() -> None:
+            self._updates[project_id][update_id] = terms
+            self._reindex(project_id)
+
+        self._write(_apply)
+
+    def begin_rebuild(self) -> None:
+        """Start recording writes to replay on the next ``replace``."""
+        with self._lock:
+            self._journal = []
+
+    def abort_rebuild(self) -> None:
+        """Stop recording writes after a rebuild failed."""
+        with self._lock:
+            self._journal = None
+
+    def replace(
+        self,
+        projects: Iterable[Tuple[str, Optional[str], Optional[str], Optional[str]]],
+        updates: Iterable[Tuple[str, str, Optional[str]]],
+        synced_at: Optional[datetime] = None,
+    ) -> None:
+        """
+        Replace the whole index with a rebuild.
+
+        Args:
+            projects: ``(project_id, title, description, area)`` of every
+                searchable project
+            updates: ``(project_id, update_id, content)`` of every update
+            synced_at: When the rebuild started reading
+        """
+        # Each project is indexed once, with all its updates
+        rebuilt = SearchIndex()
+        for project_id, title, description, area in projects:
+            rebuilt._fields[project_id] = self._field_terms(title, description, area)
+        for project_id, update_id, content in updates:
+            rebuilt._updates[project_id][update_id] = self._content_terms(content)
+        for project_id in rebuilt._fields:
+            rebuilt._reindex(project_id)
+
+        with self._lock:
+            self._fields = rebuilt._fields
+            self._updates = rebuilt._updates
+            self._terms = rebuilt._terms
+            self._postings = rebuilt._postings
+            self._lengths = rebuilt._lengths
+            self._total_length = rebuilt._total_length
+            for apply in self._journal or ():
+                apply()
+            self._journal = None
+            self.built_at = time.monotonic()
+            self.synced_at = synced_at
+
+    def mark_synced(self, synced_at: datetime) -> None:
+        """
+        Record that the stored writes up to a point in time are indexed.
+
+        Args:
+            synced_at: When the refresh that caught up started reading
+        """
+        with self._lock:
+            self.built_at = time.monotonic()
+            self.synced_at = synced_at
+
+    def search(self, query: str, limit: int = 20) -> List[Tuple[str, float]]:
+        """
+        Rank the projects matching a query.
+
+        Args:
+            query: Free text; every term contributes to the score
+            limit: Maximum number of results
+
+        Returns:
+            ``(project_id, score)`` pairs, best first
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        scores: Dict[str, float] = defaultdict(float)
+
+        with self._lock:
+            count = len(self._lengths)
+            # Without any indexed term nothing can match
+            if not count or self._total_length <= 0:
+                return []
+            # Length normalization is base + scale * length
+            base = self.K1 * (1 - self.B)
+            scale = self.K1 * self.B * count / self._total_length
+            lengths = self._lengths
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(
+                    1 + (count - len(postings) + 0.5) / (len(postings) + 0.5)
+                )
+                boost = idf * (self.K1 + 1)
+                for project_id, tf in postings.items():
+                    scores[project_id] += (
+                        boost * tf / (tf + base + scale * lengths[project_id])
+                    )
+
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+    def _field_terms(
+        self, title: Optional[str], description: Optional[str], area: Optional[str]
+    ) -> Counter:
+        """Weighted term frequencies of a project's own fields."""
+        terms = Counter()
+        for field, text in (
+            ("title", title),
+            ("description", description),
+            ("area", area),
+        ):
+            weight = self.FIELD_WEIGHTS[field]
+            for term in tokenize(text):
+                terms[term] += weight
+        return terms
+
+    def _content_terms(self, content: Optional[str]) -> Counter:
+        """Weighted term frequencies of an update's content."""
+        weight = self.FIELD_WEIGHTS["updates"]
+        return Counter(
+            {term: n * weight for term, n in Counter(tokenize(content)).items()}
+        )
+
+    def _write(self, apply: Callable[[], None]) -> None:
+        with self._lock:
+            apply()
+            if self._journal is not None:
+                self._journal.append(apply)
+
+    def _reindex(self, project_id: str) -> None:
+        """Recompute the postings of one project from its fields and updates."""
+        for term in self._terms.pop(project_id, {}):
+            postings = self._postings[term]
+            postings.pop(project_id, None)
+            if not postings:
+                del self._postings[term]
+        self._total_length -= self._lengths.pop(project_id, 0.0)
+
+        fields = self._fields.get(project_id)
+        if fields is None:
+            return
+
+        terms: Dict[str, float] = dict(fields)
+        for update_terms in self._updates.get(project_id, {}).values():
+            for term, weight in update_terms.items():
+                terms[term] = terms.get(term, 0.0) + weight
+
+        self._terms[project_id] = terms
+        for term, weight in terms.items():
+            self._postings[term][project_id] = weight
+        self._lengths[project_id] = sum(terms.values())
+        self._total_length += self._lengths[project_id]
+
+
+# Indexes are shared by every repository built on the same Firestore client
+_indexes: "weakref.WeakKeyDictionary[Any, SearchIndex]" = weakref.WeakKeyDictionary()
+
+
+def get_search_index(db) -> SearchIndex:
+    """
+    Get the search index of a Firestore client, creating it on first use.
+
+    Args:
+        db: Firestore client the indexed documents are read from
+
+    Returns:
+        Search index
+    """
+    if db not in _indexes:
+        _indexes[db] = SearchIndex()
+    return _indexes[db]
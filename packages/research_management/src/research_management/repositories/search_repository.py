@@ -0,0 +1,183 @@
+"""
+Repository for full-text search over projects and their updates.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from firebase_admin import firestore_async
+
+from ..config import get_settings
+from ..firebase_admin import get_async_db
+from ..models.project import ProjectStatus
+from .project_repository import ProjectRepository
+from .search_index import SearchIndex, get_search_index
+from .update_repository import UpdateRepository
+
+logger = logging.getLogger(__name__)
+
+
+class SearchRepository:
+    """
+    Repository answering text queries from the in-process search index.
+
+    The index is built from the stored projects and updates on the first
+    search. Writes made through the project and update repositories of this
+    process are indexed immediately; writes from other instances are picked
+    up once the index is older than ``search_index_ttl_seconds``, by a
+    refresh that runs in the background while the current index keeps
+    serving. A refresh only reads the projects (by ``updated_at``) and
+    updates (by ``timestamp``) written since the previous one.
+    """
+
+    PROJECT_FIELDS = ["title", "description", "area", "status"]
+    UPDATE_FIELDS = ["project_id", "content"]
+    # Writes are re-read this far behind the last refresh, so writes stamped
+    # just before it but committed after its queries are not missed.
+    # Re-indexing a document is idempotent.
+    SYNC_OVERLAP = timedelta(minutes=1)
+
+    def __init__(
+        self,
+        db: Optional[firestore_async.AsyncClient] = None,
+        index: Optional[SearchIndex] = None,
+    ):
+        """
+        Initialize repository.
+
+        Args:
+            db: Optional Firestore client. If None, uses default.
+            index: Optional search index. If None, uses the one shared by
+                repositories of the same client.
+        """
+        self.db = db or get_async_db()
+        self.index = index or get_search_index(self.db)
+        self.settings = get_settings()
+        self._refresh: Optional[asyncio.Task] = None
+
+    async def search(self, query: str, limit: int = 20) -> List[Tuple[str, float]]:
+        """
+        Rank the projects matching a text query.
+
+        Args:
+            query: Free text, matched without regard to accents or case
+            limit: Maximum number of results
+
+        Returns:
+            ``(project_id, score)`` pairs, best first
+        """
+        if not self.index.loaded:
+            await self._start_refresh()
+        elif (
+            time.monotonic() - self.index.built_at
+            > self.settings.search_index_ttl_seconds
+        ):
+            self._start_refresh()
+
+        return self.index.search(query, limit)
+
+    async def rebuild(self) -> int:
+        """
+        Rebuild the index from every stored project and update.
+
+        Archived projects are left out.
+
+        Returns:
+            Number of indexed projects
+        """
+        started = datetime.utcnow()
+        self.index.begin_rebuild()
+        try:
+            projects_query = self.db.collection(ProjectRepository.COLLECTION).select(
+                self.PROJECT_FIELDS
+            )
+            updates_query = self.db.collection(UpdateRepository.COLLECTION).select(
+                self.UPDATE_FIELDS
+            )
+            projects = [
+                (doc.id, doc.get("title"), doc.get("description"), doc.get("area"))
+                async for doc in projects_query.stream()
+                if doc.get("status") != ProjectStatus.ARCHIVED.value
+            ]
+            updates = [
+                (doc.get("project_id"), doc.id, doc.get("content"))
+                async for doc in updates_query.stream()
+            ]
+        except Exception:
+            self.index.abort_rebuild()
+            raise
+
+        # Tokenizing every document is CPU-bound; keep the event loop free
+        await asyncio.to_thread(self.index.replace, projects, updates, started)
+        return len(projects)
+
+    async def catch_up(self) -> int:
+        """
+        Index the projects and updates written since the last refresh.
+
+        Archived projects are removed from the index.
+
+        Returns:
+            Number of projects and updates read
+        """
+        started = datetime.utcnow()
+        since = (self.index.synced_at - self.SYNC_OVERLAP).isoformat()
+        projects_query = (
+            self.db.collection(ProjectRepository.COLLECTION)
+            .where("updated_at", ">=", since)
+            .select(self.PROJECT_FIELDS)
+        )
+        updates_query = (
+            self.db.collection(UpdateRepository.COLLECTION)
+            .where("timestamp", ">=", since)
+            .select(self.UPDATE_FIELDS)
+        )
+        projects = [doc async for doc in projects_query.stream()]
+        updates = [doc async for doc in updates_query.stream()]
+
+        def _apply() -> None:
+            for doc in projects:
+                if doc.get("status") == ProjectStatus.ARCHIVED.value:
+                    self.index.remove_project(doc.id)
+                else:
+                    self.index.set_project(
+                        doc.id,
+                        doc.get("title"),
+                        doc.get("description"),
+                        doc.get("area"),
+                    )
+            for doc in updates:
+                self.index.add_update(doc.get("project_id"), doc.id, doc.get("content"))
+
+        await asyncio.to_thread(_apply)
+        self.index.mark_synced(started)
+        return len(projects) + len(updates)
+
+    async def refresh(self) -> int:
+        """
+        Bring the index up to date with the stored collections.
+
+        The first refresh rebuilds the index; later ones catch up.
+
+        Returns:
+            Number of documents read
+        """
+        if self.index.synced_at is None:
+            return await self.rebuild()
+        return await self.catch_up()
+
+    def _start_refresh(self) -> asyncio.Task:
+        """Start a refresh unless one is running, and return it."""
+        if self._refresh is None or self._refresh.done():
+            self._refresh = asyncio.create_task(self.refresh())
+            self._refresh.add_done_callback(_log_failure)
+        return self._refresh
+
+
+def _log_failure(task: asyncio.Task) -> None:
+    """Log the error of a failed refresh."""
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Search index refresh failed", exc_info=task.exception())
@@ -0,0 +1,76 @@
+"""
+Repository for daily dashboard snapshots.
+"""
+
+from datetime import date
+from typing import Dict, List, Optional
+
+from firebase_admin import firestore_async
+
+from ..firebase_admin import get_async_db
+
+
+class SnapshotRepository:
+    """
+    Repository for the daily snapshots of the coordinator metrics.
+
+    ``dashboard_snapshots/{YYYY-MM-DD}`` holds one compact document per day,
+    with counters stored as parallel key and value arrays so a snapshot stays
+    small however many areas exist.
+    """
+
+    COLLECTION = "dashboard_snapshots"
+
+    def __init__(self, db: Optional[firestore_async.AsyncClient] = None):
+        """
+        Initialize repository.
+
+        Args:
+            db: Optional Firestore client. If None, uses default.
+        """
+        self.db = db or get_async_db()
+
+    def _ref(self, day: date):
+        return self.db.collection(self.COLLECTION).document(day.isoformat())
+
+    async def exists(self, day: date) -> bool:
+        """
+        Check whether a day already has a snapshot.
+
+        Args:
+            day: Snapshot day
+
+        Returns:
+            True if the snapshot exists
+        """
+        doc = await self._ref(day).get()
+        return doc.exists
+
+    async def put(self, day: date, data: Dict) -> None:
+        """
+        Store the snapshot of a day, replacing any earlier one.
+
+        Args:
+            day: Snapshot day
+            data: Snapshot fields
+        """
+        await self._ref(day).set({**data, "date": day.isoformat()})
+
+    async def list_range(self, start: date, end: date) -> List[Dict]:
+        """
+        Get the snapshots of a range of days, one document read per day.
+
+        Args:
+            start: First day, inclusive
+            end: Last day, inclusive
+
+        Returns:
+            Snapshots in date order; days without one are absent
+        """
+        query = (
+            self.db.collection(self.COLLECTION)
+            .where("date", ">=", start.isoformat())
+            .where("date", "<=", end.isoformat())
+            .order_by("date")
+        )
+        return [doc.to_dict() async for doc in query.stream()]
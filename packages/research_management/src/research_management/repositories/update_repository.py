@@ -3,30 +3,46 @@ Repository for project updates data access.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Optional
 
-from firebase_admin import firestore
+from firebase_admin import firestore_async
 
-from ..firebase_admin import get_db
+from ..firebase_admin import get_async_db
+from ..models.page import Page
 from ..models.update import ProjectUpdateCreate, ProjectUpdateModel
 from ..utils import generate_id
+from .cache import get_entity_cache
+from .hydration import HydrationMode, get_hydrator
+from .pagination import DOCUMENT_ID, fetch_page
+from .project_repository import ProjectRepository
+from .search_index import get_search_index
 
 
 class UpdateRepository:
     """Repository for managing project updates in Firestore."""
 
     COLLECTION = "project_updates"
+    BATCH_LIMIT = 500  # Maximum number of writes in a Firestore batch
 
-    def __init__(self, db: Optional[firestore.Client] = None):
+    def __init__(
+        self,
+        db: Optional[firestore_async.AsyncClient] = None,
+        hydration: Optional[HydrationMode] = None,
+    ):
         """
         Initialize repository.
 
         Args:
             db: Optional Firestore client. If None, uses default.
+            hydration: How documents become models. If None, uses the
+                configured default.
         """
-        self.db = db or get_db()
+        self.db = db or get_async_db()
+        self.hydrator = get_hydrator(ProjectUpdateModel, hydration)
+        self.project_cache = get_entity_cache(self.db, ProjectRepository.COLLECTION)
+        self.search_index = get_search_index(self.db)
 
-    def create(
+    async def create(
         self, project_id: str, user_id: str, update_data: ProjectUpdateCreate
     ) -> ProjectUpdateModel:
         """
@@ -52,42 +68,95 @@ class UpdateRepository:
             timestamp=datetime.utcnow(),
         )
 
-        # Save to Firestore
-        doc_ref = self.db.collection(self.COLLECTION).document(update_id)
-        doc_ref.set(update.model_dump(mode="json"))
+        # Save to Firestore, stamping the project in the same batch so stale
+        # projects can be found without querying their updates
+        data = update.model_dump(mode="json")
+        batch = self.db.batch()
+        batch.set(self.db.collection(self.COLLECTION).document(update_id), data)
+        batch.update(
+            self.db.collection(ProjectRepository.COLLECTION).document(project_id),
+            {
+                "last_update_at": data["timestamp"],
+                "update_count": firestore_async.Increment(1),
+            },
+        )
+        await batch.commit()
 
+        self.project_cache.invalidate(project_id)
+        self.search_index.add_update(project_id, update_id, update.content)
         return update
 
-    def get_by_project(
-        self, project_id: str, limit: int = 50
-    ) -> List[ProjectUpdateModel]:
+    async def backfill_project_stamps(self) -> int:
+        """
+        Stamp ``last_update_at`` and ``update_count`` onto projects created
+        before updates maintained them.
+
+        One-off migration; projects that already carry the stamp are skipped.
+
+        Returns:
+            Number of projects stamped
+        """
+        projects = self.db.collection(ProjectRepository.COLLECTION)
+        missing = [
+            doc.id
+            async for doc in projects.select(["last_update_at"]).stream()
+            if "last_update_at" not in doc.to_dict()
+        ]
+
+        batch = self.db.batch()
+        for index, project_id in enumerate(missing, start=1):
+            updates = self.db.collection(self.COLLECTION).where(
+                "project_id", "==", project_id
+            )
+            timestamps = [
+                doc.get("timestamp")
+                async for doc in updates.select(["timestamp"]).stream()
+            ]
+            batch.update(
+                projects.document(project_id),
+                {
+                    "last_update_at": max(timestamps, default=None),
+                    "update_count": len(timestamps),
+                },
+            )
+            if index % self.BATCH_LIMIT == 0:
+                await batch.commit()
+                batch = self.db.batch()
+        await batch.commit()
+
+        self.project_cache.clear()
+        return len(missing)
+
+    async def get_by_project(
+        self, project_id: str, limit: int = 50, cursor: Optional[str] = None
+    ) -> Page[ProjectUpdateModel]:
         """
         Get all updates for a project.
 
         Args:
             project_id: Project identifier
             limit: Maximum number of results
+            cursor: Cursor returned with the previous page
 
         Returns:
-            List of updates, sorted by timestamp descending
+            Page of updates, sorted by timestamp descending
         """
-        query = (
-            self.db.collection(self.COLLECTION)
-            .where("project_id", "==", project_id)
-            .order_by("timestamp", direction=firestore.Query.DESCENDING)
-            .limit(limit)
+        query = self.db.collection(self.COLLECTION).where(
+            "project_id", "==", project_id
         )
 
-        docs = query.stream()
-
-        updates = []
-        for doc in docs:
-            data = doc.to_dict()
-            updates.append(ProjectUpdateModel(**data))
-
-        return updates
+        return await fetch_page(
+            query,
+            order_by=[
+                ("timestamp", firestore_async.Query.DESCENDING),
+                (DOCUMENT_ID, firestore_async.Query.DESCENDING),
+            ],
+            parse_many=self.hydrator.many,
+            limit=limit,
+            cursor=cursor,
+        )
 
-    def get_latest_update(self, project_id: str) -> Optional[ProjectUpdateModel]:
+    async def get_latest_update(self, project_id: str) -> Optional[ProjectUpdateModel]:
         """
         Get the most recent update for a project.
 
@@ -97,10 +166,10 @@ class UpdateRepository:
         Returns:
             Latest update if found, None otherwise
         """
-        updates = self.get_by_project(project_id, limit=1)
-        return updates[0] if updates else None
+        updates = await self.get_by_project(project_id, limit=1)
+        return updates.items[0] if updates.items else None
 
-    def get_last_update_date(self, project_id: str) -> Optional[datetime]:
+    async def get_last_update_date(self, project_id: str) -> Optional[datetime]:
         """
         Get the timestamp of the last update for a project.
 
@@ -110,5 +179,5 @@ class UpdateRepository:
         Returns:
             Timestamp of last update, None if no updates
         """
-        latest = self.get_latest_update(project_id)
+        latest = await self.get_latest_update(project_id)
         return latest.timestamp if latest else None
@@ -2,8 +2,11 @@
 Services module for business logic.
 """
 
+from .alert_scheduler import AlertSweepScheduler
 from .alert_service import AlertService
 from .dashboard_service import DashboardService
+from .health_service import HealthService
+from .migration_service import MigrationService
 from .project_service import ProjectService
 from .update_service import UpdateService
 
@@ -12,4 +15,7 @@ __all__ = [
     "UpdateService",
     "AlertService",
     "DashboardService",
+    "AlertSweepScheduler",
+    "HealthService",
+    "MigrationService",
 ]
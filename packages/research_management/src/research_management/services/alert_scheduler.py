@@ -0,0 +1,157 @@
+"""
+Background scheduler running the alert sweeps.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from ..models.alert import Alert
+from ..models.project import HealthStatus
+from ..repositories.scheduler_repository import SchedulerRepository
+from ..utils import generate_id
+from .alert_service import AlertService
+from .dashboard_service import DashboardService
+from .health_service import HealthService
+
+logger = logging.getLogger(__name__)
+
+
+class AlertSweepScheduler:
+    """
+    Periodically runs the incremental alert sweeps on one instance, followed
+    by a health rescoring and the day's dashboard snapshot when the services
+    for them are given.
+
+    Health is rescored for the projects the sweep touched; every project is
+    rescored on the first sweep and then every ``full_rescore_seconds``, so
+    signals that change with time alone are picked up too.
+
+    Every instance runs the loop, but a sweep only happens on the instance
+    holding the job's lease, renewed on each tick and left to expire if the
+    instance dies. Each sweep covers the changes since the persisted
+    watermark, so its cost tracks churn rather than the number of projects
+    and students.
+    """
+
+    JOB = "alert_sweeps"
+    RESCORE_JOB = "health_rescore"
+    # Changes are re-read this far behind the watermark, so writes stamped
+    # just before a sweep but committed after its queries are not missed.
+    # Re-evaluating an entity is idempotent.
+    WATERMARK_OVERLAP = timedelta(minutes=1)
+
+    def __init__(
+        self,
+        alert_service: AlertService,
+        scheduler_repo: Optional[SchedulerRepository] = None,
+        interval_seconds: float = 3600.0,
+        health_service: Optional[HealthService] = None,
+        dashboard_service: Optional[DashboardService] = None,
+        full_rescore_seconds: float = 86400.0,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            alert_service: Service running the sweeps
+            scheduler_repo: Optional lease and watermark repository
+            interval_seconds: Seconds between sweeps
+            health_service: Optional service rescoring project health after
+                each sweep, so new alerts count towards it
+            dashboard_service: Optional service taking the daily snapshot on
+                the first sweep of each day
+            full_rescore_seconds: Seconds between health rescorings of every
+                active project
+        """
+        self.alert_service = alert_service
+        self.scheduler_repo = scheduler_repo or SchedulerRepository()
+        self.interval_seconds = interval_seconds
+        self.health_service = health_service
+        self.dashboard_service = dashboard_service
+        self.full_rescore_seconds = full_rescore_seconds
+        self.holder = f"{socket.gethostname()}-{os.getpid()}-{generate_id()}"
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def lease_ttl(self) -> timedelta:
+        """How long the lease survives a leader that stopped renewing it."""
+        return timedelta(seconds=self.interval_seconds * 2)
+
+    async def run_once(self, now: Optional[datetime] = None) -> Optional[List[Alert]]:
+        """
+        Run one sweep if this instance holds the lease.
+
+        Args:
+            now: End of the sweep window. If None, uses the current time.
+
+        Returns:
+            Created alerts, or None if another instance holds the lease
+        """
+        if not await self.scheduler_repo.acquire_lease(
+            self.JOB, self.holder, self.lease_ttl
+        ):
+            return None
+
+        now = now or datetime.utcnow()
+        watermark = await self.scheduler_repo.get_watermark(self.JOB)
+        since = watermark - self.WATERMARK_OVERLAP if watermark else None
+
+        alerts = await self.alert_service.sweep_changes(since, now)
+        if self.health_service is not None:
+            changed = await self._rescore(since, now, alerts)
+            if changed:
+                logger.info("Health rescoring changed %d projects", len(changed))
+        if self.dashboard_service is not None:
+            await self.dashboard_service.take_daily_snapshot(now.date())
+        await self.scheduler_repo.set_watermark(self.JOB, now)
+        return alerts
+
+    async def _rescore(
+        self, since: Optional[datetime], now: datetime, alerts: List[Alert]
+    ) -> Dict[str, HealthStatus]:
+        """Rescore the projects a sweep touched, or all when one is due."""
+        last_full = await self.scheduler_repo.get_watermark(self.RESCORE_JOB)
+        if (
+            since is None
+            or last_full is None
+            or now - last_full >= timedelta(seconds=self.full_rescore_seconds)
+        ):
+            changed = await self.health_service.rescore(now)
+            await self.scheduler_repo.set_watermark(self.RESCORE_JOB, now)
+            return changed
+
+        return await self.health_service.rescore_changes(
+            since, now, project_ids=[a.project_id for a in alerts if a.project_id]
+        )
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                alerts = await self.run_once()
+                if alerts:
+                    logger.info("Alert sweep created %d alerts", len(alerts))
+            except Exception:
+                logger.exception("Alert sweep failed")
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        """Start the sweep loop on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Stop the sweep loop and hand the lease over."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        await self.scheduler_repo.release_lease(self.JOB, self.holder)
@@ -2,12 +2,20 @@
 Service layer for alerts and monitoring.
 """
 
+import asyncio
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 from ..config import get_settings
-from ..models.alert import Alert, AlertCreate, AlertSeverity, AlertStatus, AlertType
-from ..repositories import AlertRepository, MemberRepository, UpdateRepository
+from ..models.alert import Alert, AlertCreate, AlertSeverity, AlertType
+from ..models.page import Page
+from ..models.project import ProjectStatus
+from ..repositories import (
+    AlertRepository,
+    MemberRepository,
+    ProjectRepository,
+    UpdateRepository,
+)
 
 
 class AlertService:
@@ -18,6 +26,7 @@ class AlertService:
         alert_repo: Optional[AlertRepository] = None,
         member_repo: Optional[MemberRepository] = None,
         update_repo: Optional[UpdateRepository] = None,
+        project_repo: Optional[ProjectRepository] = None,
     ):
         """
         Initialize service.
@@ -26,13 +35,15 @@ class AlertService:
             alert_repo: Optional alert repository
             member_repo: Optional member repository
             update_repo: Optional update repository
+            project_repo: Optional project repository
         """
         self.alert_repo = alert_repo or AlertRepository()
         self.member_repo = member_repo or MemberRepository()
         self.update_repo = update_repo or UpdateRepository()
+        self.project_repo = project_repo or ProjectRepository()
         self.settings = get_settings()
 
-    def create_alert(self, alert_data: AlertCreate) -> Alert:
+    async def create_alert(self, alert_data: AlertCreate) -> Optional[Alert]:
         """
         Create a new alert.
 
@@ -40,54 +51,75 @@ class AlertService:
             alert_data: Alert creation data
 
         Returns:
-            Created alert
+            Created alert, or None if an alert of the same type is already
+            open for its project or user
         """
-        return self.alert_repo.create(alert_data)
+        return await self.alert_repo.create_if_absent(alert_data)
 
-    def get_active_alerts(
+    async def get_active_alerts(
         self,
         alert_type: Optional[AlertType] = None,
         severity: Optional[AlertSeverity] = None,
-    ) -> List[Alert]:
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Page[Alert]:
         """
         Get all active alerts with optional filters.
 
         Args:
             alert_type: Filter by alert type
             severity: Filter by severity
+            limit: Maximum number of results, None for no limit
+            cursor: Cursor returned with the previous page
 
         Returns:
-            List of active alerts
+            Page of active alerts
         """
-        return self.alert_repo.get_active_alerts(
-            alert_type=alert_type, severity=severity
+        return await self.alert_repo.get_active_alerts(
+            alert_type=alert_type, severity=severity, limit=limit, cursor=cursor
         )
 
-    def get_project_alerts(self, project_id: str) -> List[Alert]:
+    async def get_project_alerts(
+        self,
+        project_id: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Page[Alert]:
         """
         Get all alerts for a specific project.
 
         Args:
             project_id: Project identifier
+            limit: Maximum number of results, None for no limit
+            cursor: Cursor returned with the previous page
 
         Returns:
-            List of alerts
+            Page of alerts
         """
-        return self.alert_repo.get_by_project(project_id)
+        return await self.alert_repo.get_by_project(
+            project_id, limit=limit, cursor=cursor
+        )
 
-    def get_user_alerts(self, user_id: str) -> List[Alert]:
+    async def get_user_alerts(
+        self,
+        user_id: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Page[Alert]:
         """
         Get all alerts for a specific user.
 
         Args:
             user_id: User identifier
+            limit: Maximum number of results, None for no limit
+            cursor: Cursor returned with the previous page
 
         Returns:
-            List of alerts
+            Page of alerts
         """
-        return self.alert_repo.get_by_user(user_id)
+        return await self.alert_repo.get_by_user(user_id, limit=limit, cursor=cursor)
 
-    def resolve_alert(self, alert_id: str) -> Optional[Alert]:
+    async def resolve_alert(self, alert_id: str) -> Optional[Alert]:
         """
         Mark an alert as resolved.
 
@@ -97,9 +129,9 @@ class AlertService:
         Returns:
             Updated alert if found, None otherwise
         """
-        return self.alert_repo.resolve(alert_id)
+        return await self.alert_repo.resolve(alert_id)
 
-    def dismiss_alert(self, alert_id: str) -> Optional[Alert]:
+    async def dismiss_alert(self, alert_id: str) -> Optional[Alert]:
         """
         Dismiss an alert.
 
@@ -109,75 +141,178 @@ class AlertService:
         Returns:
             Updated alert if found, None otherwise
         """
-        return self.alert_repo.dismiss(alert_id)
+        return await self.alert_repo.dismiss(alert_id)
 
-    def check_students_without_advisor(self) -> List[Alert]:
+    async def check_students_without_advisor(
+        self, project_ids: Optional[List[str]] = None
+    ) -> List[Alert]:
         """
         Check for students without advisors and create alerts.
 
+        Args:
+            project_ids: Only check students of these projects. If None,
+                checks every student.
+
         Returns:
             List of created alerts
         """
-        student_ids = self.member_repo.get_students_without_advisor()
-        alerts = []
-
-        for user_id in student_ids:
-            # Check if there's already an active alert for this user
-            existing_alerts = self.alert_repo.get_by_user(user_id)
-            has_active = any(
-                a.type == AlertType.NO_ADVISOR and a.status == AlertStatus.ACTIVE
-                for a in existing_alerts
+        student_ids = await self.member_repo.get_students_without_advisor(project_ids)
+
+        return await self._create_missing_alerts(
+            AlertCreate(
+                type=AlertType.NO_ADVISOR,
+                user_id=user_id,
+                message=f"🔴 CRITICAL: Student is without advisor for more than {self.settings.alert_no_advisor_days} days",
+                severity=AlertSeverity.CRITICAL,
             )
+            for user_id in student_ids
+        )
 
-            if not has_active:
-                alert_data = AlertCreate(
-                    type=AlertType.NO_ADVISOR,
-                    user_id=user_id,
-                    message=f"🔴 CRITICAL: Student is without advisor for more than {self.settings.alert_no_advisor_days} days",
-                    severity=AlertSeverity.CRITICAL,
-                )
-                alert = self.create_alert(alert_data)
-                alerts.append(alert)
-
-        return alerts
-
-    def check_projects_without_updates(self, project_ids: List[str]) -> List[Alert]:
+    async def check_projects_without_updates(
+        self, project_ids: Optional[List[str]] = None
+    ) -> List[Alert]:
         """
         Check for projects without recent updates and create alerts.
 
         Args:
-            project_ids: List of project IDs to check
+            project_ids: Project IDs to check; only the active ones can be
+                alerted on. If None, checks all active projects.
 
         Returns:
             List of created alerts
         """
-        alerts = []
         cutoff_date = datetime.utcnow() - timedelta(
             days=self.settings.alert_no_update_days
         )
 
-        for project_id in project_ids:
-            last_update_date = self.update_repo.get_last_update_date(project_id)
-
-            # Check if project hasn't been updated
-            needs_alert = last_update_date is None or last_update_date < cutoff_date
-
-            if needs_alert:
-                # Check if there's already an active alert
-                existing_alerts = self.alert_repo.get_by_project(project_id)
-                has_active = any(
-                    a.type == AlertType.NO_UPDATE and a.status == AlertStatus.ACTIVE
-                    for a in existing_alerts
-                )
-
-                if not has_active:
-                    alert_data = AlertCreate(
-                        type=AlertType.NO_UPDATE,
-                        project_id=project_id,
-                        message=f"🟡 WARNING: Project has not been updated in {self.settings.alert_no_update_days} days",
-                        severity=AlertSeverity.WARNING,
-                    )
-                    alert = self.create_alert(alert_data)
-                    alerts.append(alert)
-
-        return alerts
+        if project_ids is None:
+            stale_project_ids = await self.project_repo.list_stale_ids(
+                cutoff_date, status=ProjectStatus.ACTIVE
+            )
+        else:
+            # Read just these projects so the cost tracks len(project_ids)
+            stale_project_ids = [
+                p.project_id
+                for p in await self.project_repo.get_many(project_ids)
+                if p.status == ProjectStatus.ACTIVE
+                and (p.last_update_at is None or p.last_update_at < cutoff_date)
+            ]
+
+        return await self._create_missing_alerts(
+            AlertCreate(
+                type=AlertType.NO_UPDATE,
+                project_id=project_id,
+                message=f"🟡 WARNING: Project has not been updated in {self.settings.alert_no_update_days} days",
+                severity=AlertSeverity.WARNING,
+            )
+            for project_id in stale_project_ids
+        )
+
+    async def check_upcoming_deadlines(
+        self, now: Optional[datetime] = None
+    ) -> List[Alert]:
+        """
+        Check for active projects ending soon and create alerts.
+
+        Projects due within ``alert_deadline_warning_days`` are found with one
+        range query, however many projects exist. Each deadline is alerted
+        once: a resolved or dismissed alert is not raised again unless the
+        deadline moves.
+
+        Args:
+            now: Start of the warning window. If None, uses the current time.
+
+        Returns:
+            List of created alerts
+        """
+        now = now or datetime.utcnow()
+        due = await self.project_repo.list_due_between(
+            now,
+            now + timedelta(days=self.settings.alert_deadline_warning_days),
+            status=ProjectStatus.ACTIVE,
+        )
+
+        return await self._create_missing_alerts(
+            AlertCreate(
+                type=AlertType.DEADLINE_SOON,
+                project_id=project_id,
+                message=f"🟡 WARNING: Project deadline is within {self.settings.alert_deadline_warning_days} days",
+                severity=AlertSeverity.WARNING,
+                due_at=due_at,
+            )
+            for project_id, due_at in due.items()
+        )
+
+    async def sweep_changes(
+        self, since: Optional[datetime], now: Optional[datetime] = None
+    ) -> List[Alert]:
+        """
+        Run the alert sweeps over what changed since a watermark.
+
+        - Projects written since ``since`` may have become active or been
+          created without updates.
+        - Projects whose latest update crossed the no-update threshold
+          between ``since`` and ``now`` became stale by time alone.
+        - Projects whose memberships changed may have lost their advisor or
+          gained a student.
+
+        New updates only make projects fresh, so they need no re-evaluation.
+        Deadlines enter the warning window by time alone and are checked with
+        their single range query on every sweep, which also releases the open
+        keys of deadlines that have passed.
+
+        Args:
+            since: Watermark of the previous sweep. If None, sweeps everything.
+            now: End of the sweep window. If None, uses the current time.
+
+        Returns:
+            List of created alerts
+        """
+        now = now or datetime.utcnow()
+        await self.alert_repo.release_expired_keys(now)
+        if since is None:
+            return [
+                *await self.check_projects_without_updates(),
+                *await self.check_students_without_advisor(),
+                *await self.check_upcoming_deadlines(now),
+            ]
+
+        threshold = timedelta(days=self.settings.alert_no_update_days)
+        written, aged, member_projects = await asyncio.gather(
+            self.project_repo.list_changed_ids(since),
+            self.project_repo.list_ids_last_updated_between(
+                since - threshold, now - threshold, status=ProjectStatus.ACTIVE
+            ),
+            self.member_repo.list_changed_project_ids(since),
+        )
+
+        project_ids = list(dict.fromkeys([*written, *aged]))
+        return [
+            *(
+                await self.check_projects_without_updates(project_ids)
+                if project_ids
+                else []
+            ),
+            *(
+                await self.check_students_without_advisor(member_projects)
+                if member_projects
+                else []
+            ),
+            *await self.check_upcoming_deadlines(now),
+        ]
+
+    async def _create_missing_alerts(
+        self, candidates: Iterable[AlertCreate]
+    ) -> List[Alert]:
+        """
+        Create the candidate alerts that are not already open.
+
+        The whole sweep is flushed through ``AlertRepository.create_many``.
+
+        Args:
+            candidates: Alerts to create
+
+        Returns:
+            List of created alerts
+        """
+        return await self.alert_repo.create_many(candidates, if_absent=True)
@@ -2,16 +2,21 @@
 Service layer for coordinator dashboard and metrics.
 """
 
-from collections import defaultdict
+import asyncio
+from datetime import date, datetime
 from typing import Dict, List, Optional
 
 from ..models.member import MemberRole
 from ..models.project import HealthStatus, ProjectStatus
 from ..repositories import (
+    AggregateRepository,
     AlertRepository,
     MemberRepository,
     ProjectRepository,
+    SnapshotRepository,
 )
+from ..repositories.aggregate_repository import advisor_ratio_deltas
+from ..utils import compute_etag
 
 
 class DashboardService:
@@ -22,6 +27,8 @@ class DashboardService:
         project_repo: Optional[ProjectRepository] = None,
         member_repo: Optional[MemberRepository] = None,
         alert_repo: Optional[AlertRepository] = None,
+        aggregate_repo: Optional[AggregateRepository] = None,
+        snapshot_repo: Optional[SnapshotRepository] = None,
     ):
         """
         Initialize service.
@@ -30,108 +37,234 @@ class DashboardService:
             project_repo: Optional project repository
             member_repo: Optional member repository
             alert_repo: Optional alert repository
+            aggregate_repo: Optional dashboard aggregate repository
+            snapshot_repo: Optional daily snapshot repository
         """
         self.project_repo = project_repo or ProjectRepository()
         self.member_repo = member_repo or MemberRepository()
         self.alert_repo = alert_repo or AlertRepository()
+        self.aggregate_repo = aggregate_repo or AggregateRepository()
+        self.snapshot_repo = snapshot_repo or SnapshotRepository()
 
-    def get_coordinator_dashboard(self) -> Dict:
+    async def get_coordinator_dashboard(self) -> Dict:
         """
         Get dashboard metrics for coordinators.
 
+        Every metric comes from the materialized aggregate document, so the
+        dashboard costs a single document read. The aggregate is built from
+        a full scan the first time it is requested.
+
         Returns:
             Dictionary with dashboard metrics
         """
-        # Get all projects
-        all_projects = self.project_repo.list(limit=1000)
-
-        # Count by status
-        status_counts = defaultdict(int)
-        for project in all_projects:
-            status_counts[project.status.value] += 1
+        aggregate = await self.aggregate_repo.get()
+        if aggregate is None:
+            aggregate = await self.rebuild_coordinator_aggregate()
 
-        # Count by health
-        health_counts = defaultdict(int)
-        for project in all_projects:
-            health_counts[project.health_status.value] += 1
+        # Drop counters that went back to zero
+        status_counts = {
+            k: v for k, v in aggregate.get("status_counts", {}).items() if v
+        }
+        health_counts = {
+            k: v for k, v in aggregate.get("health_counts", {}).items() if v
+        }
 
         # Calculate completion rate
         completed = status_counts.get(ProjectStatus.COMPLETED.value, 0)
-        total_projects = len(all_projects)
+        total_projects = aggregate.get("total_projects", 0)
         completion_rate = (
             (completed / total_projects * 100) if total_projects > 0 else 0
         )
 
-        # Get active projects
-        active_projects = [p for p in all_projects if p.status == ProjectStatus.ACTIVE]
-
-        # Calculate average students per advisor
-        advisor_student_count = self._calculate_advisor_student_ratio(active_projects)
+        # Average students per advisor of active projects
+        advisors = sum(1 for n in aggregate.get("advisor_projects", {}).values() if n)
+        active_students = aggregate.get("active_students", 0)
+        advisor_student_count = (
+            round(active_students / advisors, 1) if advisors else 0.0
+        )
 
         # Count projects in risk
         at_risk = health_counts.get(HealthStatus.AT_RISK.value, 0)
         critical = health_counts.get(HealthStatus.CRITICAL.value, 0)
         projects_in_risk = at_risk + critical
 
-        # Get students without advisor
-        students_without_advisor = self.member_repo.get_students_without_advisor()
-
-        # Get active alerts
-        active_alerts = self.alert_repo.get_active_alerts()
-
         return {
             "total_projects": total_projects,
-            "active_projects": len(active_projects),
+            "active_projects": status_counts.get(ProjectStatus.ACTIVE.value, 0),
             "archived_projects": status_counts.get(ProjectStatus.ARCHIVED.value, 0),
             "completion_rate": round(completion_rate, 1),
             "avg_students_per_advisor": advisor_student_count,
             "projects_in_risk": projects_in_risk,
             "at_risk_count": at_risk,
             "critical_count": critical,
+            "students_without_advisor": aggregate.get("students_without_advisor", 0),
+            "active_alerts_count": aggregate.get("active_alerts_count", 0),
+            "status_breakdown": status_counts,
+            "health_breakdown": health_counts,
+        }
+
+    async def get_coordinator_etag(self) -> Optional[str]:
+        """
+        Get the entity tag of the coordinator dashboard without computing it.
+
+        Every write the dashboard depends on bumps the aggregate's version,
+        so the tag costs a single document read.
+
+        Returns:
+            Entity tag, or None if the aggregate was never built
+        """
+        aggregate = await self.aggregate_repo.get()
+        if aggregate is None:
+            return None
+        return compute_etag(
+            "coordinator", aggregate.get("rebuilt_at"), aggregate.get("version", 0)
+        )
+
+    async def rebuild_coordinator_aggregate(self) -> Dict:
+        """
+        Recompute the coordinator aggregate and store it.
+
+        Status, health and alert counts come from server-side ``count()``
+        aggregations run in parallel; the unadvised-student check scans
+        memberships, and the advisor ratio counters read the members of
+        active projects. Used to bootstrap the aggregate on existing data;
+        afterwards the repositories keep it current on every write.
+
+        Returns:
+            Freshly computed aggregate counters
+        """
+        (
+            status_counts,
+            health_counts,
+            students_without_advisor,
+            active_alerts_count,
+            ratio_counts,
+        ) = await asyncio.gather(
+            self.project_repo.count_by_status(),
+            self.project_repo.count_by_health(),
+            self.member_repo.get_students_without_advisor(),
+            self.alert_repo.count_active(),
+            self._count_advisor_ratio(),
+        )
+
+        aggregate = {
+            "total_projects": sum(status_counts.values()),
+            "status_counts": {k: v for k, v in status_counts.items() if v},
+            "health_counts": {k: v for k, v in health_counts.items() if v},
             "students_without_advisor": len(students_without_advisor),
-            "active_alerts_count": len(active_alerts),
-            "status_breakdown": dict(status_counts),
-            "health_breakdown": dict(health_counts),
+            "active_alerts_count": active_alerts_count,
+            "active_students": ratio_counts.pop("active_students", 0),
+            "advisor_projects": {
+                path.split(".", 1)[1]: n for path, n in ratio_counts.items()
+            },
         }
+        await self.aggregate_repo.replace(aggregate)
+
+        return aggregate
 
-    def _calculate_advisor_student_ratio(self, projects: List) -> float:
+    async def take_daily_snapshot(self, day: Optional[date] = None) -> Optional[Dict]:
         """
-        Calculate average number of students per advisor.
+        Store the coordinator metrics of a day, once.
+
+        Status, health and alert counts come from the aggregate; the area
+        breakdown of active projects reads their ``area`` field.
 
         Args:
-            projects: List of projects to analyze
+            day: Snapshot day. If None, uses the current UTC date.
 
         Returns:
-            Average students per advisor
+            Stored snapshot, or None if the day already had one
         """
-        advisor_counts = defaultdict(int)
-        total_students = 0
+        day = day or datetime.utcnow().date()
+        if await self.snapshot_repo.exists(day):
+            return None
 
-        for project in projects:
-            members = self.member_repo.get_members(project.project_id)
+        aggregate, area_counts = await asyncio.gather(
+            self.aggregate_repo.get(),
+            self.project_repo.count_by_area(status=ProjectStatus.ACTIVE),
+        )
+        if aggregate is None:
+            aggregate = await self.rebuild_coordinator_aggregate()
+
+        status_counts = aggregate.get("status_counts", {})
+        health_counts = aggregate.get("health_counts", {})
+        areas = sorted(area_counts)
+        snapshot = {
+            "statuses": [s.value for s in ProjectStatus],
+            "status_counts": [status_counts.get(s.value, 0) for s in ProjectStatus],
+            "healths": [h.value for h in HealthStatus],
+            "health_counts": [health_counts.get(h.value, 0) for h in HealthStatus],
+            "areas": areas,
+            "area_counts": [area_counts[a] for a in areas],
+            "total_projects": aggregate.get("total_projects", 0),
+            "active_alerts_count": aggregate.get("active_alerts_count", 0),
+            "students_without_advisor": aggregate.get("students_without_advisor", 0),
+            "taken_at": datetime.utcnow().isoformat(),
+        }
+        await self.snapshot_repo.put(day, snapshot)
+        return {**snapshot, "date": day.isoformat()}
+
+    async def get_coordinator_trends(self, start: date, end: date) -> Dict:
+        """
+        Get the coordinator metrics of each day in a range.
+
+        Reads one snapshot document per day, however many projects exist.
+
+        Args:
+            start: First day, inclusive
+            end: Last day, inclusive
 
-            # Count advisors
-            advisors = [
-                m
-                for m in members
-                if m.role in [MemberRole.ADVISOR, MemberRole.CO_ADVISOR]
+        Returns:
+            Dictionary with the snapshot dates and, per metric, one value
+            per date (0 where a snapshot lacks the key)
+        """
+        snapshots = await self.snapshot_repo.list_range(start, end)
+
+        def series(keys_field: str, counts_field: str) -> Dict[str, List[int]]:
+            keys = dict.fromkeys(k for s in snapshots for k in s.get(keys_field, []))
+            rows = [
+                dict(zip(s.get(keys_field, []), s.get(counts_field, [])))
+                for s in snapshots
             ]
+            return {key: [row.get(key, 0) for row in rows] for key in keys}
 
-            # Count students
-            students = [m for m in members if m.role == MemberRole.STUDENT]
-            total_students += len(students)
+        def totals(field: str) -> List[int]:
+            return [s.get(field, 0) for s in snapshots]
 
-            # Track students per advisor
-            for advisor in advisors:
-                advisor_counts[advisor.user_id] += len(students)
+        return {
+            "from": start.isoformat(),
+            "to": end.isoformat(),
+            "dates": [s["date"] for s in snapshots],
+            "total_projects": totals("total_projects"),
+            "active_alerts_count": totals("active_alerts_count"),
+            "students_without_advisor": totals("students_without_advisor"),
+            "status_counts": series("statuses", "status_counts"),
+            "health_counts": series("healths", "health_counts"),
+            "area_counts": series("areas", "area_counts"),
+        }
 
-        total_advisors = len(advisor_counts)
-        if total_advisors == 0:
-            return 0.0
+    async def _count_advisor_ratio(self) -> Dict[str, int]:
+        """
+        Count the advisor ratio counters of the active projects.
 
-        return round(total_students / total_advisors, 1)
+        Returns:
+            Mapping of dotted counter path to count, as kept by
+            ``advisor_ratio_deltas``
+        """
+        project_ids = await self.project_repo.list_ids(status=ProjectStatus.ACTIVE)
+        members_by_project = await self.member_repo.get_members_for_projects(
+            project_ids
+        )
+        return advisor_ratio_deltas(
+            None,
+            (
+                {"user_id": member.user_id, "role": member.role.value}
+                for members in members_by_project.values()
+                for member in members
+            ),
+        )
 
-    def get_advisor_dashboard(self, advisor_id: str) -> Dict:
+    async def get_advisor_dashboard(self, advisor_id: str) -> Dict:
         """
         Get dashboard metrics for a specific advisor.
 
@@ -142,34 +275,32 @@ class DashboardService:
             Dictionary with advisor-specific metrics
         """
         # Get advisor's projects
-        project_ids = self.member_repo.get_projects_by_user(
+        project_ids = await self.member_repo.get_projects_by_user(
             advisor_id, role=MemberRole.ADVISOR
         )
 
-        projects = []
-        for project_id in project_ids:
-            project = self.project_repo.get(project_id)
-            if project:
-                projects.append(project)
+        # Load projects, students and alerts concurrently
+        projects, students_by_project, alerts_by_project = await asyncio.gather(
+            self.project_repo.get_summaries(project_ids),
+            self.member_repo.get_members_for_projects(
+                project_ids, role=MemberRole.STUDENT
+            ),
+            self.alert_repo.get_active_for_projects(project_ids),
+        )
 
         # Count active projects
         active_projects = [p for p in projects if p.status == ProjectStatus.ACTIVE]
 
         # Count total students
-        total_students = 0
-        for project in projects:
-            students = self.member_repo.get_members(
-                project.project_id, role=MemberRole.STUDENT
-            )
-            total_students += len(students)
+        found_ids = {p.project_id for p in projects}
+        total_students = sum(
+            len(students_by_project[project_id]) for project_id in found_ids
+        )
 
         # Get alerts for advisor's projects
-        alerts = []
-        for project_id in project_ids:
-            project_alerts = self.alert_repo.get_by_project(project_id)
-            alerts.extend(project_alerts)
-
-        active_alerts = [a for a in alerts if a.status.value == "active"]
+        active_alerts = [
+            a for project_alerts in alerts_by_project.values() for a in project_alerts
+        ]
 
         return {
             "total_projects": len(projects),
@@ -187,7 +318,7 @@ class DashboardService:
             ],
         }
 
-    def get_student_dashboard(self, student_id: str) -> Dict:
+    async def get_student_dashboard(self, student_id: str) -> Dict:
         """
         Get dashboard metrics for a specific student.
 
@@ -198,7 +329,7 @@ class DashboardService:
             Dictionary with student-specific metrics
         """
         # Get student's projects
-        project_ids = self.member_repo.get_projects_by_user(
+        project_ids = await self.member_repo.get_projects_by_user(
             student_id, role=MemberRole.STUDENT
         )
 
@@ -208,13 +339,18 @@ class DashboardService:
                 "message": "No active project found",
             }
 
+        # Load projects, members and alerts concurrently
+        projects, members_by_project, alerts_by_project = await asyncio.gather(
+            self.project_repo.get_summaries(project_ids),
+            self.member_repo.get_members_for_projects(project_ids),
+            self.alert_repo.get_active_for_projects(project_ids),
+        )
+
         # Get the first active project
-        project = None
-        for project_id in project_ids:
-            p = self.project_repo.get(project_id)
-            if p and p.status == ProjectStatus.ACTIVE:
-                project = p
-                break
+        project = next(
+            (p for p in projects if p.status == ProjectStatus.ACTIVE),
+            None,
+        )
 
         if not project:
             return {
@@ -223,14 +359,13 @@ class DashboardService:
             }
 
         # Get project members
-        members = self.member_repo.get_members(project.project_id)
+        members = members_by_project[project.project_id]
         advisors = [
             m for m in members if m.role in [MemberRole.ADVISOR, MemberRole.CO_ADVISOR]
         ]
 
         # Get alerts for this project
-        alerts = self.alert_repo.get_by_project(project.project_id)
-        active_alerts = [a for a in alerts if a.status.value == "active"]
+        active_alerts = alerts_by_project[project.project_id]
 
         return {
             "has_project": True,
@@ -0,0 +1,192 @@
+"""
+Health status scoring for whole project populations.
+
+Each project scores points for the risk signals it shows, and the total maps
+to a health status. With NumPy installed (``pip install -e ".[scoring]"``)
+the signals are loaded into columnar arrays and the population is scored in
+one vectorized pass; without it the same rules are applied per project.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Set, Union
+
+from ..models.project import HealthStatus
+from ..utils import to_stored_datetime
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional
+    np = None
+
+
+def _timestamp(value: Union[str, datetime, None]) -> str:
+    """Stored ISO datetime truncated to seconds, without any UTC suffix."""
+    # Documents written by older releases may hold Firestore timestamps
+    if isinstance(value, datetime):
+        value = to_stored_datetime(value)
+    return value[:19] if value else "NaT"
+
+
+class HealthScorer:
+    """
+    Scores project health from stored project fields and related signals.
+
+    Signals and points:
+
+    - No update for ``no_update_days``: ``STALE_POINTS``, plus
+      ``LONG_STALE_POINTS`` at twice that long. Projects that never had an
+      update count from their creation.
+    - Past the expected end date: ``OVERDUE_POINTS``; due within
+      ``deadline_warning_days``: ``DUE_SOON_POINTS``.
+    - No advisor or co-advisor: ``NO_ADVISOR_POINTS``.
+    - One point per open alert, up to ``MAX_ALERT_POINTS``.
+
+    ``CRITICAL_SCORE`` points or more make a project critical,
+    ``AT_RISK_SCORE`` or more at risk, and anything less on track.
+    """
+
+    STALE_POINTS = 2
+    LONG_STALE_POINTS = 1
+    OVERDUE_POINTS = 2
+    DUE_SOON_POINTS = 1
+    NO_ADVISOR_POINTS = 1
+    MAX_ALERT_POINTS = 2
+
+    AT_RISK_SCORE = 2
+    CRITICAL_SCORE = 4
+
+    def __init__(self, no_update_days: int, deadline_warning_days: int):
+        """
+        Initialize scorer.
+
+        Args:
+            no_update_days: Days without an update before a project is stale
+            deadline_warning_days: Days before the deadline a project is due soon
+        """
+        self.no_update_days = no_update_days
+        self.deadline_warning_days = deadline_warning_days
+
+    @property
+    def vectorized(self) -> bool:
+        """Whether scoring runs on NumPy arrays."""
+        return np is not None
+
+    def score(
+        self,
+        projects: Sequence[Dict[str, Any]],
+        advised: Set[str],
+        open_alerts: Dict[str, int],
+        now: datetime,
+    ) -> List[HealthStatus]:
+        """
+        Score many projects.
+
+        Args:
+            projects: Stored ``ProjectRepository.HEALTH_FIELDS`` of each project
+            advised: IDs of projects with an advisor
+            open_alerts: Number of active alerts per project ID
+            now: Point in time to score at
+
+        Returns:
+            Health status of each project, in input order
+        """
+        if not projects:
+            return []
+        if self.vectorized:
+            return self._score_arrays(projects, advised, open_alerts, now)
+        return [
+            self._score_one(project, advised, open_alerts, now) for project in projects
+        ]
+
+    def _status(self, points: int) -> HealthStatus:
+        if points >= self.CRITICAL_SCORE:
+            return HealthStatus.CRITICAL
+        if points >= self.AT_RISK_SCORE:
+            return HealthStatus.AT_RISK
+        return HealthStatus.ON_TRACK
+
+    def _score_one(
+        self,
+        project: Dict[str, Any],
+        advised: Set[str],
+        open_alerts: Dict[str, int],
+        now: datetime,
+    ) -> HealthStatus:
+        now = datetime.fromisoformat(_timestamp(now.isoformat()))
+        points = 0
+
+        last_update = project.get("last_update_at") or project.get("created_at")
+        if last_update:
+            idle_days = (
+                now - datetime.fromisoformat(_timestamp(last_update))
+            ).total_seconds() / 86400
+            if idle_days > self.no_update_days:
+                points += self.STALE_POINTS
+            if idle_days > 2 * self.no_update_days:
+                points += self.LONG_STALE_POINTS
+
+        if project.get("expected_end_date"):
+            days_left = (
+                datetime.fromisoformat(_timestamp(project["expected_end_date"])) - now
+            ).total_seconds() / 86400
+            if days_left < 0:
+                points += self.OVERDUE_POINTS
+            elif days_left <= self.deadline_warning_days:
+                points += self.DUE_SOON_POINTS
+
+        project_id = project["project_id"]
+        if project_id not in advised:
+            points += self.NO_ADVISOR_POINTS
+        points += min(open_alerts.get(project_id, 0), self.MAX_ALERT_POINTS)
+
+        return self._status(points)
+
+    def _score_arrays(
+        self,
+        projects: Sequence[Dict[str, Any]],
+        advised: Set[str],
+        open_alerts: Dict[str, int],
+        now: datetime,
+    ) -> List[HealthStatus]:
+        count = len(projects)
+        ids = [p["project_id"] for p in projects]
+        day = np.timedelta64(86400, "s")
+        now64 = np.datetime64(_timestamp(now.isoformat()), "s")
+
+        # Columns; missing dates are NaT and compare false below
+        last_update = np.array(
+            [
+                _timestamp(p.get("last_update_at") or p.get("created_at"))
+                for p in projects
+            ],
+            dtype="datetime64[s]",
+        )
+        deadline = np.array(
+            [_timestamp(p.get("expected_end_date")) for p in projects],
+            dtype="datetime64[s]",
+        )
+        has_advisor = np.fromiter((i in advised for i in ids), dtype=bool, count=count)
+        alerts = np.fromiter(
+            (open_alerts.get(i, 0) for i in ids), dtype=np.int64, count=count
+        )
+
+        idle_days = (now64 - last_update) / day
+        days_left = (deadline - now64) / day
+
+        points = (
+            self.STALE_POINTS * (idle_days > self.no_update_days)
+            + self.LONG_STALE_POINTS * (idle_days > 2 * self.no_update_days)
+            + self.OVERDUE_POINTS * (days_left < 0)
+            + self.DUE_SOON_POINTS
+            * ((days_left >= 0) & (days_left <= self.deadline_warning_days))
+            + self.NO_ADVISOR_POINTS * ~has_advisor
+            + np.minimum(alerts, self.MAX_ALERT_POINTS)
+        )
+
+        statuses = np.select(
+            [points >= self.CRITICAL_SCORE, points >= self.AT_RISK_SCORE],
+            [2, 1],
+            default=0,
+        )
+        ranked = [HealthStatus.ON_TRACK, HealthStatus.AT_RISK, HealthStatus.CRITICAL]
+        return [ranked[s] for s in statuses.tolist()]
@@ -0,0 +1,119 @@
+"""
+Service layer for project health scoring.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from ..config import get_settings
+from ..models.project import HealthStatus, ProjectStatus
+from ..repositories import AlertRepository, MemberRepository, ProjectRepository
+from .health_scoring import HealthScorer
+
+
+class HealthService:
+    """Service keeping the health status of active projects current."""
+
+    def __init__(
+        self,
+        project_repo: Optional[ProjectRepository] = None,
+        member_repo: Optional[MemberRepository] = None,
+        alert_repo: Optional[AlertRepository] = None,
+    ):
+        """
+        Initialize service.
+
+        Args:
+            project_repo: Optional project repository
+            member_repo: Optional member repository
+            alert_repo: Optional alert repository
+        """
+        self.project_repo = project_repo or ProjectRepository()
+        self.member_repo = member_repo or MemberRepository()
+        self.alert_repo = alert_repo or AlertRepository()
+        self.settings = get_settings()
+        self.scorer = HealthScorer(
+            no_update_days=self.settings.alert_no_update_days,
+            deadline_warning_days=self.settings.alert_deadline_warning_days,
+        )
+
+    async def rescore(
+        self,
+        now: Optional[datetime] = None,
+        project_ids: Optional[List[str]] = None,
+    ) -> Dict[str, HealthStatus]:
+        """
+        Rescore active projects and store the statuses that changed.
+
+        The signals are read with three queries (active projects, advised
+        projects, active alerts), the population is scored in one pass and
+        only the changed projects are written. With ``project_ids`` only
+        those projects are read and scored.
+
+        Args:
+            now: Point in time to score at. If None, uses the current time.
+            project_ids: Projects to rescore. If None, every active project.
+
+        Returns:
+            Mapping of project ID to new health status, for changed projects
+        """
+        if project_ids is not None and not project_ids:
+            return {}
+
+        projects, advised, open_alerts = await asyncio.gather(
+            self.project_repo.list_health_signals(
+                status=ProjectStatus.ACTIVE, project_ids=project_ids
+            ),
+            self.member_repo.list_advised_project_ids(project_ids),
+            self.alert_repo.count_active_by_project(project_ids),
+        )
+        scores = self.scorer.score(
+            projects, advised, open_alerts, now or datetime.utcnow()
+        )
+
+        changes = {
+            project["project_id"]: (HealthStatus(project["health_status"]), score)
+            for project, score in zip(projects, scores)
+            if project["health_status"] != score.value
+        }
+        if not changes:
+            return {}
+
+        written = await self.project_repo.set_health_statuses(changes)
+        return {project_id: changes[project_id][1] for project_id in written}
+
+    async def rescore_changes(
+        self,
+        since: datetime,
+        now: Optional[datetime] = None,
+        project_ids: Iterable[str] = (),
+    ) -> Dict[str, HealthStatus]:
+        """
+        Rescore the projects whose signals were written since a point in time.
+
+        Covers active projects written (status, dates) or with an update
+        submitted since ``since``, projects whose memberships changed since
+        then, and ``project_ids``.
+        Signals that change with time alone, such as a deadline coming
+        closer, are left to the periodic full ``rescore``.
+
+        Args:
+            since: Include changes at or after this
+            now: Point in time to score at. If None, uses the current time.
+            project_ids: Further projects to rescore, such as those alerted on
+
+        Returns:
+            Mapping of project ID to new health status, for changed projects
+        """
+        written, updated, member_projects = await asyncio.gather(
+            self.project_repo.list_changed_ids(since),
+            self.project_repo.list_ids_last_updated_between(
+                since, status=ProjectStatus.ACTIVE
+            ),
+            self.member_repo.list_changed_project_ids(since),
+        )
+        touched = list(
+            dict.fromkeys([*written, *updated, *member_projects, *project_ids])
+        )
+        return await self.rescore(now, project_ids=touched)
@@ -0,0 +1,95 @@
+"""
+One-off data migrations run at startup.
+"""
+
+import os
+import socket
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, Optional
+
+from ..repositories import (
+    AlertRepository,
+    MemberRepository,
+    ProjectRepository,
+    UpdateRepository,
+)
+from ..repositories.scheduler_repository import SchedulerRepository
+from ..utils import generate_id
+
+Migration = Callable[[], Awaitable[int]]
+
+
+class MigrationService:
+    """
+    Runs the backfills that bring documents written by older releases up to
+    the current layout, each once per database.
+
+    Migrations run in order on the instance holding the job's lease. A
+    migration that completed is recorded as a watermark named after it, so
+    later startups skip it. Every migration is idempotent, so one interrupted
+    halfway is simply run again.
+    """
+
+    JOB = "migrations"
+    LEASE_TTL = timedelta(minutes=30)
+
+    def __init__(
+        self,
+        scheduler_repo: Optional[SchedulerRepository] = None,
+        alert_repo: Optional[AlertRepository] = None,
+        update_repo: Optional[UpdateRepository] = None,
+        member_repo: Optional[MemberRepository] = None,
+        project_repo: Optional[ProjectRepository] = None,
+    ):
+        """
+        Initialize service.
+
+        Args:
+            scheduler_repo: Optional lease and watermark repository
+            alert_repo: Optional alert repository
+            update_repo: Optional update repository
+            member_repo: Optional member repository
+            project_repo: Optional project repository
+        """
+        self.scheduler_repo = scheduler_repo or SchedulerRepository()
+        self.alert_repo = alert_repo or AlertRepository()
+        self.update_repo = update_repo or UpdateRepository()
+        self.member_repo = member_repo or MemberRepository()
+        self.project_repo = project_repo or ProjectRepository()
+        self.holder = f"{socket.gethostname()}-{os.getpid()}-{generate_id()}"
+
+    @property
+    def migrations(self) -> Dict[str, Migration]:
+        """Migrations by name, in the order they run."""
+        return {
+            "alert_open_keys": self.alert_repo.backfill_open_keys,
+            "project_update_stamps": self.update_repo.backfill_project_stamps,
+            "user_project_index": self.member_repo.rebuild_user_index,
+            "project_date_strings": self.project_repo.normalize_dates,
+        }
+
+    async def run_pending(self) -> Optional[Dict[str, int]]:
+        """
+        Run the migrations that have not completed yet.
+
+        Returns:
+            Number of documents each migration changed, or None if another
+            instance holds the lease
+        """
+        if not await self.scheduler_repo.acquire_lease(
+            self.JOB, self.holder, self.LEASE_TTL
+        ):
+            return None
+
+        results = {}
+        try:
+            for name, migrate in self.migrations.items():
+                job = f"{self.JOB}.{name}"
+                if await self.scheduler_repo.get_watermark(job) is not None:
+                    continue
+                results[name] = await migrate()
+                await self.scheduler_repo.set_watermark(job, datetime.utcnow())
+        finally:
+            await self.scheduler_repo.release_lease(self.JOB, self.holder)
+
+        return results
@@ -2,9 +2,10 @@
 Service layer for research project management.
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Union
 
 from ..models.member import MemberRole, ProjectMember, ProjectMemberCreate
+from ..models.page import Page
 from ..models.project import (
     HealthStatus,
     ProjectCreate,
@@ -12,7 +13,7 @@ from ..models.project import (
     ProjectUpdate,
     ResearchProject,
 )
-from ..repositories import MemberRepository, ProjectRepository
+from ..repositories import MemberRepository, ProjectRepository, SearchRepository
 
 
 class ProjectService:
@@ -22,6 +23,7 @@ class ProjectService:
         self,
         project_repo: Optional[ProjectRepository] = None,
         member_repo: Optional[MemberRepository] = None,
+        search_repo: Optional[SearchRepository] = None,
     ):
         """
         Initialize service.
@@ -29,11 +31,13 @@ class ProjectService:
         Args:
             project_repo: Optional project repository
             member_repo: Optional member repository
+            search_repo: Optional full-text search repository
         """
         self.project_repo = project_repo or ProjectRepository()
         self.member_repo = member_repo or MemberRepository()
+        self.search_repo = search_repo or SearchRepository(db=self.project_repo.db)
 
-    def create_project(self, project_data: ProjectCreate) -> ResearchProject:
+    async def create_project(self, project_data: ProjectCreate) -> ResearchProject:
         """
         Create a new research project.
 
@@ -43,9 +47,27 @@ class ProjectService:
         Returns:
             Created project
         """
-        return self.project_repo.create(project_data)
+        return await self.project_repo.create(project_data)
 
-    def get_project(self, project_id: str) -> Optional[ResearchProject]:
+    async def search_projects(
+        self, query: str, limit: int = 20
+    ) -> List[ResearchProject]:
+        """
+        Search projects by their title, description, area and updates.
+
+        Args:
+            query: Free text, matched without regard to accents or case
+            limit: Maximum number of results
+
+        Returns:
+            Matching projects, most relevant first
+        """
+        ranked = await self.search_repo.search(query, limit)
+        return await self.project_repo.get_many(
+            [project_id for project_id, _ in ranked]
+        )
+
+    async def get_project(self, project_id: str) -> Optional[ResearchProject]:
         """
         Get a project by ID.
 
@@ -55,15 +77,17 @@ class ProjectService:
         Returns:
             Project if found, None otherwise
         """
-        return self.project_repo.get(project_id)
+        return await self.project_repo.get(project_id)
 
-    def list_projects(
+    async def list_projects(
         self,
         status: Optional[ProjectStatus] = None,
         area: Optional[str] = None,
         health_status: Optional[HealthStatus] = None,
         limit: int = 100,
-    ) -> List[ResearchProject]:
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Union[Page[ResearchProject], Page[Dict]]:
         """
         List projects with optional filters.
 
@@ -72,15 +96,31 @@ class ProjectService:
             area: Filter by research area
             health_status: Filter by health status
             limit: Maximum number of results
+            cursor: Cursor returned with the previous page
+            fields: Only fetch and return these fields (plus ``project_id``)
 
         Returns:
-            List of projects
-        """
-        return self.project_repo.list(
-            status=status, area=area, health_status=health_status, limit=limit
+            Page of projects, or of partial project dicts if ``fields`` is set
+        """
+        if fields:
+            return await self.project_repo.list_fields(
+                fields,
+                status=status,
+                area=area,
+                health_status=health_status,
+                limit=limit,
+                cursor=cursor,
+            )
+
+        return await self.project_repo.list(
+            status=status,
+            area=area,
+            health_status=health_status,
+            limit=limit,
+            cursor=cursor,
         )
 
-    def update_project(
+    async def update_project(
         self, project_id: str, update_data: ProjectUpdate
     ) -> Optional[ResearchProject]:
         """
@@ -93,9 +133,9 @@ class ProjectService:
         Returns:
             Updated project if found, None otherwise
         """
-        return self.project_repo.update(project_id, update_data)
+        return await self.project_repo.update(project_id, update_data)
 
-    def delete_project(self, project_id: str) -> bool:
+    async def delete_project(self, project_id: str) -> bool:
         """
         Delete (archive) a project.
 
@@ -105,9 +145,9 @@ class ProjectService:
         Returns:
             True if deleted, False if not found
         """
-        return self.project_repo.delete(project_id)
+        return await self.project_repo.delete(project_id)
 
-    def add_member(
+    async def add_member(
         self, project_id: str, member_data: ProjectMemberCreate
     ) -> Optional[ProjectMember]:
         """
@@ -121,13 +161,13 @@ class ProjectService:
             Created member if project exists, None otherwise
         """
         # Verify project exists
-        project = self.project_repo.get(project_id)
+        project = await self.project_repo.get(project_id)
         if not project:
             return None
 
-        return self.member_repo.add_member(project_id, member_data)
+        return await self.member_repo.add_member(project_id, member_data)
 
-    def get_project_members(
+    async def get_project_members(
         self, project_id: str, role: Optional[MemberRole] = None
     ) -> List[ProjectMember]:
         """
@@ -140,9 +180,9 @@ class ProjectService:
         Returns:
             List of project members
         """
-        return self.member_repo.get_members(project_id, role=role)
+        return await self.member_repo.get_members(project_id, role=role)
 
-    def remove_member(self, project_id: str, user_id: str) -> bool:
+    async def remove_member(self, project_id: str, user_id: str) -> bool:
         """
         Remove a member from a project.
 
@@ -153,9 +193,9 @@ class ProjectService:
         Returns:
             True if removed, False if not found
         """
-        return self.member_repo.remove_member(project_id, user_id)
+        return await self.member_repo.remove_member(project_id, user_id)
 
-    def get_user_projects(
+    async def get_user_projects(
         self, user_id: str, role: Optional[MemberRole] = None
     ) -> List[ResearchProject]:
         """
@@ -168,12 +208,5 @@ class ProjectService:
         Returns:
             List of projects
         """
-        project_ids = self.member_repo.get_projects_by_user(user_id, role=role)
-
-        projects = []
-        for project_id in project_ids:
-            project = self.project_repo.get(project_id)
-            if project:
-                projects.append(project)
-
-        return projects
+        project_ids = await self.member_repo.get_projects_by_user(user_id, role=role)
+        return await self.project_repo.get_many(project_ids)
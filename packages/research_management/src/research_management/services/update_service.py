@@ -2,10 +2,12 @@
 Service layer for project updates and progress tracking.
 """
 
-from typing import List, Optional
+from typing import Optional
 
+from ..models.page import Page
 from ..models.update import ProjectUpdateCreate, ProjectUpdateModel
 from ..repositories import ProjectRepository, UpdateRepository
+from ..utils import compute_etag
 
 
 class UpdateService:
@@ -26,7 +28,7 @@ class UpdateService:
         self.update_repo = update_repo or UpdateRepository()
         self.project_repo = project_repo or ProjectRepository()
 
-    def submit_update(
+    async def submit_update(
         self, project_id: str, user_id: str, update_data: ProjectUpdateCreate
     ) -> Optional[ProjectUpdateModel]:
         """
@@ -41,28 +43,61 @@ class UpdateService:
             Created update if project exists, None otherwise
         """
         # Verify project exists
-        project = self.project_repo.get(project_id)
+        project = await self.project_repo.get(project_id)
         if not project:
             return None
 
-        return self.update_repo.create(project_id, user_id, update_data)
+        return await self.update_repo.create(project_id, user_id, update_data)
 
-    def get_project_updates(
-        self, project_id: str, limit: int = 50
-    ) -> List[ProjectUpdateModel]:
+    async def get_project_updates(
+        self, project_id: str, limit: int = 50, cursor: Optional[str] = None
+    ) -> Page[ProjectUpdateModel]:
         """
         Get all updates for a project.
 
         Args:
             project_id: Project identifier
             limit: Maximum number of results
+            cursor: Cursor returned with the previous page
 
         Returns:
-            List of updates, sorted by timestamp descending
+            Page of updates, sorted by timestamp descending
         """
-        return self.update_repo.get_by_project(project_id, limit=limit)
+        return await self.update_repo.get_by_project(
+            project_id, limit=limit, cursor=cursor
+        )
 
-    def get_latest_update(self, project_id: str) -> Optional[ProjectUpdateModel]:
+    async def get_updates_etag(
+        self, project_id: str, limit: int = 50, cursor: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Get the entity tag of a page of updates without querying the updates.
+
+        Updates are append-only and each one bumps the project's
+        ``update_count`` and ``last_update_at``, so the project document
+        versions its timeline.
+
+        Args:
+            project_id: Project identifier
+            limit: Page size of the request
+            cursor: Cursor of the request
+
+        Returns:
+            Entity tag, or None if the project does not exist
+        """
+        project = await self.project_repo.get(project_id)
+        if project is None:
+            return None
+        return compute_etag(
+            "updates",
+            project_id,
+            project.update_count,
+            project.last_update_at,
+            limit,
+            cursor,
+        )
+
+    async def get_latest_update(self, project_id: str) -> Optional[ProjectUpdateModel]:
         """
         Get the most recent update for a project.
 
@@ -72,4 +107,4 @@ class UpdateService:
         Returns:
             Latest update if found, None otherwise
         """
-        return self.update_repo.get_latest_update(project_id)
+        return await self.update_repo.get_latest_update(project_id)
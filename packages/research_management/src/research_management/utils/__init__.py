@@ -2,6 +2,22 @@
 Utilities module.
 """
 
-from .helpers import calculate_days_since, generate_id, get_current_timestamp
+from .helpers import (
+    calculate_days_since,
+    compute_etag,
+    decode_cursor,
+    encode_cursor,
+    generate_id,
+    get_current_timestamp,
+    to_stored_datetime,
+)
 
-__all__ = ["generate_id", "get_current_timestamp", "calculate_days_since"]
+__all__ = [
+    "generate_id",
+    "get_current_timestamp",
+    "calculate_days_since",
+    "encode_cursor",
+    "decode_cursor",
+    "compute_etag",
+    "to_stored_datetime",
+]
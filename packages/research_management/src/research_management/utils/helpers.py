@@ -2,8 +2,13 @@
 Utility functions and helpers.
 """
 
+import base64
+import binascii
+import hashlib
+import json
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Any, List
 
 
 def generate_id(prefix: str = "") -> str:
@@ -30,6 +35,22 @@ def get_current_timestamp() -> datetime:
     return datetime.utcnow()
 
 
+def to_stored_datetime(value: datetime) -> str:
+    """
+    Format a datetime the way documents store it: naive UTC ISO 8601.
+
+    Args:
+        value: Naive UTC or timezone-aware datetime, such as a Firestore
+            timestamp
+
+    Returns:
+        ISO formatted string
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat()
+
+
 def calculate_days_since(date: datetime) -> int:
     """
     Calculate number of days since a given date.
@@ -44,3 +65,67 @@ def calculate_days_since(date: datetime) -> int:
         return 0
     delta = datetime.utcnow() - date
     return delta.days
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """
+    Encode the ordering values of the last item of a page as an opaque cursor.
+
+    Args:
+        values: Values of the query's order-by fields, in order
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = [
+        {"$dt": value.isoformat()} if isinstance(value, datetime) else value
+        for value in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    """
+    Decode a cursor produced by :func:`encode_cursor`.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        Ordering values of the last item of the previous page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+    if not isinstance(payload, list):
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+    return [
+        (
+            datetime.fromisoformat(value["$dt"])
+            if isinstance(value, dict) and "$dt" in value
+            else value
+        )
+        for value in payload
+    ]
+
+
+def compute_etag(*parts: Any) -> str:
+    """
+    Compute a strong entity tag from the values that version a resource.
+
+    Args:
+        parts: JSON-serializable values; datetimes are allowed
+
+    Returns:
+        Quoted entity tag, e.g. ``"3f2a..."``
+    """
+    raw = json.dumps(parts, separators=(",", ":"), sort_keys=True, default=str)
+    return f'"{hashlib.sha256(raw.encode()).hexdigest()[:32]}"'
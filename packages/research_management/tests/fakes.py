@@ -0,0 +1,342 @@
+"""
+In-memory stand-in for the subset of the async Firestore client used by
+repositories.
+
+Counts every round trip in ``FakeFirestore.reads`` so tests can assert on the
+number of RPCs a repository method issues.
+"""
+
+import copy
+from enum import Enum
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+from google.api_core.exceptions import AlreadyExists, MethodNotImplemented
+from google.cloud.firestore_v1.transforms import DELETE_FIELD, Increment
+
+
+def _merge(target: dict, data: dict) -> None:
+    """Deep-merge ``data`` into ``target``, applying increments."""
+    for key, value in data.items():
+        if value is DELETE_FIELD:
+            target.pop(key, None)
+        elif isinstance(value, Increment):
+            current = target.get(key) or 0
+            target[key] = current + value.value
+        elif isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge(target[key], value)
+        elif isinstance(value, dict):
+            target[key] = {}
+            _merge(target[key], value)
+        elif isinstance(value, Enum):
+            # Firestore stores enums by value
+            target[key] = value.value
+        else:
+            target[key] = copy.deepcopy(value)
+
+
+def _field_value(item: tuple, field: str) -> Any:
+    """Value of ``field`` for a ``(doc_id, data)`` pair; ``__name__`` is the ID."""
+    doc_id, data = item
+    return doc_id if field == "__name__" else data.get(field)
+
+
+class FakeDocumentSnapshot:
+    """Snapshot of a single document."""
+
+    def __init__(self, reference: "FakeDocumentReference", data: Optional[dict]):
+        self.reference = reference
+        self.id = reference.id
+        self._data = data
+
+    @property
+    def exists(self) -> bool:
+        return self._data is not None
+
+    def to_dict(self) -> Optional[dict]:
+        return copy.deepcopy(self._data)
+
+    def get(self, field: str) -> Any:
+        return (self._data or {}).get(field)
+
+
+class FakeDocumentReference:
+    """Reference to a document inside a fake collection."""
+
+    def __init__(self, collection: "FakeCollectionReference", doc_id: str):
+        self._collection = collection
+        self.id = doc_id
+
+    @property
+    def _store(self) -> Dict[str, dict]:
+        return self._collection._store
+
+    async def get(self, transaction=None) -> FakeDocumentSnapshot:
+        self._collection._client.reads += 1
+        return FakeDocumentSnapshot(self, copy.deepcopy(self._store.get(self.id)))
+
+    async def set(self, data: dict, merge: bool = False) -> None:
+        self._collection._client.writes += 1
+        self._set(data, merge)
+
+    async def update(self, data: dict) -> None:
+        self._collection._client.writes += 1
+        self._update(data)
+
+    async def delete(self) -> None:
+        self._collection._client.writes += 1
+        self._store.pop(self.id, None)
+
+    def _set(self, data: dict, merge: bool = False) -> None:
+        if not merge or self.id not in self._store:
+            self._store[self.id] = {}
+        _merge(self._store[self.id], data)
+
+    def _update(self, data: dict) -> None:
+        if self.id not in self._store:
+            raise KeyError(f"No document to update: {self.id}")
+        for path, value in data.items():
+            *parents, leaf = path.split(".")
+            target = self._store[self.id]
+            for parent in parents:
+                target = target.setdefault(parent, {})
+            _merge(target, {leaf: value})
+
+
+class FakeQuery:
+    """Lazily evaluated query over a fake collection."""
+
+    _OPERATORS = {
+        "==": lambda a, b: a == b,
+        "!=": lambda a, b: a != b,
+        "<": lambda a, b: a is not None and a < b,
+        "<=": lambda a, b: a is not None and a <= b,
+        ">": lambda a, b: a is not None and a > b,
+        ">=": lambda a, b: a is not None and a >= b,
+        "in": lambda a, b: a in b,
+        "array_contains": lambda a, b: b in (a or []),
+    }
+
+    def __init__(self, collection: "FakeCollectionReference"):
+        self._collection = collection
+        self._filters: List[tuple] = []
+        self._orders: List[tuple] = []
+        self._limit: Optional[int] = None
+        self._fields: Optional[List[str]] = None
+        self._start_after: Optional[dict] = None
+
+    def _copy(self) -> "FakeQuery":
+        query = FakeQuery(self._collection)
+        query._filters = list(self._filters)
+        query._orders = list(self._orders)
+        query._limit = self._limit
+        query._fields = self._fields
+        query._start_after = self._start_after
+        return query
+
+    def select(self, field_paths) -> "FakeQuery":
+        query = self._copy()
+        query._fields = list(field_paths)
+        return query
+
+    def where(self, field: str, op: str, value: Any) -> "FakeQuery":
+        query = self._copy()
+        query._filters.append((field, op, value))
+        return query
+
+    def order_by(self, field: str, direction: str = "ASCENDING") -> "FakeQuery":
+        query = self._copy()
+        query._orders.append((field, direction))
+        return query
+
+    def start_after(self, values: dict) -> "FakeQuery":
+        query = self._copy()
+        query._start_after = dict(values)
+        return query
+
+    def limit(self, count: int) -> "FakeQuery":
+        query = self._copy()
+        query._limit = count
+        return query
+
+    def _matches(self, data: dict) -> bool:
+        return all(
+            self._OPERATORS[op](data.get(field), value)
+            for field, op, value in self._filters
+        )
+
+    def _results(self) -> List[FakeDocumentSnapshot]:
+        items = [
+            (doc_id, data)
+            for doc_id, data in self._collection._store.items()
+            if self._matches(data)
+        ]
+        for field, direction in reversed(self._orders):
+            items.sort(
+                key=lambda item: _field_value(item, field),
+                reverse=direction == "DESCENDING",
+            )
+        if self._start_after is not None:
+            items = [item for item in items if self._is_after(item)]
+        if self._limit is not None:
+            items = items[: self._limit]
+        if self._fields is not None:
+            items = [
+                (doc_id, {k: v for k, v in data.items() if k in self._fields})
+                for doc_id, data in items
+            ]
+        return [
+            FakeDocumentSnapshot(
+                FakeDocumentReference(self._collection, doc_id), copy.deepcopy(data)
+            )
+            for doc_id, data in items
+        ]
+
+    def _is_after(self, item: tuple) -> bool:
+        """Whether ``item`` sorts strictly after the ``start_after`` cursor."""
+        for field, direction in self._orders:
+            value = _field_value(item, field)
+            cursor = self._start_after[field]
+            if value == cursor:
+                continue
+            if direction == "DESCENDING":
+                return value < cursor
+            return value > cursor
+        return False
+
+    def count(self, alias: Optional[str] = None) -> "FakeAggregationQuery":
+        return FakeAggregationQuery(self, alias)
+
+    async def stream(self, transaction=None):
+        self._collection._client.reads += 1
+        for snapshot in self._results():
+            yield snapshot
+
+    async def get(self) -> List[FakeDocumentSnapshot]:
+        return [snapshot async for snapshot in self.stream()]
+
+
+class FakeAggregationQuery:
+    """``count()`` aggregation over a fake query."""
+
+    def __init__(self, query: FakeQuery, alias: Optional[str]):
+        self._query = query
+        self._alias = alias
+
+    async def get(self, transaction=None) -> list:
+        client = self._query._collection._client
+        if not client.supports_aggregation:
+            raise MethodNotImplemented("Aggregation queries are not supported")
+        client.reads += 1
+        count = len(self._query._results())
+        return [[SimpleNamespace(alias=self._alias, value=count)]]
+
+
+class FakeCollectionReference(FakeQuery):
+    """Collection of documents stored in memory."""
+
+    def __init__(self, client: "FakeFirestore", name: str):
+        self._client = client
+        self.id = name
+        super().__init__(self)
+
+    @property
+    def _store(self) -> Dict[str, dict]:
+        return self._client._data.setdefault(self.id, {})
+
+    def document(self, doc_id: str) -> FakeDocumentReference:
+        return FakeDocumentReference(self, doc_id)
+
+
+class FakeWriteBatch:
+    """Buffers writes and applies them atomically on commit."""
+
+    def __init__(self, client: "FakeFirestore"):
+        self._client = client
+        self._writes: List[tuple] = []
+
+    def set(self, reference, data: dict, merge: bool = False) -> None:
+        self._writes.append(("set", reference, data, merge))
+
+    def create(self, reference, data: dict) -> None:
+        self._writes.append(("create", reference, data, None))
+
+    def update(self, reference, data: dict) -> None:
+        self._writes.append(("update", reference, data, None))
+
+    def delete(self, reference) -> None:
+        self._writes.append(("delete", reference, None, None))
+
+    async def commit(self) -> list:
+        if self._writes:
+            self._client.writes += 1
+        for kind, reference, _, _ in self._writes:
+            if kind == "create" and reference.id in reference._store:
+                self._writes = []
+                raise AlreadyExists(f"Document already exists: {reference.id}")
+        for kind, reference, data, merge in self._writes:
+            if kind in ("set", "create"):
+                reference._set(data, merge)
+            elif kind == "update":
+                reference._update(data)
+            else:
+                reference._store.pop(reference.id, None)
+        writes, self._writes = self._writes, []
+        return writes
+
+
+class FakeTransaction(FakeWriteBatch):
+    """Transaction compatible with ``firestore_async.async_transactional``."""
+
+    _read_only = False
+    _max_attempts = 1
+    _id = b"fake-transaction"
+
+    def _clean_up(self) -> None:
+        self._writes = []
+
+    async def _begin(self, retry_id=None) -> None:
+        self._writes = []
+
+    async def _rollback(self) -> None:
+        self._writes = []
+
+    async def _commit(self) -> list:
+        return await self.commit()
+
+
+class FakeFirestore:
+    """Minimal in-memory Firestore client."""
+
+    def __init__(self):
+        self._data: Dict[str, Dict[str, dict]] = {}
+        self.reads = 0
+        self.writes = 0
+        # Set to False to behave like an emulator without aggregation queries
+        self.supports_aggregation = True
+
+    def collection(self, name: str) -> FakeCollectionReference:
+        return FakeCollectionReference(self, name)
+
+    def batch(self) -> FakeWriteBatch:
+        return FakeWriteBatch(self)
+
+    def transaction(self) -> FakeTransaction:
+        return FakeTransaction(self)
+
+    async def get_all(self, references, field_paths=None, transaction=None):
+        """Fetch several documents in one round trip."""
+        self.reads += 1
+        for ref in references:
+            data = copy.deepcopy(ref._store.get(ref.id))
+            if data is not None and field_paths is not None:
+                data = {k: v for k, v in data.items() if k in field_paths}
+            yield FakeDocumentSnapshot(ref, data)
+
+    def seed(self, collection: str, doc_id: str, data: dict) -> None:
+        """Insert a document without counting it as a write."""
+        self._data.setdefault(collection, {})[doc_id] = copy.deepcopy(data)
+
+    def document_data(self, collection: str, doc_id: str) -> Optional[dict]:
+        """Read a stored document without counting it as a read."""
+        return copy.deepcopy(self._data.get(collection, {}).get(doc_id))
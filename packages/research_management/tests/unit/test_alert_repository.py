@@ -0,0 +1,191 @@
+"""
+Unit tests for the alert repository.
+"""
+
+import pytest
+from google.api_core.exceptions import AlreadyExists
+
+from research_management.models.alert import (
+    AlertCreate,
+    AlertSeverity,
+    AlertStatus,
+    AlertType,
+)
+from research_management.repositories import AlertRepository
+from tests.fakes import FakeFirestore
+
+
+@pytest.fixture
+def db():
+    """Create an in-memory Firestore."""
+    return FakeFirestore()
+
+
+@pytest.fixture
+def repo(db):
+    """Create an alert repository backed by the fake."""
+    return AlertRepository(db=db)
+
+
+async def _create(repo, project_id="proj-1"):
+    return await repo.create(
+        AlertCreate(
+            type=AlertType.NO_UPDATE,
+            project_id=project_id,
+            message="No updates",
+            severity=AlertSeverity.WARNING,
+        )
+    )
+
+
+async def test_resolve_returns_merged_alert_without_reread(db, repo):
+    """Test resolving reads the alert once and returns the merged result."""
+    alert = await _create(repo)
+    db.reads = 0
+
+    resolved = await repo.resolve(alert.alert_id)
+
+    assert db.reads == 1
+    assert resolved.status == AlertStatus.RESOLVED
+    assert resolved.resolved_at is not None
+    assert (await repo.get_by_project("proj-1")).items == [resolved]
+
+
+async def test_dismiss_missing_alert(repo):
+    """Test dismissing an unknown alert returns None."""
+    assert await repo.dismiss("alert-missing") is None
+
+
+async def test_create_if_absent_deduplicates_open_alerts(db, repo):
+    """Test only one open alert exists per type and subject."""
+    data = AlertCreate(
+        type=AlertType.NO_UPDATE,
+        project_id="proj-1",
+        message="No updates",
+        severity=AlertSeverity.WARNING,
+    )
+    db.reads = 0
+
+    first = await repo.create_if_absent(data)
+    duplicate = await repo.create_if_absent(data)
+
+    assert first is not None
+    assert duplicate is None
+    assert db.reads == 0
+    assert len((await repo.get_by_project("proj-1")).items) == 1
+
+
+async def test_closing_alert_releases_open_key(repo):
+    """Test a new alert can be opened once the previous one is closed."""
+    data = AlertCreate(
+        type=AlertType.NO_ADVISOR,
+        user_id="student-1",
+        message="No advisor",
+        severity=AlertSeverity.CRITICAL,
+    )
+    first = await repo.create_if_absent(data)
+    await repo.dismiss(first.alert_id)
+
+    second = await repo.create_if_absent(data)
+
+    assert second is not None
+    assert second.alert_id != first.alert_id
+
+
+def _no_update(project_id):
+    return AlertCreate(
+        type=AlertType.NO_UPDATE,
+        project_id=project_id,
+        message="No updates",
+        severity=AlertSeverity.WARNING,
+    )
+
+
+async def test_create_many_commits_in_batches(db, repo):
+    """Test many alerts are written in a few batch commits."""
+    db.writes = 0
+
+    created = await repo.create_many([_no_update(f"proj-{i}") for i in range(600)])
+
+    assert len(created) == 600
+    # Each alert also claims its open key
+    assert db.writes == 3
+    # One version bump per committed batch
+    assert db.document_data("dashboard_aggregates", "coordinator") == {
+        "active_alerts_count": 600,
+        "version": 3,
+    }
+
+
+async def test_create_many_if_absent_skips_open_alerts(db, repo):
+    """Test open and repeated candidates are skipped with one key read."""
+    await repo.create_if_absent(_no_update("proj-1"))
+    db.reads = 0
+
+    created = await repo.create_many(
+        [_no_update("proj-1"), _no_update("proj-2"), _no_update("proj-2")],
+        if_absent=True,
+    )
+
+    assert [a.project_id for a in created] == ["proj-2"]
+    assert db.reads == 1
+    assert await repo.create_if_absent(_no_update("proj-2")) is None
+
+
+async def test_create_many_if_absent_falls_back_on_conflict(db, repo):
+    """Test a key claimed after it was read only drops that alert."""
+    db.seed(AlertRepository.OPEN_KEYS_COLLECTION, "no_update#proj-1", {})
+    repo._without_open = _passthrough
+
+    created = await repo.create_many(
+        [_no_update("proj-1"), _no_update("proj-2")], if_absent=True
+    )
+
+    assert [a.project_id for a in created] == ["proj-2"]
+    assert len((await repo.get_by_project("proj-1")).items) == 0
+
+
+async def _passthrough(candidates):
+    return candidates
+
+
+async def test_create_claims_open_key(repo):
+    """Test manually created alerts take part in deduplication."""
+    await _create(repo)
+
+    with pytest.raises(AlreadyExists):
+        await _create(repo)
+    assert await repo.create_if_absent(_no_update("proj-1")) is None
+
+
+async def test_backfill_open_keys_claims_legacy_alerts(db, repo):
+    """Test active alerts written without a key are given one."""
+    legacy = {
+        "type": AlertType.NO_UPDATE.value,
+        "project_id": "proj-1",
+        "message": "No updates",
+        "severity": AlertSeverity.WARNING.value,
+        "status": AlertStatus.ACTIVE.value,
+        "created_at": "2024-01-01T00:00:00",
+    }
+    for alert_id in ("alert-1", "alert-2"):
+        db.seed(AlertRepository.COLLECTION, alert_id, {**legacy, "alert_id": alert_id})
+    db.seed(
+        AlertRepository.COLLECTION,
+        "alert-3",
+        {
+            **legacy,
+            "alert_id": "alert-3",
+            "project_id": "proj-2",
+            "status": AlertStatus.RESOLVED.value,
+        },
+    )
+
+    assert await repo.backfill_open_keys() == 1
+    assert await repo.backfill_open_keys() == 0
+    assert await repo.create_if_absent(_no_update("proj-1")) is None
+    assert await repo.create_if_absent(_no_update("proj-2")) is not None
+
+    holder = db.document_data(AlertRepository.OPEN_KEYS_COLLECTION, "no_update#proj-1")
+    await repo.resolve(holder["alert_id"])
+    assert await repo.create_if_absent(_no_update("proj-1")) is not None
@@ -0,0 +1,197 @@
+"""
+Unit tests for the background alert sweep scheduler.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from research_management.models.alert import AlertCreate, AlertSeverity, AlertType
+from research_management.models.member import MemberRole, ProjectMemberCreate
+from research_management.models.project import (
+    HealthStatus,
+    ProjectCreate,
+    ProjectStatus,
+    ProjectUpdate,
+)
+from research_management.repositories import (
+    AlertRepository,
+    MemberRepository,
+    ProjectRepository,
+    SchedulerRepository,
+    UpdateRepository,
+)
+from research_management.services import (
+    AlertService,
+    AlertSweepScheduler,
+    HealthService,
+)
+from tests.fakes import FakeFirestore
+
+
+@pytest.fixture
+def db():
+    """Create the fake Firestore client."""
+    return FakeFirestore()
+
+
+@pytest.fixture
+def scheduler(db):
+    """Create a scheduler backed by the fake."""
+    service = AlertService(
+        alert_repo=AlertRepository(db=db),
+        member_repo=MemberRepository(db=db),
+        update_repo=UpdateRepository(db=db),
+        project_repo=ProjectRepository(db=db),
+    )
+    return AlertSweepScheduler(service, SchedulerRepository(db=db))
+
+
+async def _active_project(service: AlertService, title: str) -> str:
+    project = await service.project_repo.create(
+        ProjectCreate(title=title, description="Test project", area="CS")
+    )
+    await service.project_repo.update(
+        project.project_id, ProjectUpdate(status=ProjectStatus.ACTIVE)
+    )
+    return project.project_id
+
+
+async def test_lease_is_exclusive(db):
+    """Test only one holder runs a job until the lease is released."""
+    repo = SchedulerRepository(db=db)
+    ttl = timedelta(minutes=5)
+
+    assert await repo.acquire_lease("job", "a", ttl)
+    assert not await repo.acquire_lease("job", "b", ttl)
+    assert await repo.acquire_lease("job", "a", ttl)
+
+    await repo.release_lease("job", "b")
+    assert not await repo.acquire_lease("job", "b", ttl)
+
+    await repo.release_lease("job", "a")
+    assert await repo.acquire_lease("job", "b", ttl)
+
+
+async def test_expired_lease_is_taken_over(db):
+    """Test a lease that was not renewed passes to another holder."""
+    repo = SchedulerRepository(db=db)
+
+    assert await repo.acquire_lease("job", "a", timedelta(seconds=-1))
+    assert await repo.acquire_lease("job", "b", timedelta(minutes=5))
+
+
+async def test_run_once_skips_without_lease(scheduler):
+    """Test an instance not holding the lease does not sweep."""
+    await scheduler.scheduler_repo.acquire_lease(
+        scheduler.JOB, "other", timedelta(minutes=5)
+    )
+
+    assert await scheduler.run_once() is None
+    assert await scheduler.scheduler_repo.get_watermark(scheduler.JOB) is None
+
+
+async def test_sweeps_follow_the_watermark(scheduler, db):
+    """Test the first sweep is full and later ones only read changes."""
+    service = scheduler.alert_service
+    silent = await _active_project(service, "Silent")
+    await service.member_repo.add_member(
+        silent, ProjectMemberCreate(user_id="student-1", role=MemberRole.STUDENT)
+    )
+    start = datetime.utcnow() + timedelta(minutes=5)
+
+    first = await scheduler.run_once(now=start)
+
+    assert sorted(a.type.value for a in first) == ["no_advisor", "no_update"]
+    assert await scheduler.scheduler_repo.get_watermark(scheduler.JOB) == start
+
+    # Nothing changed: the lease, the watermark, the expired deadline key
+    # query, four change queries and the deadline query
+    db.reads = 0
+    assert await scheduler.run_once(now=start + timedelta(hours=1)) == []
+    assert db.reads == 8
+
+    # A project whose last update ages past the threshold is picked up
+    aged = await _active_project(service, "Aged")
+    db.seed(
+        ProjectRepository.COLLECTION,
+        aged,
+        {
+            **db.document_data(ProjectRepository.COLLECTION, aged),
+            "updated_at": (start - timedelta(days=60)).isoformat(),
+            "last_update_at": (
+                start
+                + timedelta(minutes=90)
+                - timedelta(days=service.settings.alert_no_update_days)
+            ).isoformat(),
+        },
+    )
+    later = await scheduler.run_once(now=start + timedelta(hours=2))
+
+    assert [a.project_id for a in later] == [aged]
+
+
+async def test_removed_advisor_is_picked_up(scheduler):
+    """Test an advisor leaving after the watermark raises a no-advisor alert."""
+    service = scheduler.alert_service
+    project_id = await _active_project(service, "Advised")
+    for user_id, role in (
+        ("student-1", MemberRole.STUDENT),
+        ("advisor-1", MemberRole.ADVISOR),
+    ):
+        await service.member_repo.add_member(
+            project_id, ProjectMemberCreate(user_id=user_id, role=role)
+        )
+    first = await scheduler.run_once()
+    assert "no_advisor" not in [a.type.value for a in first]
+
+    await service.member_repo.remove_member(project_id, "advisor-1")
+    later = await scheduler.run_once()
+
+    assert [(a.type.value, a.user_id) for a in later] == [("no_advisor", "student-1")]
+
+
+async def test_health_is_rescored_for_touched_projects(scheduler, db):
+    """Test later sweeps only rescore the projects that changed."""
+    service = scheduler.alert_service
+    scheduler.health_service = HealthService(
+        project_repo=service.project_repo,
+        member_repo=service.member_repo,
+        alert_repo=service.alert_repo,
+    )
+    first = await _active_project(service, "First")
+    await scheduler.run_once()
+    assert await scheduler.scheduler_repo.get_watermark(scheduler.RESCORE_JOB)
+    assert (await service.project_repo.get(first)).health_status == (
+        HealthStatus.AT_RISK
+    )
+
+    second = await _active_project(service, "Second")
+    await service.project_repo.update(
+        first, ProjectUpdate(health_status=HealthStatus.ON_TRACK)
+    )
+    db.seed(
+        ProjectRepository.COLLECTION,
+        second,
+        {
+            **db.document_data(ProjectRepository.COLLECTION, second),
+            "updated_at": "2020-01-01T00:00:00",
+        },
+    )
+    await service.create_alert(
+        AlertCreate(
+            type=AlertType.MEETING_REMINDER,
+            project_id=second,
+            message="Meeting tomorrow",
+            severity=AlertSeverity.INFO,
+        )
+    )
+    await scheduler.run_once()
+
+    # The manual change was rescored; the project not written since was not
+    assert (await service.project_repo.get(first)).health_status == (
+        HealthStatus.AT_RISK
+    )
+    assert (await service.project_repo.get(second)).health_status == (
+        HealthStatus.ON_TRACK
+    )
@@ -0,0 +1,177 @@
+"""
+Unit tests for the alert service.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from research_management.models.alert import AlertType
+from research_management.models.member import MemberRole, ProjectMemberCreate
+from research_management.models.project import (
+    ProjectCreate,
+    ProjectStatus,
+    ProjectUpdate,
+)
+from research_management.models.update import ProjectUpdateCreate
+from research_management.repositories import (
+    AlertRepository,
+    MemberRepository,
+    ProjectRepository,
+    UpdateRepository,
+)
+from research_management.services import AlertService
+from tests.fakes import FakeFirestore
+
+
+@pytest.fixture
+def service():
+    """Create an alert service backed by the fake."""
+    db = FakeFirestore()
+    return AlertService(
+        alert_repo=AlertRepository(db=db),
+        member_repo=MemberRepository(db=db),
+        update_repo=UpdateRepository(db=db),
+        project_repo=ProjectRepository(db=db),
+    )
+
+
+async def test_check_students_without_advisor_is_idempotent(service):
+    """Test repeated sweeps do not duplicate open alerts."""
+    for user_id in ("student-1", "student-2"):
+        await service.member_repo.add_member(
+            "proj-1", ProjectMemberCreate(user_id=user_id, role=MemberRole.STUDENT)
+        )
+
+    created = await service.check_students_without_advisor()
+    repeated = await service.check_students_without_advisor()
+
+    assert sorted(a.user_id for a in created) == ["student-1", "student-2"]
+    assert all(a.type == AlertType.NO_ADVISOR for a in created)
+    assert repeated == []
+
+
+async def test_check_projects_without_updates_uses_stamp(service):
+    """Test stale active projects are found from the project stamp."""
+    db = service.project_repo.db
+    ids = {}
+    for title in ("Fresh", "Stale", "Silent", "Paused"):
+        project = await service.project_repo.create(
+            ProjectCreate(title=title, description="Test project", area="CS")
+        )
+        status = ProjectStatus.PAUSED if title == "Paused" else ProjectStatus.ACTIVE
+        await service.project_repo.update(
+            project.project_id, ProjectUpdate(status=status)
+        )
+        ids[title] = project.project_id
+
+    await service.update_repo.create(
+        ids["Fresh"], "user-1", ProjectUpdateCreate(content="Progress")
+    )
+    db.seed(
+        ProjectRepository.COLLECTION,
+        ids["Stale"],
+        {
+            **db.document_data(ProjectRepository.COLLECTION, ids["Stale"]),
+            "last_update_at": "2020-01-01T00:00:00",
+        },
+    )
+    db.reads = 0
+
+    created = await service.check_projects_without_updates()
+
+    assert sorted(a.project_id for a in created) == sorted(
+        [ids["Stale"], ids["Silent"]]
+    )
+    # Two stale-project queries and one open-key lookup
+    assert db.reads == 3
+
+
+async def test_check_upcoming_deadlines_uses_one_range_query(service):
+    """Test active projects due in the warning window are alerted once."""
+    db = service.project_repo.db
+    now = datetime.utcnow()
+    ends = {
+        "Due": now + timedelta(days=3),
+        "Later": now + timedelta(days=30),
+        "Overdue": now - timedelta(days=1),
+        "Paused": now + timedelta(days=3),
+    }
+    ids = {}
+    for title, end in ends.items():
+        project = await service.project_repo.create(
+            ProjectCreate(
+                title=title,
+                description="Test project",
+                area="CS",
+                expected_end_date=end,
+            )
+        )
+        status = ProjectStatus.PAUSED if title == "Paused" else ProjectStatus.ACTIVE
+        await service.project_repo.update(
+            project.project_id, ProjectUpdate(status=status)
+        )
+        ids[title] = project.project_id
+    db.reads = 0
+
+    created = await service.check_upcoming_deadlines(now)
+    repeated = await service.check_upcoming_deadlines(now)
+
+    assert [a.project_id for a in created] == [ids["Due"]]
+    assert created[0].type == AlertType.DEADLINE_SOON
+    assert repeated == []
+    # Per check: one range query and one open-key lookup
+    assert db.reads == 4
+
+
+async def test_dismissed_deadline_alert_is_not_raised_again(service):
+    """Test closing a deadline alert holds until the deadline moves."""
+    now = datetime.utcnow()
+    project = await service.project_repo.create(
+        ProjectCreate(
+            title="Due",
+            description="Test project",
+            area="CS",
+            expected_end_date=now + timedelta(days=3),
+        )
+    )
+    await service.project_repo.update(
+        project.project_id, ProjectUpdate(status=ProjectStatus.ACTIVE)
+    )
+    [alert] = await service.check_upcoming_deadlines(now)
+
+    await service.dismiss_alert(alert.alert_id)
+
+    assert await service.check_upcoming_deadlines(now) == []
+    assert await service.check_upcoming_deadlines(now + timedelta(hours=1)) == []
+
+    await service.project_repo.update(
+        project.project_id,
+        ProjectUpdate(expected_end_date=now + timedelta(days=5)),
+    )
+    [moved] = await service.check_upcoming_deadlines(now + timedelta(days=2))
+    assert moved.project_id == project.project_id
+
+
+async def test_deadline_keys_are_released_once_past(service):
+    """Test the open key of a deadline alert is deleted after the deadline."""
+    db = service.project_repo.db
+    now = datetime.utcnow()
+    project = await service.project_repo.create(
+        ProjectCreate(
+            title="Due",
+            description="Test project",
+            area="CS",
+            expected_end_date=now + timedelta(days=3),
+        )
+    )
+    await service.project_repo.update(
+        project.project_id, ProjectUpdate(status=ProjectStatus.ACTIVE)
+    )
+    [alert] = await service.check_upcoming_deadlines(now)
+    await service.dismiss_alert(alert.alert_id)
+    keys = AlertRepository.OPEN_KEYS_COLLECTION
+
+    assert await service.alert_repo.release_expired_keys(now) == 0
+    assert await service.alert_repo.release_expired_keys(now + timedelta(days=4)) == 1
+    assert await db.collection(keys).where("alert_id", "==", alert.alert_id).get() == []
@@ -0,0 +1,197 @@
+"""
+Unit tests for the API wiring.
+"""
+
+import asyncio
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+
+from research_management.api.dependencies import ServiceContainer
+from research_management.config import get_settings
+from research_management.main import app
+from tests.fakes import FakeFirestore
+
+PROJECTS = f"{get_settings().api_prefix}/projects"
+
+
+@pytest.fixture
+def services():
+    """Install a service container backed by the fake on the app."""
+    services = ServiceContainer(db=FakeFirestore())
+    app.state.services = services
+    yield services
+    del app.state.services
+
+
+@pytest.fixture
+def client(services):
+    """Create a client that skips the Firebase startup event."""
+    return TestClient(app)
+
+
+def test_routes_share_the_app_services(client, services):
+    """Test requests reuse the services built once for the app."""
+    created = client.post(
+        PROJECTS,
+        json={"title": "First", "description": "Test project", "area": "CS"},
+    )
+    assert created.status_code == 201
+
+    response = client.get(PROJECTS)
+    assert response.status_code == 200
+    assert [p["title"] for p in response.json()] == ["First"]
+
+    # The read went through the container's project cache
+    project_id = created.json()["project_id"]
+    assert services.project_repo.cache.get(project_id) is not None
+
+
+def test_invalid_cursor_is_rejected(client):
+    """Test a malformed cursor is reported as a bad request."""
+    response = client.get(PROJECTS, params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+@pytest.fixture
+def fast_responses(monkeypatch):
+    """Enable the direct serialization path."""
+    monkeypatch.setattr(get_settings(), "fast_json_responses", True)
+
+
+def _create_projects(client, count):
+    for i in range(count):
+        client.post(
+            PROJECTS,
+            json={"title": f"Project {i}", "description": "Test", "area": "CS"},
+        )
+
+
+def test_fast_responses_match_default_serialization(client, monkeypatch):
+    """Test direct serialization returns the same body and cursor header."""
+    _create_projects(client, 3)
+    default = client.get(PROJECTS, params={"limit": 2})
+
+    monkeypatch.setattr(get_settings(), "fast_json_responses", True)
+    fast = client.get(PROJECTS, params={"limit": 2})
+
+    assert fast.status_code == 200
+    assert fast.json() == default.json()
+    assert fast.headers["X-Next-Cursor"] == default.headers["X-Next-Cursor"]
+
+
+def test_fast_responses_for_sparse_fields_and_dashboards(client, fast_responses):
+    """Test plain payloads are encoded directly too."""
+    _create_projects(client, 1)
+
+    sparse = client.get(PROJECTS, params={"fields": "title"})
+    dashboard = client.get(f"{get_settings().api_prefix}/dashboard/coordinator")
+
+    assert [set(p) for p in sparse.json()] == [{"project_id", "title"}]
+    assert dashboard.json()["total_projects"] == 1
+
+
+def _get_with_etag(client, url, **kwargs):
+    first = client.get(url, **kwargs)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    second = client.get(url, headers={"If-None-Match": etag}, **kwargs)
+    return etag, second
+
+
+def test_project_conditional_get(client):
+    """Test an unchanged project answers 304 until it is modified."""
+    created = client.post(
+        PROJECTS, json={"title": "First", "description": "Test", "area": "CS"}
+    ).json()
+    url = f"{PROJECTS}/{created['project_id']}"
+
+    etag, cached = _get_with_etag(client, url)
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+
+    client.post(
+        f"{url}/updates", params={"user_id": "student-1"}, json={"content": "Done"}
+    )
+    changed = client.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["update_count"] == 1
+
+
+def test_timeline_etag_changes_with_new_updates(client, services):
+    """Test the timeline is tagged from the project stamps, not the updates."""
+    created = client.post(
+        PROJECTS, json={"title": "First", "description": "Test", "area": "CS"}
+    ).json()
+    url = f"{PROJECTS}/{created['project_id']}/timeline"
+
+    etag, cached = _get_with_etag(client, url)
+    assert cached.status_code == 304
+
+    client.post(
+        f"{PROJECTS}/{created['project_id']}/updates",
+        params={"user_id": "student-1"},
+        json={"content": "Done"},
+    )
+    changed = client.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert len(changed.json()) == 1
+
+
+def test_coordinator_dashboard_etag_skips_computation(client, services):
+    """Test a matching tag is answered without computing the dashboard."""
+    client.post(PROJECTS, json={"title": "First", "description": "Test", "area": "CS"})
+    url = f"{get_settings().api_prefix}/dashboard/coordinator"
+    client.get(url)  # Builds the aggregate
+
+    etag, cached = _get_with_etag(client, url)
+    assert cached.status_code == 304
+
+    services.db.reads = 0
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+    assert services.db.reads == 1
+
+    client.post(PROJECTS, json={"title": "Second", "description": "T", "area": "CS"})
+    changed = client.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["total_projects"] == 2
+
+
+def test_coordinator_trends_range(client, services):
+    """Test trends are served from snapshots and the range is validated."""
+    asyncio.run(
+        services.snapshot_repo.put(
+            date(2025, 3, 2), {"statuses": ["active"], "status_counts": [4]}
+        )
+    )
+    url = f"{get_settings().api_prefix}/dashboard/coordinator/trends"
+
+    response = client.get(url, params={"from": "2025-03-01", "to": "2025-03-31"})
+
+    assert response.status_code == 200
+    assert response.json()["dates"] == ["2025-03-02"]
+    assert response.json()["status_counts"] == {"active": [4]}
+    assert (
+        client.get(url, params={"from": "2025-03-31", "to": "2025-03-01"}).status_code
+        == 400
+    )
+    assert (
+        client.get(url, params={"from": "2020-01-01", "to": "2025-01-01"}).status_code
+        == 400
+    )
+
+
+def test_project_search_route(client):
+    """Test the search route is not taken for a project ID."""
+    for title in ("Ecologia de rios", "Ecologia urbana", "Criptografia"):
+        client.post(PROJECTS, json={"title": title, "description": "T", "area": "Bio"})
+
+    response = client.get(f"{PROJECTS}/search", params={"q": "ecologia"})
+
+    assert response.status_code == 200
+    assert sorted(p["title"] for p in response.json()) == [
+        "Ecologia de rios",
+        "Ecologia urbana",
+    ]
+    assert client.get(f"{PROJECTS}/search").status_code == 422
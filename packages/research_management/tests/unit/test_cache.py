@@ -0,0 +1,59 @@
+"""
+Unit tests for the entity cache.
+"""
+
+from research_management.repositories import EntityCache
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cache_hit_and_miss_counters():
+    """Test lookups are counted as hits or misses."""
+    cache = EntityCache()
+    cache.set("proj-1", "project")
+
+    assert cache.get("proj-1") == "project"
+    assert cache.get("proj-2") is None
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1, "hit_rate": 0.5}
+
+
+def test_cache_evicts_least_recently_used():
+    """Test the oldest unused entry is evicted when full."""
+    cache = EntityCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_cache_entries_expire():
+    """Test entries are dropped once their TTL has passed."""
+    clock = FakeClock()
+    cache = EntityCache(ttl_seconds=10, clock=clock)
+    cache.set("proj-1", "project")
+
+    clock.now = 9.9
+    assert cache.get("proj-1") == "project"
+    clock.now = 10.0
+    assert cache.get("proj-1") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_cache_disabled_with_zero_size():
+    """Test a zero-sized cache stores nothing."""
+    cache = EntityCache(max_size=0)
+    cache.set("proj-1", "project")
+
+    assert cache.get("proj-1") is None
@@ -0,0 +1,281 @@
+"""
+Unit tests for the dashboard service.
+"""
+
+from datetime import date
+
+import pytest
+from google.api_core.exceptions import ServiceUnavailable
+
+from research_management.models.alert import AlertCreate, AlertSeverity, AlertType
+from research_management.models.member import MemberRole, ProjectMemberCreate
+from research_management.models.project import (
+    HealthStatus,
+    ProjectCreate,
+    ProjectStatus,
+    ProjectUpdate,
+)
+from research_management.repositories import (
+    AggregateRepository,
+    AlertRepository,
+    MemberRepository,
+    ProjectRepository,
+    SnapshotRepository,
+)
+from research_management.services import DashboardService
+from tests.fakes import FakeAggregationQuery, FakeFirestore
+
+
+@pytest.fixture
+def db():
+    """Create an in-memory Firestore."""
+    return FakeFirestore()
+
+
+@pytest.fixture
+def service(db):
+    """Create a dashboard service backed by the fake."""
+    return DashboardService(
+        project_repo=ProjectRepository(db=db),
+        member_repo=MemberRepository(db=db),
+        alert_repo=AlertRepository(db=db),
+        aggregate_repo=AggregateRepository(db=db),
+        snapshot_repo=SnapshotRepository(db=db),
+    )
+
+
+async def _create_project(service, title):
+    return await service.project_repo.create(
+        ProjectCreate(title=title, description="Test project", area="CS")
+    )
+
+
+async def test_coordinator_dashboard_bootstraps_aggregate(db, service):
+    """Test the aggregate is built from a scan when it does not exist yet."""
+    project = await _create_project(service, "First")
+    await service.member_repo.add_member(
+        project.project_id,
+        ProjectMemberCreate(user_id="student-1", role=MemberRole.STUDENT),
+    )
+
+    dashboard = await service.get_coordinator_dashboard()
+
+    assert dashboard["total_projects"] == 1
+    assert dashboard["status_breakdown"] == {"proposal": 1}
+    assert dashboard["students_without_advisor"] == 1
+    assert db.document_data("dashboard_aggregates", "coordinator")["initialized"]
+
+
+async def test_coordinator_aggregate_tracks_writes(db, service):
+    """Test repository writes keep the aggregate counters exact."""
+    await service.rebuild_coordinator_aggregate()
+
+    first = await _create_project(service, "First")
+    second = await _create_project(service, "Second")
+    await service.project_repo.update(
+        first.project_id,
+        ProjectUpdate(status=ProjectStatus.ACTIVE, health_status=HealthStatus.AT_RISK),
+    )
+    await service.project_repo.update(
+        second.project_id, ProjectUpdate(status=ProjectStatus.COMPLETED)
+    )
+    await service.project_repo.delete(second.project_id)
+
+    await service.member_repo.add_member(
+        first.project_id,
+        ProjectMemberCreate(user_id="student-1", role=MemberRole.STUDENT),
+    )
+    await service.member_repo.add_member(
+        first.project_id,
+        ProjectMemberCreate(user_id="student-2", role=MemberRole.STUDENT),
+    )
+    await service.member_repo.add_member(
+        first.project_id,
+        ProjectMemberCreate(user_id="advisor-1", role=MemberRole.ADVISOR),
+    )
+    await service.member_repo.remove_member(first.project_id, "advisor-1")
+
+    alert = await service.alert_repo.create(
+        AlertCreate(
+            type=AlertType.NO_UPDATE,
+            project_id=first.project_id,
+            message="No updates",
+            severity=AlertSeverity.WARNING,
+        )
+    )
+    await service.alert_repo.create(
+        AlertCreate(
+            type=AlertType.NO_ADVISOR,
+            user_id="student-1",
+            message="No advisor",
+            severity=AlertSeverity.CRITICAL,
+        )
+    )
+    await service.alert_repo.resolve(alert.alert_id)
+    await service.alert_repo.dismiss(alert.alert_id)
+
+    dashboard = await service.get_coordinator_dashboard()
+
+    assert dashboard["total_projects"] == 2
+    assert dashboard["status_breakdown"] == {"active": 1, "archived": 1}
+    assert dashboard["health_breakdown"] == {"at_risk": 1, "on_track": 1}
+    assert dashboard["active_projects"] == 1
+    assert dashboard["archived_projects"] == 1
+    assert dashboard["projects_in_risk"] == 1
+    assert dashboard["students_without_advisor"] == 2
+    assert dashboard["active_alerts_count"] == 1
+
+
+async def test_coordinator_aggregate_matches_rebuild(service):
+    """Test incremental counters agree with a full recount."""
+    await service.rebuild_coordinator_aggregate()
+    project = await _create_project(service, "First")
+    await service.project_repo.update(
+        project.project_id, ProjectUpdate(status=ProjectStatus.ACTIVE)
+    )
+    await service.member_repo.add_member(
+        project.project_id,
+        ProjectMemberCreate(user_id="student-1", role=MemberRole.STUDENT),
+    )
+    second = await _create_project(service, "Second")
+    for user_id, role in (
+        ("student-2", MemberRole.STUDENT),
+        ("advisor-1", MemberRole.ADVISOR),
+    ):
+        await service.member_repo.add_member(
+            second.project_id, ProjectMemberCreate(user_id=user_id, role=role)
+        )
+    await service.project_repo.update(
+        second.project_id, ProjectUpdate(status=ProjectStatus.ACTIVE)
+    )
+    await service.member_repo.add_member(
+        project.project_id,
+        ProjectMemberCreate(user_id="advisor-2", role=MemberRole.CO_ADVISOR),
+    )
+    await service.member_repo.remove_member(project.project_id, "advisor-2")
+    await service.project_repo.delete(project.project_id)
+
+    incremental = await service.aggregate_repo.get()
+    rebuilt = await service.rebuild_coordinator_aggregate()
+
+    for key, value in rebuilt.items():
+        if isinstance(value, dict):
+            assert {k: v for k, v in incremental[key].items() if v} == value
+        else:
+            assert incremental[key] == value
+
+
+async def test_coordinator_dashboard_is_one_read(db, service):
+    """Test the advisor ratio is served from the aggregate counters."""
+    await service.rebuild_coordinator_aggregate()
+    for title, members in (
+        (
+            "First",
+            [("advisor-1", MemberRole.ADVISOR), ("student-1", MemberRole.STUDENT)],
+        ),
+        (
+            "Second",
+            [("advisor-1", MemberRole.CO_ADVISOR), ("student-2", MemberRole.STUDENT)],
+        ),
+        (
+            "Third",
+            [("advisor-2", MemberRole.ADVISOR), ("student-3", MemberRole.STUDENT)],
+        ),
+    ):
+        project = await _create_project(service, title)
+        await service.project_repo.update(
+            project.project_id, ProjectUpdate(status=ProjectStatus.ACTIVE)
+        )
+        for user_id, role in members:
+            await service.member_repo.add_member(
+                project.project_id, ProjectMemberCreate(user_id=user_id, role=role)
+            )
+    # A paused project's members do not count
+    await service.project_repo.update(
+        project.project_id, ProjectUpdate(status=ProjectStatus.PAUSED)
+    )
+    db.reads = 0
+
+    dashboard = await service.get_coordinator_dashboard()
+
+    assert db.reads == 1
+    assert dashboard["avg_students_per_advisor"] == 2.0
+
+
+async def test_aggregate_with_older_layout_is_rebuilt(db, service):
+    """Test an aggregate built before the ratio counters is rebuilt once."""
+    await service.rebuild_coordinator_aggregate()
+    legacy = db.document_data("dashboard_aggregates", "coordinator")
+    del legacy["layout"], legacy["active_students"], legacy["advisor_projects"]
+    db.seed("dashboard_aggregates", "coordinator", legacy)
+
+    assert await service.aggregate_repo.get() is None
+    await service.get_coordinator_dashboard()
+    assert await service.aggregate_repo.get() is not None
+
+
+async def test_rebuild_counts_with_aggregation_queries(db, service):
+    """Test the rebuild counts with aggregations, not document reads."""
+    for title in ("First", "Second", "Third"):
+        await _create_project(service, title)
+    db.reads = 0
+
+    aggregate = await service.rebuild_coordinator_aggregate()
+
+    # One count per status and health value, one for alerts, one member
+    # scan and the active project IDs (none, so no member lookups)
+    assert db.reads == len(ProjectStatus) + len(HealthStatus) + 3
+    assert aggregate["total_projects"] == 3
+    assert aggregate["status_counts"] == {"proposal": 3}
+    assert aggregate["health_counts"] == {"on_track": 3}
+
+
+async def test_rebuild_falls_back_without_aggregation(db, service):
+    """Test counting still works on backends without count() support."""
+    await _create_project(service, "First")
+    db.supports_aggregation = False
+
+    aggregate = await service.rebuild_coordinator_aggregate()
+
+    assert aggregate["total_projects"] == 1
+    assert aggregate["active_alerts_count"] == 0
+
+
+async def test_count_errors_are_not_swallowed(service, monkeypatch):
+    """Test only unsupported aggregation falls back to streaming."""
+
+    async def _unavailable(self, transaction=None):
+        raise ServiceUnavailable("Backend unavailable")
+
+    monkeypatch.setattr(FakeAggregationQuery, "get", _unavailable)
+
+    with pytest.raises(ServiceUnavailable):
+        await service.rebuild_coordinator_aggregate()
+
+
+async def test_daily_snapshots_feed_trends(db, service):
+    """Test one snapshot per day is taken and trends read one per day."""
+    project = await _create_project(service, "First")
+    await service.project_repo.update(
+        project.project_id, ProjectUpdate(status=ProjectStatus.ACTIVE)
+    )
+    first = await service.take_daily_snapshot(date(2025, 3, 1))
+    assert await service.take_daily_snapshot(date(2025, 3, 1)) is None
+
+    await _create_project(service, "Second")
+    await service.project_repo.update(
+        project.project_id, ProjectUpdate(health_status=HealthStatus.AT_RISK)
+    )
+    await service.take_daily_snapshot(date(2025, 3, 3))
+    db.reads = 0
+
+    trends = await service.get_coordinator_trends(date(2025, 3, 1), date(2025, 3, 31))
+
+    assert first["area_counts"] == [1]
+    assert db.reads == 1
+    assert trends["dates"] == ["2025-03-01", "2025-03-03"]
+    assert trends["total_projects"] == [1, 2]
+    assert trends["status_counts"]["active"] == [1, 1]
+    assert trends["status_counts"]["proposal"] == [0, 1]
+    assert trends["health_counts"]["at_risk"] == [0, 1]
+    assert trends["area_counts"] == {"CS": [1, 1]}
@@ -0,0 +1,217 @@
+"""
+Unit tests for project health scoring.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from research_management.models.member import MemberRole, ProjectMemberCreate
+from research_management.models.project import (
+    HealthStatus,
+    ProjectCreate,
+    ProjectStatus,
+    ProjectUpdate,
+)
+from research_management.models.update import ProjectUpdateCreate
+from research_management.repositories import (
+    AggregateRepository,
+    AlertRepository,
+    MemberRepository,
+    ProjectRepository,
+    UpdateRepository,
+)
+from research_management.services import HealthService, health_scoring
+from research_management.services.health_scoring import HealthScorer
+from tests.fakes import FakeFirestore
+
+NOW = datetime(2025, 6, 1)
+
+
+def _days_ago(days: int) -> str:
+    return (NOW - timedelta(days=days)).isoformat()
+
+
+SIGNALS = [
+    # Recently updated, advised, deadline far away
+    {"project_id": "fresh", "last_update_at": _days_ago(2)},
+    # Stale and unadvised
+    {"project_id": "stale", "last_update_at": _days_ago(40)},
+    # Never updated for twice the threshold, overdue, with open alerts
+    {
+        "project_id": "abandoned",
+        "created_at": _days_ago(90),
+        "expected_end_date": _days_ago(1),
+    },
+    # Due soon with one open alert, stored with a UTC suffix
+    {
+        "project_id": "due",
+        "last_update_at": _days_ago(1) + "Z",
+        "expected_end_date": (NOW + timedelta(days=3)).isoformat() + "Z",
+    },
+    # Stale, overdue and unadvised, stored as Firestore timestamps
+    {
+        "project_id": "legacy",
+        "last_update_at": (NOW - timedelta(days=40)).replace(tzinfo=timezone.utc),
+        "expected_end_date": (NOW - timedelta(days=1)).replace(tzinfo=timezone.utc),
+    },
+]
+ADVISED = {"fresh", "due", "abandoned"}
+OPEN_ALERTS = {"abandoned": 5, "due": 1}
+EXPECTED = [
+    HealthStatus.ON_TRACK,
+    HealthStatus.AT_RISK,
+    HealthStatus.CRITICAL,
+    HealthStatus.AT_RISK,
+    HealthStatus.CRITICAL,
+]
+
+
+def test_scorer_rules(monkeypatch):
+    """Test the per-project rules map signals to statuses."""
+    monkeypatch.setattr(health_scoring, "np", None)
+    scorer = HealthScorer(no_update_days=30, deadline_warning_days=7)
+
+    assert scorer.score(SIGNALS, ADVISED, OPEN_ALERTS, NOW) == EXPECTED
+
+
+def test_vectorized_scorer_matches_rules():
+    """Test the NumPy pass gives the same statuses as the per-project rules."""
+    pytest.importorskip("numpy")
+    scorer = HealthScorer(no_update_days=30, deadline_warning_days=7)
+
+    assert scorer.vectorized
+    assert scorer.score(SIGNALS, ADVISED, OPEN_ALERTS, NOW) == EXPECTED
+
+
+async def test_rescore_writes_only_changes():
+    """Test rescoring stores changed statuses and keeps counters in sync."""
+    db = FakeFirestore()
+    projects = ProjectRepository(db=db)
+    members = MemberRepository(db=db)
+    service = HealthService(
+        project_repo=projects, member_repo=members, alert_repo=AlertRepository(db=db)
+    )
+    ids = []
+    for title in ("Advised", "Unadvised"):
+        project = await projects.create(
+            ProjectCreate(title=title, description="Test project", area="CS")
+        )
+        await projects.update(
+            project.project_id, ProjectUpdate(status=ProjectStatus.ACTIVE)
+        )
+        ids.append(project.project_id)
+    await members.add_member(
+        ids[0], ProjectMemberCreate(user_id="advisor-1", role=MemberRole.ADVISOR)
+    )
+    assert await service.rescore() == {}
+
+    # Seventy days later both projects are long stale
+    later = datetime.utcnow() + timedelta(days=70)
+    changed = await service.rescore(later)
+    writes = db.writes
+    repeated = await service.rescore(later)
+
+    assert changed == {ids[0]: HealthStatus.AT_RISK, ids[1]: HealthStatus.CRITICAL}
+    assert repeated == {}
+    assert db.writes == writes
+    assert (await projects.get(ids[1])).health_status == HealthStatus.CRITICAL
+    counters = db.document_data(
+        AggregateRepository.COLLECTION, AggregateRepository.COORDINATOR_DOC
+    )
+    assert counters["health_counts"] == {"on_track": 0, "at_risk": 1, "critical": 1}
+
+
+async def test_set_health_statuses_keeps_concurrent_changes():
+    """Test a status set after it was read is kept and counters stay exact."""
+    db = FakeFirestore()
+    projects = ProjectRepository(db=db)
+    ids = []
+    for title in ("First", "Second", "Third"):
+        project = await projects.create(
+            ProjectCreate(title=title, description="Test project", area="CS")
+        )
+        ids.append(project.project_id)
+    await projects.update(ids[2], ProjectUpdate(health_status=HealthStatus.CRITICAL))
+    before = db.document_data(
+        AggregateRepository.COLLECTION, AggregateRepository.COORDINATOR_DOC
+    )
+
+    written = await projects.set_health_statuses(
+        {
+            project_id: (HealthStatus.ON_TRACK, HealthStatus.AT_RISK)
+            for project_id in ids
+        }
+    )
+
+    assert written == ids[:2]
+    assert (await projects.get(ids[2])).health_status == HealthStatus.CRITICAL
+    counters = db.document_data(
+        AggregateRepository.COLLECTION, AggregateRepository.COORDINATOR_DOC
+    )
+    assert counters["health_counts"] == {"on_track": 0, "at_risk": 2, "critical": 1}
+    # One counters write for the whole call
+    assert counters["version"] == before["version"] + 1
+
+
+async def test_rescore_reads_only_given_projects():
+    """Test targeted rescoring ignores projects outside the given IDs."""
+    db = FakeFirestore()
+    projects = ProjectRepository(db=db)
+    service = HealthService(
+        project_repo=projects,
+        member_repo=MemberRepository(db=db),
+        alert_repo=AlertRepository(db=db),
+    )
+    ids = []
+    for title in ("Touched", "Untouched"):
+        project = await projects.create(
+            ProjectCreate(title=title, description="Test project", area="CS")
+        )
+        await projects.update(
+            project.project_id, ProjectUpdate(status=ProjectStatus.ACTIVE)
+        )
+        ids.append(project.project_id)
+
+    later = datetime.utcnow() + timedelta(days=70)
+
+    assert await service.rescore(later, project_ids=[]) == {}
+    assert await service.rescore(later, project_ids=ids[:1]) == {
+        ids[0]: HealthStatus.CRITICAL
+    }
+    assert (await projects.get(ids[1])).health_status == HealthStatus.ON_TRACK
+
+
+async def test_rescore_changes_picks_up_submitted_updates():
+    """Test a stale project is rescored once an update is submitted."""
+    db = FakeFirestore()
+    projects = ProjectRepository(db=db)
+    service = HealthService(
+        project_repo=projects,
+        member_repo=MemberRepository(db=db),
+        alert_repo=AlertRepository(db=db),
+    )
+    project = await projects.create(
+        ProjectCreate(title="Quiet", description="Test project", area="CS")
+    )
+    await projects.update(
+        project.project_id, ProjectUpdate(status=ProjectStatus.ACTIVE)
+    )
+    db.seed(
+        ProjectRepository.COLLECTION,
+        project.project_id,
+        {
+            **db.document_data(ProjectRepository.COLLECTION, project.project_id),
+            "last_update_at": (datetime.utcnow() - timedelta(days=70)).isoformat(),
+        },
+    )
+    assert await service.rescore() == {project.project_id: HealthStatus.CRITICAL}
+
+    since = datetime.utcnow()
+    await UpdateRepository(db=db).create(
+        project.project_id, "student-1", ProjectUpdateCreate(content="Back on it")
+    )
+
+    assert await service.rescore_changes(since) == {
+        project.project_id: HealthStatus.ON_TRACK
+    }
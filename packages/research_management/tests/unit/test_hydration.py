@@ -0,0 +1,71 @@
+"""
+Unit tests for document hydration.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from research_management.models.project import (
+    ProjectCreate,
+    ProjectStatus,
+    ResearchProject,
+)
+from research_management.repositories import ProjectRepository
+from research_management.repositories.hydration import (
+    HydrationMode,
+    Hydrator,
+    get_hydrator,
+)
+from tests.fakes import FakeFirestore
+
+STORED = {
+    "project_id": "proj-1",
+    "title": "First",
+    "description": "Test project",
+    "area": "CS",
+    "status": "active",
+    "health_status": "at_risk",
+    "created_at": "2025-01-10T10:00:00",
+    "updated_at": "2025-01-10T10:00:00",
+    "expected_end_date": "2025-06-30T00:00:00Z",
+}
+
+
+@pytest.mark.parametrize("mode", list(HydrationMode))
+def test_modes_build_the_same_models(mode):
+    """Test every mode converts stored values into model types."""
+    hydrator = Hydrator(ResearchProject, mode)
+
+    [project] = hydrator.many([STORED])
+
+    assert project == ResearchProject(**STORED)
+    assert hydrator.one(STORED) == project
+    assert project.status is ProjectStatus.ACTIVE
+
+
+@pytest.mark.parametrize("mode", list(HydrationMode))
+def test_modes_reject_malformed_documents(mode):
+    """Test batching does not skip validation."""
+    with pytest.raises(ValidationError):
+        Hydrator(ResearchProject, mode).many([STORED, {**STORED, "status": "?"}])
+
+
+def test_hydrators_are_shared():
+    """Test the type adapter is built once per model and mode."""
+    assert get_hydrator(ResearchProject, "batch") is get_hydrator(
+        ResearchProject, HydrationMode.BATCH
+    )
+
+
+@pytest.mark.parametrize("mode", list(HydrationMode))
+async def test_repository_hydration_is_selectable(mode):
+    """Test a repository lists the same projects in either mode."""
+    repo = ProjectRepository(db=FakeFirestore(), hydration=mode)
+    created = await repo.create(
+        ProjectCreate(title="First", description="Test project", area="CS")
+    )
+
+    page = await repo.list()
+
+    assert repo.hydrator.mode is mode
+    assert page.items == [created]
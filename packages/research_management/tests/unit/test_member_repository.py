@@ -0,0 +1,157 @@
+"""
+Unit tests for the member repository.
+"""
+
+import pytest
+
+from research_management.models.member import MemberRole, ProjectMemberCreate
+from research_management.repositories import MemberRepository
+from tests.fakes import FakeFirestore
+
+
+def _seed_member(db, project_id, user_id, role, left_at=None):
+    db.seed(
+        MemberRepository.COLLECTION,
+        f"{project_id}#{user_id}",
+        {
+            "project_id": project_id,
+            "user_id": user_id,
+            "role": role.value,
+            "joined_at": "2025-01-15T10:00:00",
+            "left_at": left_at,
+        },
+    )
+
+
+@pytest.fixture
+def db():
+    """Create an in-memory Firestore."""
+    return FakeFirestore()
+
+
+async def test_students_without_advisor_single_scan(db):
+    """Test unadvised students are found with one query."""
+    _seed_member(db, "proj-1", "student-1", MemberRole.STUDENT)
+    _seed_member(db, "proj-1", "student-2", MemberRole.STUDENT)
+    _seed_member(db, "proj-2", "student-3", MemberRole.STUDENT)
+    _seed_member(db, "proj-2", "advisor-1", MemberRole.ADVISOR)
+    _seed_member(db, "proj-3", "student-4", MemberRole.STUDENT)
+    _seed_member(db, "proj-3", "coadvisor-1", MemberRole.CO_ADVISOR)
+    _seed_member(db, "proj-4", "student-5", MemberRole.STUDENT)
+    _seed_member(
+        db, "proj-4", "advisor-2", MemberRole.ADVISOR, left_at="2025-02-01T00:00:00"
+    )
+
+    repo = MemberRepository(db=db)
+    result = await repo.get_students_without_advisor()
+
+    assert sorted(result) == ["student-1", "student-2", "student-5"]
+    assert db.reads == 1
+
+
+async def test_students_without_advisor_ignores_departed_students(db):
+    """Test students who left a project are not reported."""
+    _seed_member(
+        db, "proj-1", "student-1", MemberRole.STUDENT, left_at="2025-02-01T00:00:00"
+    )
+
+    repo = MemberRepository(db=db)
+
+    assert await repo.get_students_without_advisor() == []
+
+
+async def test_get_members_for_projects_chunks_in_queries(db):
+    """Test members of many projects are loaded in chunked queries."""
+    project_ids = [f"proj-{i}" for i in range(45)]
+    for project_id in project_ids:
+        _seed_member(db, project_id, f"student-{project_id}", MemberRole.STUDENT)
+    _seed_member(db, "proj-0", "advisor-1", MemberRole.ADVISOR)
+    _seed_member(db, "proj-1", "student-gone", MemberRole.STUDENT, left_at="2025-02-01")
+
+    repo = MemberRepository(db=db)
+    members = await repo.get_members_for_projects(project_ids + ["proj-empty"])
+
+    assert db.reads == 2
+    assert len(members) == 46
+    assert {m.user_id for m in members["proj-0"]} == {"student-proj-0", "advisor-1"}
+    assert [m.user_id for m in members["proj-1"]] == ["student-proj-1"]
+    assert members["proj-empty"] == []
+
+
+async def test_get_members_for_projects_role_filter(db):
+    """Test the role filter applies to bulk member loading."""
+    _seed_member(db, "proj-1", "student-1", MemberRole.STUDENT)
+    _seed_member(db, "proj-1", "advisor-1", MemberRole.ADVISOR)
+
+    repo = MemberRepository(db=db)
+    members = await repo.get_members_for_projects(["proj-1"], role=MemberRole.ADVISOR)
+
+    assert [m.user_id for m in members["proj-1"]] == ["advisor-1"]
+
+
+async def test_get_members_cached_until_membership_changes(db):
+    """Test member lists are cached and invalidated by add/remove."""
+    _seed_member(db, "proj-1", "student-1", MemberRole.STUDENT)
+    repo = MemberRepository(db=db)
+
+    await repo.get_members("proj-1")
+    assert [m.user_id for m in await repo.get_members("proj-1")] == ["student-1"]
+    assert repo.cache.stats()["hits"] == 1
+
+    await repo.add_member(
+        "proj-1", ProjectMemberCreate(user_id="advisor-1", role=MemberRole.ADVISOR)
+    )
+    advisors = await repo.get_members("proj-1", role=MemberRole.ADVISOR)
+    assert [m.user_id for m in advisors] == ["advisor-1"]
+
+    await repo.remove_member("proj-1", "advisor-1")
+    assert await repo.get_members("proj-1", role=MemberRole.ADVISOR) == []
+
+
+async def test_projects_by_user_reads_index_document(db):
+    """Test a user's projects resolve from one index document read."""
+    repo = MemberRepository(db=db)
+    for project_id in ("proj-2", "proj-1"):
+        await repo.add_member(
+            project_id,
+            ProjectMemberCreate(user_id="student-1", role=MemberRole.STUDENT),
+        )
+    await repo.add_member(
+        "proj-3", ProjectMemberCreate(user_id="student-1", role=MemberRole.ADVISOR)
+    )
+    await repo.remove_member("proj-2", "student-1")
+    await repo.rebuild_user_index()
+    db.reads = 0
+
+    students = await repo.get_projects_by_user("student-1", role=MemberRole.STUDENT)
+
+    assert students == ["proj-1"]
+    assert await repo.get_projects_by_user("student-1") == ["proj-1", "proj-3"]
+    assert db.reads == 2
+
+
+async def test_rebuild_user_index_backfills_legacy_memberships(db):
+    """Test the backfill indexes memberships written before the index."""
+    _seed_member(db, "proj-1", "student-1", MemberRole.STUDENT)
+    _seed_member(db, "proj-2", "student-1", MemberRole.STUDENT, left_at="2025-02-01")
+    repo = MemberRepository(db=db)
+
+    assert await repo.get_projects_by_user("student-1") == ["proj-1"]
+
+    # A membership added before the backfill does not hide the legacy ones
+    await repo.add_member(
+        "proj-3", ProjectMemberCreate(user_id="student-1", role=MemberRole.STUDENT)
+    )
+    reader = MemberRepository(db=db)
+    assert sorted(await reader.get_projects_by_user("student-1")) == [
+        "proj-1",
+        "proj-3",
+    ]
+
+    assert await repo.rebuild_user_index() == 1
+    assert db.document_data(MemberRepository.USER_INDEX_COLLECTION, "student-1") == {
+        "projects": {"proj-1": "student", "proj-3": "student"}
+    }
+    db.reads = 0
+    assert await reader.get_projects_by_user("student-1") == ["proj-1", "proj-3"]
+    assert db.reads == 1
@@ -0,0 +1,83 @@
+"""
+Unit tests for the startup data migrations.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from research_management.repositories import (
+    AlertRepository,
+    MemberRepository,
+    ProjectRepository,
+    SchedulerRepository,
+    UpdateRepository,
+)
+from research_management.services import MigrationService
+from tests.fakes import FakeFirestore
+
+
+async def test_migrations_run_once():
+    """Test completed migrations are skipped on later startups."""
+    db = FakeFirestore()
+    db.seed(ProjectRepository.COLLECTION, "proj-1", {"project_id": "proj-1"})
+    service = _service(db)
+
+    first = await service.run_pending()
+    second = await service.run_pending()
+
+    assert first == {
+        "alert_open_keys": 0,
+        "project_update_stamps": 1,
+        "user_project_index": 0,
+        "project_date_strings": 0,
+    }
+    assert second == {}
+    assert db.document_data(ProjectRepository.COLLECTION, "proj-1") == {
+        "project_id": "proj-1",
+        "last_update_at": None,
+        "update_count": 0,
+    }
+
+
+async def test_migrations_wait_for_the_lease():
+    """Test only the instance holding the lease migrates."""
+    db = FakeFirestore()
+    scheduler_repo = SchedulerRepository(db=db)
+    await scheduler_repo.acquire_lease(
+        MigrationService.JOB, "other", timedelta(minutes=5)
+    )
+    service = _service(db, scheduler_repo)
+
+    assert await service.run_pending() is None
+
+
+async def test_timestamp_dates_become_range_queryable():
+    """Test legacy timestamp dates are rewritten and found by deadline queries."""
+    db = FakeFirestore()
+    due = datetime(2025, 6, 4, 12, tzinfo=timezone.utc)
+    db.seed(
+        ProjectRepository.COLLECTION,
+        "proj-1",
+        {
+            "project_id": "proj-1",
+            "created_at": "2025-01-01T00:00:00",
+            "expected_end_date": due,
+        },
+    )
+    projects = ProjectRepository(db=db)
+
+    assert await projects.normalize_dates() == 1
+    assert await projects.normalize_dates() == 0
+    start, end = datetime(2025, 6, 1), datetime(2025, 6, 8)
+    assert await projects.list_due_between(start, end) == {
+        "proj-1": datetime(2025, 6, 4, 12)
+    }
+
+
+def _service(db, scheduler_repo=None):
+    return MigrationService(
+        scheduler_repo=scheduler_repo or SchedulerRepository(db=db),
+        alert_repo=AlertRepository(db=db),
+        update_repo=UpdateRepository(db=db),
+        member_repo=MemberRepository(db=db),
+        project_repo=ProjectRepository(db=db),
+    )
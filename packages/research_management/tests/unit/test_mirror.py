@@ -0,0 +1,210 @@
+"""
+Unit tests for the snapshot-listener mirror.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from research_management.models.member import MemberRole
+from research_management.models.project import ProjectStatus
+from research_management.repositories import (
+    AggregateRepository,
+    AlertRepository,
+    MemberRepository,
+    ProjectRepository,
+    ResearchMirror,
+    SnapshotRepository,
+)
+from research_management.services import DashboardService
+from tests.fakes import FakeFirestore
+
+
+def _change(kind, doc_id, data=None):
+    return SimpleNamespace(
+        type=SimpleNamespace(name=kind),
+        document=SimpleNamespace(id=doc_id, to_dict=lambda: data),
+    )
+
+
+def _project(project_id, status="active"):
+    return {
+        "project_id": project_id,
+        "title": project_id,
+        "description": "Test project",
+        "area": "CS",
+        "status": status,
+        "health_status": "on_track",
+    }
+
+
+def _member(project_id, user_id, role):
+    return {"project_id": project_id, "user_id": user_id, "role": role.value}
+
+
+@pytest.fixture
+def mirror():
+    """Create a mirror fed with one snapshot per collection."""
+    mirror = ResearchMirror()
+    mirror.projects.on_snapshot(
+        None,
+        [
+            _change("ADDED", "proj-1", _project("proj-1")),
+            _change("ADDED", "proj-2", _project("proj-2", status="proposal")),
+        ],
+        None,
+    )
+    mirror.members.on_snapshot(
+        None,
+        [
+            _change(
+                "ADDED",
+                "proj-1#advisor-1",
+                _member("proj-1", "advisor-1", MemberRole.ADVISOR),
+            ),
+            _change(
+                "ADDED",
+                "proj-1#student-1",
+                _member("proj-1", "student-1", MemberRole.STUDENT),
+            ),
+            _change(
+                "ADDED",
+                "proj-2#student-2",
+                _member("proj-2", "student-2", MemberRole.STUDENT),
+            ),
+        ],
+        None,
+    )
+    mirror.alerts.on_snapshot(
+        None,
+        [
+            _change(
+                "ADDED",
+                "alert-1",
+                {
+                    "alert_id": "alert-1",
+                    "type": "no_update",
+                    "project_id": "proj-1",
+                    "message": "No updates",
+                    "severity": "warning",
+                },
+            )
+        ],
+        None,
+    )
+    return mirror
+
+
+def test_mirror_ready_after_first_snapshots():
+    """Test the mirror is only ready once every listener reported."""
+    mirror = ResearchMirror()
+    mirror.projects.on_snapshot(None, [], None)
+    mirror.members.on_snapshot(None, [], None)
+    assert not mirror.ready
+
+    mirror.alerts.on_snapshot(None, [], None)
+    assert mirror.ready
+
+
+def test_mirror_applies_changes_to_indexes(mirror):
+    """Test modified and removed documents move between index entries."""
+    mirror.projects.on_snapshot(
+        None,
+        [
+            _change("MODIFIED", "proj-2", _project("proj-2")),
+            _change("REMOVED", "proj-1"),
+        ],
+        None,
+    )
+
+    assert [p.project_id for p in mirror.projects.find("status", "active")] == [
+        "proj-2"
+    ]
+    assert mirror.projects.find("status", "proposal") == []
+    assert mirror.projects.get("proj-1") is None
+
+
+async def test_repositories_read_from_mirror(mirror):
+    """Test dashboards are served from the mirror without any RPC."""
+    db = FakeFirestore()
+    service = DashboardService(
+        project_repo=ProjectRepository(db=db, mirror=mirror),
+        member_repo=MemberRepository(db=db, mirror=mirror),
+        alert_repo=AlertRepository(db=db, mirror=mirror),
+        aggregate_repo=AggregateRepository(db=db),
+        snapshot_repo=SnapshotRepository(db=db),
+    )
+
+    advisor = await service.get_advisor_dashboard("advisor-1")
+    student = await service.get_student_dashboard("student-1")
+    unadvised = await service.member_repo.get_students_without_advisor()
+    active = await service.project_repo.list_ids(status=ProjectStatus.ACTIVE)
+
+    assert advisor["total_students"] == 1
+    assert advisor["active_alerts"] == 1
+    assert student["has_advisor"] is True
+    assert unadvised == ["student-2"]
+    assert active == ["proj-1"]
+    assert db.reads == 0
+
+
+async def test_mirror_pages_share_cursor_format(mirror):
+    """Test in-memory pages continue where the previous page stopped."""
+    repo = ProjectRepository(db=FakeFirestore(), mirror=mirror)
+
+    first = await repo.list(limit=1)
+    second = await repo.list(limit=1, cursor=first.next_cursor)
+
+    assert [p.project_id for p in first.items + second.items] == ["proj-1", "proj-2"]
+    assert second.next_cursor is None
+
+
+class _Watch:
+    """Stand-in for a snapshot listener handle."""
+
+    def __init__(self):
+        self.is_active = True
+
+    def unsubscribe(self):
+        self.is_active = False
+
+
+async def test_stopped_listener_falls_back_to_firestore(mirror):
+    """Test reads leave the mirror while a replaced listener catches up."""
+    db = FakeFirestore()
+    db.seed(ProjectRepository.COLLECTION, "proj-9", _project("proj-9"))
+    repo = ProjectRepository(db=db, mirror=mirror)
+    listeners = []
+
+    def _listen(name):
+        listeners.append(name)
+        return _Watch()
+
+    mirror._listen = _listen
+    mirror.start()
+    watch = mirror._watches["projects"]
+    watch.is_active = False
+
+    assert await repo.list_ids(status=ProjectStatus.ACTIVE) == ["proj-9"]
+    assert db.reads > 0
+    stats = mirror.stats()
+    assert stats["projects"]["error"] == "listener stopped"
+    assert stats["projects"]["ready"] is False
+    assert stats["restarts"] == 1
+    assert listeners == ["projects", "members", "alerts", "projects"]
+
+    # The new listener's first snapshot makes the mirror usable again
+    mirror.projects.on_snapshot(
+        None, [_change("ADDED", "proj-1", _project("proj-1"))], None
+    )
+    db.reads = 0
+    assert await repo.list_ids(status=ProjectStatus.ACTIVE) == ["proj-1"]
+    assert db.reads == 0
+
+
+def test_failed_snapshot_stops_mirror_reads(mirror):
+    """Test a snapshot that cannot be applied takes the replica offline."""
+    mirror.alerts.on_snapshot(None, [None], None)
+
+    assert mirror.check() is False
+    assert mirror.alerts.stats()["error"].startswith("AttributeError")
@@ -0,0 +1,178 @@
+"""
+Unit tests for the project repository.
+"""
+
+import pytest
+
+from research_management.models.project import (
+    ProjectCreate,
+    ProjectStatus,
+    ProjectUpdate,
+)
+from research_management.models.update import ProjectUpdateCreate
+from research_management.repositories import ProjectRepository, UpdateRepository
+from tests.fakes import FakeFirestore
+
+
+@pytest.fixture
+def db():
+    """Create an in-memory Firestore."""
+    return FakeFirestore()
+
+
+@pytest.fixture
+def repo(db):
+    """Create a project repository backed by the fake."""
+    return ProjectRepository(db=db)
+
+
+async def _create(repo, title):
+    return await repo.create(
+        ProjectCreate(title=title, description="Test project", area="CS")
+    )
+
+
+async def test_get_many_preserves_input_order(db, repo):
+    """Test get_many returns projects in the requested order."""
+    first = await _create(repo, "First")
+    second = await _create(repo, "Second")
+    third = await _create(repo, "Third")
+    db.reads = 0
+
+    projects = await repo.get_many(
+        [third.project_id, "proj-missing", first.project_id, second.project_id]
+    )
+
+    assert [p.title for p in projects] == ["Third", "First", "Second"]
+    assert db.reads == 1
+
+
+async def test_get_many_empty(db, repo):
+    """Test get_many with no IDs does not hit Firestore."""
+    assert await repo.get_many([]) == []
+    assert db.reads == 0
+
+
+async def test_list_pages_with_cursor(repo):
+    """Test listing walks every project exactly once across pages."""
+    created = [await _create(repo, f"Project {i}") for i in range(5)]
+
+    seen = []
+    cursor = None
+    while True:
+        page = await repo.list(limit=2, cursor=cursor)
+        seen.extend(p.project_id for p in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert seen == sorted(p.project_id for p in created)
+
+
+async def test_list_rejects_foreign_cursor(db, repo):
+    """Test a cursor from a differently ordered listing is rejected."""
+    project = await _create(repo, "First")
+    updates = UpdateRepository(db=db)
+    for i in range(3):
+        await updates.create(
+            project.project_id, "user-1", ProjectUpdateCreate(content=f"Update {i}")
+        )
+    page = await updates.get_by_project(project.project_id, limit=1)
+
+    with pytest.raises(ValueError):
+        await repo.list(cursor=page.next_cursor)
+
+
+async def test_update_returns_merged_project_without_reread(db, repo):
+    """Test update reads the project once and returns the merged result."""
+    project = await _create(repo, "First")
+    db.reads = 0
+
+    updated = await repo.update(
+        project.project_id, ProjectUpdate(status=ProjectStatus.ACTIVE)
+    )
+
+    # The project, and its members as it becomes active; no re-read
+    assert db.reads == 2
+    assert updated.status == ProjectStatus.ACTIVE
+    assert updated.title == "First"
+    assert updated == await repo.get(project.project_id)
+
+
+async def test_update_missing_project(repo):
+    """Test updating an unknown project returns None."""
+    assert await repo.update("proj-missing", ProjectUpdate(title="New")) is None
+
+
+async def test_get_reads_through_cache(db, repo):
+    """Test repeated gets are served from the cache until a write."""
+    project = await _create(repo, "First")
+    repo.cache.clear()
+    db.reads = 0
+
+    await repo.get(project.project_id)
+    await repo.get(project.project_id)
+    assert db.reads == 1
+
+    await repo.update(project.project_id, ProjectUpdate(title="Renamed"))
+    db.reads = 0
+    assert (await repo.get(project.project_id)).title == "Renamed"
+    assert db.reads == 0
+
+
+async def test_update_submission_invalidates_cached_project(db, repo):
+    """Test submitting an update refreshes the cached project stamp."""
+    project = await _create(repo, "First")
+    await repo.get(project.project_id)
+
+    await UpdateRepository(db=db).create(
+        project.project_id, "user-1", ProjectUpdateCreate(content="Progress")
+    )
+
+    assert (await repo.get(project.project_id)).update_count == 1
+
+
+async def test_get_many_reads_only_uncached(db, repo):
+    """Test get_many only fetches projects missing from the cache."""
+    first = await _create(repo, "First")
+    second = await _create(repo, "Second")
+    repo.cache.invalidate(second.project_id)
+    db.reads = 0
+
+    projects = await repo.get_many([first.project_id, second.project_id])
+
+    assert [p.title for p in projects] == ["First", "Second"]
+    assert db.reads == 1
+    assert repo.cache.stats()["hits"] >= 1
+
+
+async def test_list_summaries_fetches_summary_fields(repo):
+    """Test summaries are built from projected documents."""
+    await _create(repo, "First")
+
+    page = await repo.list_summaries()
+
+    assert [s.title for s in page.items] == ["First"]
+    assert not hasattr(page.items[0], "description")
+
+
+async def test_list_fields_returns_sparse_documents(repo):
+    """Test sparse listings only carry the requested fields."""
+    project = await _create(repo, "First")
+
+    page = await repo.list_fields(["status"])
+
+    assert page.items == [{"project_id": project.project_id, "status": "proposal"}]
+
+
+async def test_get_summaries_projects_uncached(db, repo):
+    """Test summaries of uncached projects come from one projected read."""
+    first = await _create(repo, "First")
+    second = await _create(repo, "Second")
+    repo.cache.clear()
+    db.reads = 0
+
+    summaries = await repo.get_summaries([second.project_id, first.project_id])
+
+    assert [s.title for s in summaries] == ["Second", "First"]
+    assert db.reads == 1
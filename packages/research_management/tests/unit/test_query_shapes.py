@@ -0,0 +1,96 @@
+"""
+Unit tests for query shape recording and the index advisor.
+"""
+
+import json
+
+from research_management.index_advisor import main as advisor
+from research_management.models.project import ProjectStatus
+from research_management.repositories import ProjectRepository, UpdateRepository
+from research_management.repositories.query_shapes import (
+    QueryShape,
+    QueryShapeRecorder,
+    RecordingClient,
+    load_shapes,
+)
+from tests.fakes import FakeFirestore
+
+UPDATES_INDEX = {
+    "collectionGroup": "project_updates",
+    "queryScope": "COLLECTION",
+    "fields": [
+        {"fieldPath": "project_id", "order": "ASCENDING"},
+        {"fieldPath": "timestamp", "order": "DESCENDING"},
+    ],
+}
+
+
+async def test_repository_queries_are_recorded(tmp_path):
+    """Test executed queries are recorded once per shape, without values."""
+    path = tmp_path / "shapes.jsonl"
+    db = RecordingClient(FakeFirestore(), QueryShapeRecorder(path))
+    projects = ProjectRepository(db=db)
+
+    await projects.list(status=ProjectStatus.ACTIVE, area="CS")
+    await projects.list(status=ProjectStatus.PAUSED, area="ML")
+    await UpdateRepository(db=db).get_by_project("proj-1")
+
+    assert load_shapes([path]) == [
+        QueryShape(
+            collection="project_updates",
+            filters=(("project_id", "=="),),
+            order_by=(("timestamp", "DESCENDING"), ("__name__", "DESCENDING")),
+        ),
+        QueryShape(
+            collection="research_projects",
+            filters=(("area", "=="), ("status", "==")),
+            order_by=(("__name__", "ASCENDING"),),
+        ),
+    ]
+
+
+def test_composite_index_derivation():
+    """Test which shapes need a composite index and its field order."""
+    single = QueryShape(collection="alerts", filters=(("status", "=="),))
+    merged = QueryShape(
+        collection="research_projects",
+        filters=(("area", "=="), ("status", "==")),
+        order_by=(("__name__", "ASCENDING"),),
+    )
+    ranged = QueryShape(
+        collection="research_projects",
+        filters=(("last_update_at", "<"), ("status", "==")),
+    )
+    timeline = QueryShape(
+        collection="project_updates",
+        filters=(("project_id", "=="),),
+        order_by=(("timestamp", "DESCENDING"), ("__name__", "DESCENDING")),
+    )
+
+    assert single.composite_index() is None
+    assert merged.composite_index() is None
+    assert [f["fieldPath"] for f in ranged.composite_index()["fields"]] == [
+        "status",
+        "last_update_at",
+    ]
+    assert timeline.composite_index() == UPDATES_INDEX
+
+
+def test_advisor_emits_and_checks_manifest(tmp_path, capsys):
+    """Test the advisor fails a manifest missing an index until it is emitted."""
+    shapes = tmp_path / "shapes.jsonl"
+    QueryShapeRecorder(shapes).record(
+        QueryShape(
+            collection="project_updates",
+            filters=(("project_id", "=="),),
+            order_by=(("timestamp", "DESCENDING"),),
+        )
+    )
+    manifest = tmp_path / "firestore.indexes.json"
+    manifest.write_text(json.dumps({"indexes": [], "fieldOverrides": []}))
+
+    assert advisor(["check", str(shapes), "--manifest", str(manifest)]) == 1
+    assert advisor(["emit", str(shapes), "--manifest", str(manifest), "--write"]) == 0
+    assert advisor(["check", str(shapes), "--manifest", str(manifest)]) == 0
+    assert json.loads(manifest.read_text())["indexes"] == [UPDATES_INDEX]
+    capsys.readouterr()
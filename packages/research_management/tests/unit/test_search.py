@@ -0,0 +1,149 @@
+"""
+Unit tests for the full-text search index.
+"""
+
+from research_management.models.project import ProjectCreate
+from research_management.models.update import ProjectUpdateCreate
+from research_management.repositories import (
+    ProjectRepository,
+    SearchIndex,
+    SearchRepository,
+    UpdateRepository,
+)
+from research_management.repositories.search_index import tokenize
+from tests.fakes import FakeFirestore
+
+
+def test_tokenize_folds_accents_and_drops_stopwords():
+    """Test Portuguese text is folded into plain terms."""
+    assert tokenize("Avaliação de Políticas PÚBLICAS") == [
+        "avaliacao",
+        "politicas",
+        "publicas",
+    ]
+
+
+def test_bm25_ranks_title_matches_first():
+    """Test weighted BM25 ranking and incremental removal."""
+    index = SearchIndex()
+    index.set_project("p1", "Visão computacional", "Detecção de objetos", "IA")
+    index.set_project("p2", "Robótica", "Visão para robôs móveis", "Engenharia")
+    index.set_project("p3", "Economia", "Mercado de trabalho", "Economia")
+    index.add_update("p3", "u1", "Testes com visao estereo")
+
+    assert [p for p, _ in index.search("visão")] == ["p1", "p2", "p3"]
+    assert index.search("visao")[0][1] == index.search("VISÃO")[0][1]
+    assert index.search("nada") == []
+
+    index.remove_project("p1")
+    assert [p for p, _ in index.search("visao")] == ["p2", "p3"]
+
+
+def test_index_without_terms_matches_nothing():
+    """Test projects made only of stopwords neither match nor break scoring."""
+    index = SearchIndex()
+    index.set_project("p1", "A", "", "")
+
+    assert index.search("anything") == []
+
+
+def test_removed_project_drops_its_updates():
+    """Test removing a project releases the text of its updates."""
+    index = SearchIndex()
+    index.set_project("p1", "Genética", "Herança", "Biologia")
+    index.add_update("p1", "u1", "Sequenciamento concluído")
+
+    index.remove_project("p1")
+
+    assert index._updates.get("p1") is None
+    assert index.search("sequenciamento") == []
+
+
+def test_writes_during_rebuild_are_replayed():
+    """Test a rebuild read before a write does not drop the write."""
+    index = SearchIndex()
+    index.begin_rebuild()
+    index.set_project("p2", "Genômica", "Sequenciamento", "Biologia")
+
+    index.replace([("p1", "Genética", "Herança", "Biologia")], [])
+
+    assert sorted(p for p, _ in index.search("biologia")) == ["p1", "p2"]
+
+
+async def test_repository_builds_once_then_follows_writes():
+    """Test the first search reads the collections and later writes index."""
+    db = FakeFirestore()
+    projects = ProjectRepository(db=db, search_index=SearchIndex())
+    first = await projects.create(
+        ProjectCreate(title="Aprendizado de máquina", description="Redes", area="IA")
+    )
+    archived = await projects.create(
+        ProjectCreate(title="Máquina antiga", description="Legado", area="IA")
+    )
+    await projects.delete(archived.project_id)
+    await UpdateRepository(db=db).create(
+        first.project_id, "user-1", ProjectUpdateCreate(content="Treino concluído")
+    )
+    search = SearchRepository(db=db, index=SearchIndex())
+
+    assert [p for p, _ in await search.search("maquina")] == [first.project_id]
+    assert [p for p, _ in await search.search("treino")] == [first.project_id]
+
+    second = ProjectRepository(db=db, search_index=search.index)
+    created = await second.create(
+        ProjectCreate(title="Máquina de estados", description="Autômatos", area="CS")
+    )
+    db.reads = 0
+
+    results = await search.search("maquina")
+
+    assert db.reads == 0
+    assert {p for p, _ in results} == {first.project_id, created.project_id}
+
+
+async def test_refresh_only_reads_changes_since_last_build():
+    """Test writes from another instance are caught up without a full scan."""
+    db = FakeFirestore()
+    projects = ProjectRepository(db=db, search_index=SearchIndex())
+    kept = await projects.create(
+        ProjectCreate(title="Visão computacional", description="Objetos", area="IA")
+    )
+    dropped = await projects.create(
+        ProjectCreate(title="Visão estéreo", description="Câmeras", area="IA")
+    )
+    others = [
+        await projects.create(
+            ProjectCreate(title=f"Economia {i}", description="Mercado", area="Eco")
+        )
+        for i in range(5)
+    ]
+    for project in (kept, dropped, *others):
+        db.seed(
+            ProjectRepository.COLLECTION,
+            project.project_id,
+            {
+                **db.document_data(ProjectRepository.COLLECTION, project.project_id),
+                "updated_at": "2020-01-01T00:00:00",
+            },
+        )
+    search = SearchRepository(db=db, index=SearchIndex())
+    await search.search("visao")
+
+    # Another instance writes to a separate index
+    created = await projects.create(
+        ProjectCreate(title="Visão noturna", description="Infravermelho", area="IA")
+    )
+    await projects.delete(dropped.project_id)
+    await UpdateRepository(db=db).create(
+        kept.project_id, "user-1", ProjectUpdateCreate(content="Segmentação pronta")
+    )
+    db.reads = 0
+
+    # One query per collection, returning only the three changed documents
+    assert await search.refresh() == 3
+    assert db.reads == 2
+    assert {p for p, _ in await search.search("visao")} == {
+        kept.project_id,
+        created.project_id,
+    }
+    assert [p for p, _ in await search.search("segmentacao")] == [kept.project_id]
@@ -0,0 +1,92 @@
+"""
+Unit tests for the update repository.
+"""
+
+import pytest
+
+from research_management.models.project import ProjectCreate
+from research_management.models.update import ProjectUpdateCreate
+from research_management.repositories import ProjectRepository, UpdateRepository
+from tests.fakes import FakeFirestore
+
+
+@pytest.fixture
+def db():
+    """Create an in-memory Firestore."""
+    return FakeFirestore()
+
+
+@pytest.fixture
+def repo(db):
+    """Create an update repository backed by the fake."""
+    return UpdateRepository(db=db)
+
+
+@pytest.fixture
+def projects(db):
+    """Create a project repository sharing the fake."""
+    return ProjectRepository(db=db)
+
+
+async def _create_project(projects, title="First"):
+    return await projects.create(
+        ProjectCreate(title=title, description="Test project", area="CS")
+    )
+
+
+async def test_get_by_project_pages_newest_first(repo, projects):
+    """Test updates are paged newest first without gaps or repeats."""
+    project = await _create_project(projects)
+    other = await _create_project(projects, "Other")
+    for i in range(5):
+        await repo.create(
+            project.project_id, "user-1", ProjectUpdateCreate(content=f"Update {i}")
+        )
+    await repo.create(other.project_id, "user-1", ProjectUpdateCreate(content="Other"))
+
+    first = await repo.get_by_project(project.project_id, limit=3)
+    second = await repo.get_by_project(
+        project.project_id, limit=3, cursor=first.next_cursor
+    )
+
+    contents = [u.content for u in first.items + second.items]
+    assert contents == [f"Update {i}" for i in reversed(range(5))]
+    assert second.next_cursor is None
+
+
+async def test_create_stamps_project(db, repo, projects):
+    """Test each update stamps the project in the same commit."""
+    project = await _create_project(projects)
+    db.writes = 0
+
+    await repo.create(project.project_id, "user-1", ProjectUpdateCreate(content="A"))
+    latest = await repo.create(
+        project.project_id, "user-1", ProjectUpdateCreate(content="B")
+    )
+
+    stored = await projects.get(project.project_id)
+    assert db.writes == 2
+    assert stored.last_update_at == latest.timestamp
+    assert stored.update_count == 2
+
+
+async def test_backfill_project_stamps(db, repo, projects):
+    """Test legacy projects get their stamp from existing updates."""
+    db.seed(ProjectRepository.COLLECTION, "proj-legacy", {"project_id": "proj-legacy"})
+    db.seed(
+        UpdateRepository.COLLECTION,
+        "upd-1",
+        {"project_id": "proj-legacy", "timestamp": "2025-01-10T10:00:00"},
+    )
+    db.seed(
+        UpdateRepository.COLLECTION,
+        "upd-2",
+        {"project_id": "proj-legacy", "timestamp": "2025-02-01T10:00:00"},
+    )
+    await _create_project(projects)
+
+    assert await repo.backfill_project_stamps() == 1
+
+    stored = db.document_data(ProjectRepository.COLLECTION, "proj-legacy")
+    assert stored["last_update_at"] == "2025-02-01T10:00:00"
+    assert stored["update_count"] == 2
@@ -2,14 +2,18 @@
 Unit tests for utility functions.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
 from research_management.utils import (
     calculate_days_since,
+    compute_etag,
+    decode_cursor,
+    encode_cursor,
     generate_id,
     get_current_timestamp,
+    to_stored_datetime,
 )
 
 
@@ -57,3 +61,36 @@ def test_calculate_days_since():
     # Test with None
     days = calculate_days_since(None)
     assert days == 0
+
+
+def test_to_stored_datetime_converts_to_naive_utc():
+    """Test aware datetimes are stored like naive UTC ones."""
+    aware = datetime(2025, 6, 1, 12, tzinfo=timezone(timedelta(hours=-3)))
+
+    assert to_stored_datetime(aware) == "2025-06-01T15:00:00"
+    assert to_stored_datetime(datetime(2025, 6, 1)) == "2025-06-01T00:00:00"
+
+
+def test_cursor_round_trip():
+    """Test cursors decode to the values they were built from."""
+    timestamp = datetime(2025, 1, 15, 10, 30)
+    cursor = encode_cursor([timestamp, "upd-1234"])
+
+    assert decode_cursor(cursor) == [timestamp, "upd-1234"]
+
+
+def test_decode_cursor_rejects_garbage():
+    """Test malformed cursors raise ValueError."""
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_compute_etag_is_stable_and_quoted():
+    """Test entity tags depend only on the versioning values."""
+    stamp = datetime(2025, 1, 1, 12, 0)
+
+    etag = compute_etag("proj-1", stamp, 3)
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == compute_etag("proj-1", stamp, 3)
+    assert etag != compute_etag("proj-1", stamp, 4)
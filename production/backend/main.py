@@ -19,6 +19,7 @@ from content_reviewer_agent.api.routes import router as content_review_router
 from mock_approval_api import router as mock_approval_router
 
 # Import Firebase initialization
+from research_management.api.dependencies import close_services, init_services
 from research_management.firebase_admin import initialize_firebase
 from research_management.config import get_settings
 
@@ -49,6 +50,7 @@ async def startup_event():
     """Initialize services on startup."""
     # Initialize Firebase (shared across services)
     initialize_firebase()
+    await init_services(app)
     print("=" * 60)
     print("FIAP AI-Enhanced Learning Platform - Unified Backend")
     print("=" * 60)
@@ -63,6 +65,12 @@ async def startup_event():
     print("=" * 60)
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release service resources on shutdown."""
+    await close_services(app)
+
+
 @app.get("/")
 def root():
     """Root endpoint - API information."""